@@ -1,12 +1,328 @@
 """Command-line interface for IssueDB."""
 
 import argparse
+import atexit
+import codecs
+import contextlib
+import functools
 import json
+import mmap
+import os
 import sys
-from typing import Any, Optional
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Optional, TextIO, Union, cast
 
-from issuedb.models import AuditLog, Comment, Issue, Priority, Status
-from issuedb.repository import IssueRepository
+from issuedb.git_cli_integration import (
+    dispatch_git_command,
+    git_parser_names,
+    register_git_parsers,
+)
+from issuedb.models import AuditLog, CodeReference, Comment, Issue, Priority, Status
+
+# Rule printed between entries of audit log and comment listings.
+_SEPARATOR = "-" * 50
+
+# Rule framing the header of the issue context report.
+_CONTEXT_RULE = "=" * 60
+
+# LLM agent guide printed by --prompt and sent to Ollama by --ollama.
+_PROMPT_FILE = Path(__file__).parent / "data" / "agents" / "PROMPT.txt"
+
+
+def _describe_update(log: AuditLog) -> str:
+    """Describe an UPDATE audit entry for the issue context report."""
+    if log.field_name:
+        return f"{log.field_name} changed from '{log.old_value}' to '{log.new_value}'"
+    return "Issue updated"
+
+
+# Recent-activity wording in the issue context, by audit action. Actions
+# without an entry are left out of the report.
+_ACTIVITY_DESCRIPTIONS: dict[str, Callable[[AuditLog], str]] = {
+    "CREATE": lambda log: "Issue created",
+    "BULK_CREATE": lambda log: "Issue created",
+    "UPDATE": _describe_update,
+    "BULK_UPDATE": _describe_update,
+    "DELETE": lambda log: "Issue deleted",
+    "FETCH": lambda log: "Issue fetched via get-next",
+}
+
+
+def _hms(seconds: float) -> tuple[int, int, int]:
+    """Split a duration into whole hours, minutes and seconds.
+
+    Args:
+        seconds: Duration in seconds.
+
+    Returns:
+        Tuple of (hours, minutes, seconds).
+    """
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours, minutes, secs
+
+
+def _format_hm(seconds: float) -> str:
+    """Format a duration in seconds as "{hours}h {minutes}m"."""
+    hours, minutes, _ = _hms(seconds)
+    return f"{hours}h {minutes}m"
+
+
+# Whether JSON output is indented. main() switches to compact JSON when stdout
+# is not a terminal; pipes and agents gain nothing from the extra whitespace.
+_PRETTY_JSON = True
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson() -> Any:
+    """Import orjson on first use.
+
+    orjson is an optional speedup. Importing it also loads uuid, zoneinfo
+    and platform, which commands printing text never need.
+
+    Returns:
+        The orjson module, or None if it is not installed.
+    """
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - orjson is an optional speedup
+        return None
+    return orjson
+
+
+def _orjson_dumps(data: Any) -> Optional[bytes]:
+    """Serialize data with orjson, honouring the pretty/compact mode.
+
+    Dicts with non-string keys are retried with OPT_NON_STR_KEYS, which
+    stringifies them as the standard library does. That option slows down
+    every dict, so it is not used up front.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        UTF-8 encoded JSON, or None if orjson is not installed or cannot
+        serialize data (e.g. integers beyond 64 bits).
+    """
+    orjson = _orjson()
+    if orjson is None:
+        return None
+    option = orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        pass
+    try:
+        return orjson.dumps(data, option=option | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return None
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes for the json module the way orjson does natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(data: Any) -> str:
+    """Serialize data with the json module, formatted like orjson output."""
+    if _PRETTY_JSON:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data as JSON, indented by two spaces unless compact output is on.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise; both produce the same text.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        JSON string.
+    """
+    encoded = _orjson_dumps(data)
+    if encoded is not None:
+        return encoded.decode()
+    return _stdlib_dumps(data)
+
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialize data as UTF-8 encoded JSON, formatted like _dumps.
+
+    orjson produces bytes natively, so this skips the decode that _dumps
+    needs to return text.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    encoded = _orjson_dumps(data)
+    if encoded is not None:
+        return encoded
+    return _stdlib_dumps(data).encode()
+
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    """Tell whether an encoding name refers to UTF-8."""
+    if not encoding:
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _emit(result: str) -> None:
+    """Write a command result and a trailing newline to stdout.
+
+    On a UTF-8 stdout the text is encoded once and written to the binary
+    buffer, bypassing print() and the text layer. Nothing is flushed here;
+    main() flushes stdout once after the command has run.
+
+    Args:
+        result: Text to write.
+    """
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is not None and _is_utf8(out.encoding):
+        # Push out anything already written as text so the output stays in order.
+        out.flush()
+        # Two writes rather than one concatenation, which would copy the
+        # whole encoded result again just to append the newline.
+        buffer.write(result.encode())
+        buffer.write(b"\n")
+    else:
+        out.write(result)
+        out.write("\n")
+
+
+def _bytes_writer(out: TextIO) -> Callable[[bytes], Any]:
+    """Get a function writing UTF-8 encoded chunks to a text stream.
+
+    A UTF-8 stream backed by a binary buffer, such as sys.stdout, takes the
+    bytes as they are instead of having each chunk decoded only to be
+    encoded again. Pending text is flushed first so output stays in order.
+
+    Args:
+        out: Text stream to write to.
+
+    Returns:
+        Callable receiving UTF-8 encoded chunks.
+    """
+    buffer = getattr(out, "buffer", None)
+    if buffer is not None and _is_utf8(getattr(out, "encoding", None)):
+        out.flush()
+        return cast(Callable[[bytes], Any], buffer.write)
+    return lambda chunk: out.write(chunk.decode())
+
+
+def _write_json(data: Any, out: TextIO) -> None:
+    """Write data as JSON, formatted like _dumps, plus a newline to a stream.
+
+    The serialized bytes go straight to the stream's binary buffer when it
+    has one, instead of being decoded to text and encoded back.
+
+    Args:
+        data: JSON-serializable data.
+        out: Text stream to write to.
+    """
+    write = _bytes_writer(out)
+    write(_dumps_bytes(data))
+    write(b"\n")
+
+
+def _loads(text: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        text: JSON text, or UTF-8 encoded JSON bytes.
+
+    Returns:
+        Parsed data.
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON (orjson's error
+            type subclasses it).
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _load_json_input(source: Union[str, bytes, BinaryIO]) -> Any:
+    """Parse the input of a bulk command.
+
+    Text and bytes are parsed as one JSON document. A binary stream is read
+    as NDJSON, one JSON value per line, so the raw input is never held in
+    memory all at once, but only when its first non-blank line is a complete
+    JSON value other than an array and more lines follow. Anything else,
+    such as a JSON array or a pretty-printed object, is parsed as one
+    document.
+
+    Args:
+        source: JSON text, UTF-8 encoded JSON bytes, or a binary stream.
+
+    Returns:
+        Parsed data; a list of the records for NDJSON.
+
+    Raises:
+        json.JSONDecodeError: If the input, or a line of it, is not valid
+            JSON.
+    """
+    if isinstance(source, (str, bytes)):
+        return _loads(source)
+
+    first = source.readline()
+    while first and not first.strip():
+        first = source.readline()
+    if not first or first.lstrip().startswith(b"["):
+        return _load_json_document(source, first)
+    try:
+        value = _loads(first)
+    except json.JSONDecodeError:
+        return _load_json_document(source, first)
+    records = [_loads(line) for line in source if line.strip()]
+    if not records:
+        # A lone value is a document, not a one-record NDJSON stream
+        return value
+    return [value, *records]
+
+
+def _load_json_document(source: BinaryIO, first: bytes) -> Any:
+    """Parse the rest of a binary stream, from its first line on, as one JSON document.
+
+    Regular files are memory-mapped and handed to orjson as they are,
+    rather than copied into a bytes object first.
+
+    Args:
+        source: Binary stream positioned just after first.
+        first: First non-blank line, already read from source.
+
+    Returns:
+        Parsed data.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON.
+    """
+    orjson = _orjson()
+    if orjson is not None and first and source.seekable():
+        try:
+            start = source.tell() - len(first)
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            pass  # Not backed by a mappable file
+        else:
+            with mapped, memoryview(mapped) as view:
+                return orjson.loads(view[start:])
+    return _loads(first + source.read())
 
 
 class CLI:
@@ -18,7 +334,20 @@ class CLI:
         Args:
             db_path: Optional path to database file.
         """
+        # The repository, and sqlite3 with it, is imported on first use so
+        # that --prompt, --ollama, --help and git commands never load it.
+        from issuedb.repository import IssueRepository
+
         self.repo = IssueRepository(db_path)
+        # Git context per issue ID, and whether the working directory is a git
+        # repository at all (None until first checked). Both live as long as
+        # this CLI object, so repeated context lookups don't re-run git.
+        self._git_info_cache: dict[int, Optional[dict[str, Any]]] = {}
+        self._in_git_repo: Optional[bool] = None
+
+    def close(self) -> None:
+        """Release the database connection held by this handler."""
+        self.repo.db.close_connection()
 
     def format_output(self, data: Any, as_json: bool = False) -> str:
         """Format output for display.
@@ -30,27 +359,198 @@ class CLI:
         Returns:
             Formatted string output.
         """
+        # Lists come from the repository and are homogeneous, so checking the
+        # first element is enough; an empty list counts as an issue list.
+        is_issue_list = isinstance(data, list) and (not data or isinstance(data[0], Issue))
+
         if as_json:
             if isinstance(data, Issue):
-                return json.dumps(data.to_dict(), indent=2)
-            elif isinstance(data, list) and all(isinstance(i, Issue) for i in data):
-                return json.dumps([i.to_dict() for i in data], indent=2)
+                return _dumps(data.to_dict(iso_dates=False))
+            elif is_issue_list:
+                return _dumps([i.to_dict(iso_dates=False) for i in data])
             elif isinstance(data, dict):
-                return json.dumps(data, indent=2)
+                return _dumps(data)
             else:
-                return json.dumps(data, indent=2)
+                return _dumps(data)
         else:
             if isinstance(data, Issue):
                 return self._format_issue(data)
-            elif isinstance(data, list) and all(isinstance(i, Issue) for i in data):
+            elif is_issue_list:
                 if not data:
                     return "No issues found."
-                return "\n\n".join(self._format_issue(i) for i in data)
+                # Fetch every issue's code references with one query.
+                refs_map = self._get_code_references_map(data)
+                # One buffer for the whole listing; the empty entry between
+                # issues becomes the blank separator line after the join.
+                lines: list[str] = []
+                for index, issue in enumerate(data):
+                    if index:
+                        lines.append("")
+                    refs = refs_map.get(issue.id, []) if issue.id is not None else []
+                    self._append_issue_lines(issue, lines, refs)
+                return "\n".join(lines)
             elif isinstance(data, dict):
                 return self._format_dict(data)
             else:
                 return str(data)
 
+    def format_output_stream(self, data: Any, out: TextIO, as_json: bool = False) -> None:
+        """Write formatted output to a stream, followed by a newline.
+
+        Issue lists are written one issue at a time, so a large listing is
+        never held in memory as a single string. Other data is written as
+        produced by format_output.
+
+        Args:
+            data: Data to format (Issue, list of Issues, dict, etc).
+            out: Text stream to write to.
+            as_json: If True, output as JSON.
+        """
+        if not (isinstance(data, list) and data and isinstance(data[0], Issue)):
+            if as_json:
+                _write_json(data.to_dict(iso_dates=False) if isinstance(data, Issue) else data, out)
+                return
+            out.write(self.format_output(data, as_json))
+            out.write("\n")
+            return
+
+        if as_json:
+            self._write_json_issues(data, _bytes_writer(out))
+            return
+
+        refs_map = self._get_code_references_map(data)
+        for index, issue in enumerate(data):
+            if index:
+                out.write("\n\n")
+            lines: list[str] = []
+            refs = refs_map.get(issue.id, []) if issue.id is not None else []
+            self._append_issue_lines(issue, lines, refs)
+            out.write("\n".join(lines))
+        out.write("\n")
+
+    @staticmethod
+    def _write_json_issues(
+        issues: list[Issue],
+        write: Callable[[bytes], Any],
+        fields: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Write issues as a JSON array, one item at a time, plus a newline.
+
+        Args:
+            issues: Issues to serialize.
+            write: Callable receiving each UTF-8 encoded chunk.
+            fields: If given, write an object holding these fields followed by
+                the array as its "issues" member instead of a bare array.
+        """
+        # Match _dumps of the whole document: indented items get their lines
+        # shifted to their nesting level, compact items are joined with bare
+        # commas. The object form reuses the serialized fields minus their
+        # closing brace.
+        if _PRETTY_JSON:
+            if fields is None:
+                opening, indent, closing = b"[", b"\n  ", b"\n]"
+            else:
+                opening = _dumps_bytes(fields)[:-2] + b',\n  "issues": ['
+                indent, closing = b"\n    ", b"\n  ]"
+            if not issues:
+                closing = b"]"
+            write(opening)
+            for index, issue in enumerate(issues):
+                item = indent + _dumps_bytes(issue.to_dict(iso_dates=False)).replace(b"\n", indent)
+                write(b"," + item if index else item)
+            write(closing + (b"\n}\n" if fields is not None else b"\n"))
+        else:
+            if fields is None:
+                write(b"[")
+            else:
+                write(_dumps_bytes(fields)[:-1] + b',"issues":[')
+            for index, issue in enumerate(issues):
+                if index:
+                    write(b",")
+                write(_dumps_bytes(issue.to_dict(iso_dates=False)))
+            write(b"]}\n" if fields is not None else b"]\n")
+
+    def _format_bulk_json_output(
+        self,
+        message: str,
+        issues: list[Issue],
+        as_json: bool,
+        out: Optional[TextIO],
+    ) -> str:
+        """Format, or stream to out, the result of a JSON-driven bulk command.
+
+        Args:
+            message: Summary line.
+            issues: Issues the command created, updated or closed.
+            as_json: Output as JSON.
+            out: If given, stream the output to this text stream.
+
+        Returns:
+            Formatted output, or an empty string if it was written to out.
+        """
+        if out is not None and as_json:
+            fields = {"message": message, "count": len(issues)}
+            self._write_json_issues(issues, _bytes_writer(out), fields)
+            return ""
+
+        result = {
+            "message": message,
+            "count": len(issues),
+            "issues": [issue.to_dict() for issue in issues],
+        }
+        if out is not None:
+            out.write(self.format_output(result, as_json))
+            out.write("\n")
+            return ""
+        return self.format_output(result, as_json)
+
+    def _format_bulk_pattern_output(
+        self,
+        message: str,
+        issues: list[Issue],
+        as_json: bool,
+        out: Optional[TextIO],
+    ) -> str:
+        """Format, or stream to out, the result of a bulk pattern command.
+
+        Args:
+            message: Summary line.
+            issues: Issues the command matched.
+            as_json: Output as JSON.
+            out: If given, stream the output to this text stream.
+
+        Returns:
+            Formatted output, or an empty string if it was written to out.
+        """
+        if out is not None:
+            if as_json:
+                fields = {"count": len(issues), "message": message}
+                self._write_json_issues(issues, _bytes_writer(out), fields)
+            else:
+                out.write(_format_bulk_pattern_result(message, issues))
+                out.write("\n")
+            return ""
+
+        if as_json:
+            result = {
+                "count": len(issues),
+                "message": message,
+                "issues": [issue.to_dict() for issue in issues],
+            }
+            return _dumps(result)
+        return _format_bulk_pattern_result(message, issues)
+
+    def _get_code_references_map(self, issues: list[Issue]) -> dict[int, list[CodeReference]]:
+        """Fetch the code references of every issue in a listing with one query.
+
+        Args:
+            issues: Issues being listed.
+
+        Returns:
+            Dictionary mapping issue ID to its code references.
+        """
+        return self.repo.get_code_references_for_issues([i.id for i in issues if i.id is not None])
+
     def _format_issue(self, issue: Issue) -> str:
         """Format a single issue for display.
 
@@ -60,47 +560,61 @@ class CLI:
         Returns:
             Formatted string.
         """
-        lines = [
+        lines: list[str] = []
+        self._append_issue_lines(issue, lines)
+        return "\n".join(lines)
+
+    def _append_issue_lines(
+        self,
+        issue: Issue,
+        lines: list[str],
+        refs: Optional[list[CodeReference]] = None,
+    ) -> None:
+        """Append the display lines of an issue to a shared buffer.
+
+        Args:
+            issue: Issue to format.
+            lines: Buffer to append to; joined with newlines by the caller.
+            refs: Code references of the issue, if already fetched. Looked up
+                when omitted.
+        """
+        # Read the enum values via _value_ rather than the slower .value property.
+        lines += (
             f"ID: {issue.id}",
             f"Title: {issue.title}",
-            f"Status: {issue.status.value}",
-            f"Priority: {issue.priority.value}",
-        ]
+            f"Status: {issue.status._value_}",
+            f"Priority: {issue.priority._value_}",
+        )
 
         if issue.due_date:
-            lines.append(f"Due Date: {issue.due_date.strftime('%Y-%m-%d')}")
+            lines.append(f"Due Date: {issue.due_date.date().isoformat()}")
 
         if issue.tags:
-            tag_names = [t.name for t in issue.tags]
-            lines.append(f"Tags: {', '.join(tag_names)}")
+            lines.append(f"Tags: {', '.join(t.name for t in issue.tags)}")
 
         if issue.description:
             lines.append(f"Description: {issue.description}")
 
-        lines.extend(
-            [
-                f"Created: {issue.created_at.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Updated: {issue.updated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-            ]
+        lines += (
+            f"Created: {issue.created_at.isoformat(' ', 'seconds')}",
+            f"Updated: {issue.updated_at.isoformat(' ', 'seconds')}",
         )
 
         # Add code references if any
-        if issue.id is not None:
+        if refs is None and issue.id is not None:
             refs = self.repo.get_code_references(issue.id)
-            if refs:
-                lines.append("")
-                lines.append("Code References:")
-                for ref in refs:
-                    ref_str = f"  - {ref.file_path}"
-                    if ref.start_line and ref.end_line:
-                        ref_str += f":{ref.start_line}-{ref.end_line}"
-                    elif ref.start_line:
-                        ref_str += f":{ref.start_line}"
-                    if ref.note:
-                        ref_str += f" ({ref.note})"
-                    lines.append(ref_str)
-
-        return "\n".join(lines)
+        if refs:
+            lines.append("")
+            lines.append("Code References:")
+            for ref in refs:
+                ref_str = f"  - {ref.file_path}"
+                if ref.start_line and ref.end_line:
+                    ref_str += f":{ref.start_line}-{ref.end_line}"
+                elif ref.start_line:
+                    ref_str += f":{ref.start_line}"
+                if ref.note:
+                    ref_str += f" ({ref.note})"
+                lines.append(ref_str)
 
     def _format_dict(self, data: dict[str, Any]) -> str:
         """Format a dictionary for display.
@@ -143,17 +657,13 @@ class CLI:
         Returns:
             Formatted output.
         """
-        from datetime import datetime
-
-        from issuedb.similarity import find_similar_issues
-
         due_date_obj = None
         if due_date:
             try:
                 due_date_obj = datetime.fromisoformat(due_date)
             except ValueError:
                 if as_json:
-                    return json.dumps({"error": "Invalid date format"}, indent=2)
+                    return _dumps({"error": "Invalid date format"})
                 return "Error: Invalid date format (use YYYY-MM-DD)"
 
         issue = Issue(
@@ -171,38 +681,44 @@ class CLI:
             if description:
                 query_text = f"{title} {description}"
 
-            # Get all existing issues
-            all_issues = self.repo.get_all_issues()
-
-            # Find similar issues
-            similar_issues = find_similar_issues(query_text, all_issues, threshold=0.7)
+            from issuedb.similarity import find_similar_texts
+
+            # Compare against the ID, title and description of existing issues
+            # only; the warning needs nothing else
+            similar_issues = find_similar_texts(
+                query_text,
+                (
+                    ((issue_id, issue_title), issue_title, issue_desc)
+                    for issue_id, issue_title, issue_desc in self.repo.get_issue_texts()
+                ),
+                threshold=0.7,
+            )
 
             # If similar issues found and not forced, show warning
             if similar_issues and not force:
                 if as_json:
                     warnings = []
-                    for similar_issue, similarity in similar_issues[:3]:  # Show top 3
+                    for (similar_id, similar_title), similarity in similar_issues[:3]:  # Top 3
                         warnings.append(
                             {
-                                "id": similar_issue.id,
-                                "title": similar_issue.title,
+                                "id": similar_id,
+                                "title": similar_title,
                                 "similarity": round(similarity * 100, 1),
                             }
                         )
-                    return json.dumps(
+                    return _dumps(
                         {
                             "error": "Similar issues found",
                             "message": "Use --force to create anyway",
                             "similar_issues": warnings,
-                        },
-                        indent=2,
+                        }
                     )
                 else:
                     lines = ["Warning: Similar issues found:"]
-                    for similar_issue, similarity in similar_issues[:3]:  # Show top 3
+                    for (similar_id, similar_title), similarity in similar_issues[:3]:  # Top 3
                         lines.append(
-                            f"  - Issue #{similar_issue.id}: {similar_issue.title} "
-                            f"({round(similarity * 100, 1)}% similar)"
+                            f"  - Issue #{similar_id}: {similar_title} "
+                            f"({similarity * 100:.1f}% similar)"
                         )
                     lines.append("\nUse --force to create anyway")
                     return "\n".join(lines)
@@ -218,6 +734,7 @@ class CLI:
         due_date: Optional[str] = None,
         tag: Optional[str] = None,
         as_json: bool = False,
+        out: Optional[TextIO] = None,
     ) -> str:
         """List issues with filters.
 
@@ -228,13 +745,18 @@ class CLI:
             due_date: Filter by due date.
             tag: Filter by tag.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
         issues = self.repo.list_issues(
             status=status, priority=priority, limit=limit, due_date=due_date, tag=tag
         )
+        if out is not None:
+            self.format_output_stream(issues, out, as_json)
+            return ""
         return self.format_output(issues, as_json)
 
     def get_issue(self, issue_id: int, as_json: bool = False) -> str:
@@ -271,8 +793,6 @@ class CLI:
         """
         # Validate due_date if present
         if "due_date" in updates and updates["due_date"]:
-            import contextlib
-
             with contextlib.suppress(ValueError):
                 # Just check format, value is passed as string to repo which handles conversion
                 # Actually repo update_issue expects string for due_date based on my update?
@@ -310,6 +830,9 @@ class CLI:
         Raises:
             ValueError: If invalid parameters provided.
         """
+        if not new_status and not new_priority:
+            raise ValueError("No updates specified (use -s or --priority)")
+
         count = self.repo.bulk_update_issues(
             new_status=new_status,
             new_priority=new_priority,
@@ -363,6 +886,7 @@ class CLI:
         keyword: str,
         limit: Optional[int] = None,
         as_json: bool = False,
+        out: Optional[TextIO] = None,
     ) -> str:
         """Search issues by keyword.
 
@@ -370,11 +894,16 @@ class CLI:
             keyword: Search keyword.
             limit: Maximum results.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
         issues = self.repo.search_issues(keyword=keyword, limit=limit)
+        if out is not None:
+            self.format_output_stream(issues, out, as_json)
+            return ""
         return self.format_output(issues, as_json)
 
     def clear_all(self, confirm: bool = False, as_json: bool = False) -> str:
@@ -401,41 +930,65 @@ class CLI:
         self,
         issue_id: Optional[int] = None,
         as_json: bool = False,
+        out: Optional[TextIO] = None,
     ) -> str:
         """Get audit logs.
 
         Args:
             issue_id: Filter by issue ID.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
         logs = self.repo.get_audit_logs(issue_id=issue_id)
 
         if as_json:
-            return json.dumps([log.to_dict() for log in logs], indent=2)
+            data = [log.to_dict() for log in logs]
+            if out is not None:
+                _write_json(data, out)
+                return ""
+            return _dumps(data)
         else:
             if not logs:
                 return "No audit logs found."
 
-            lines = []
-            for log in logs:
-                lines.append("-" * 50)
-                lines.append(f"Timestamp: {log.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-                lines.append(f"Issue ID: {log.issue_id}")
-                lines.append(f"Action: {log.action}")
-
-                if log.field_name:
-                    lines.append(f"Field: {log.field_name}")
-                    lines.append(f"Old Value: {log.old_value}")
-                    lines.append(f"New Value: {log.new_value}")
-                elif log.action == "CREATE":
-                    lines.append(f"Created: {log.new_value}")
-                elif log.action == "DELETE":
-                    lines.append(f"Deleted: {log.old_value}")
+            blocks = self._audit_log_blocks(logs)
+            if out is not None:
+                out.writelines(f"{block}\n" for block in blocks)
+                return ""
+            return "\n".join(blocks)
 
-            return "\n".join(lines)
+    @staticmethod
+    def _audit_log_blocks(logs: list[AuditLog]) -> Iterator[str]:
+        """Yield the text output of audit logs as blocks of lines.
+
+        Args:
+            logs: Audit logs to render.
+
+        Yields:
+            Lines of one entry or one detail section, without a trailing newline.
+        """
+        for log in logs:
+            yield (
+                f"{_SEPARATOR}\n"
+                f"Timestamp: {log.timestamp.isoformat(' ', 'seconds')}\n"
+                f"Issue ID: {log.issue_id}\n"
+                f"Action: {log.action}"
+            )
+
+            if log.field_name:
+                yield (
+                    f"Field: {log.field_name}\n"
+                    f"Old Value: {log.old_value}\n"
+                    f"New Value: {log.new_value}"
+                )
+            elif log.action == "CREATE":
+                yield f"Created: {log.new_value}"
+            elif log.action == "DELETE":
+                yield f"Deleted: {log.old_value}"
 
     def get_info(self, as_json: bool = False) -> str:
         """Get database information.
@@ -478,22 +1031,29 @@ class CLI:
         report = self.repo.get_report(group_by=group_by)
         return self.format_output(report, as_json)
 
-    def bulk_create(self, json_input: str, as_json: bool = False) -> str:
+    def bulk_create(
+        self,
+        json_input: Union[str, bytes, BinaryIO],
+        as_json: bool = False,
+        out: Optional[TextIO] = None,
+    ) -> str:
         """Bulk create issues from JSON input.
 
         Args:
-            json_input: JSON string or file path containing list of issue data.
+            json_input: JSON string, UTF-8 bytes or binary stream (JSON or
+                NDJSON) containing list of issue data.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
 
         Raises:
             ValueError: If JSON is invalid or issues cannot be created.
         """
         # Parse JSON input
         try:
-            issues_data = json.loads(json_input)
+            issues_data = _load_json_input(json_input)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON input: {e}") from e
 
@@ -503,29 +1063,33 @@ class CLI:
         # Create issues
         created_issues = self.repo.bulk_create_issues(issues_data)
 
-        result = {
-            "message": f"Created {len(created_issues)} issue(s)",
-            "count": len(created_issues),
-            "issues": [issue.to_dict() for issue in created_issues],
-        }
-        return self.format_output(result, as_json)
+        return self._format_bulk_json_output(
+            f"Created {len(created_issues)} issue(s)", created_issues, as_json, out
+        )
 
-    def bulk_update_json(self, json_input: str, as_json: bool = False) -> str:
+    def bulk_update_json(
+        self,
+        json_input: Union[str, bytes, BinaryIO],
+        as_json: bool = False,
+        out: Optional[TextIO] = None,
+    ) -> str:
         """Bulk update issues from JSON input.
 
         Args:
-            json_input: JSON string or file path containing list of update data.
+            json_input: JSON string, UTF-8 bytes or binary stream (JSON or
+                NDJSON) containing list of update data.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
 
         Raises:
             ValueError: If JSON is invalid or issues cannot be updated.
         """
         # Parse JSON input
         try:
-            updates_data = json.loads(json_input)
+            updates_data = _load_json_input(json_input)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON input: {e}") from e
 
@@ -535,29 +1099,33 @@ class CLI:
         # Update issues
         updated_issues = self.repo.bulk_update_issues_from_json(updates_data)
 
-        result = {
-            "message": f"Updated {len(updated_issues)} issue(s)",
-            "count": len(updated_issues),
-            "issues": [issue.to_dict() for issue in updated_issues],
-        }
-        return self.format_output(result, as_json)
+        return self._format_bulk_json_output(
+            f"Updated {len(updated_issues)} issue(s)", updated_issues, as_json, out
+        )
 
-    def bulk_close(self, json_input: str, as_json: bool = False) -> str:
+    def bulk_close(
+        self,
+        json_input: Union[str, bytes, BinaryIO],
+        as_json: bool = False,
+        out: Optional[TextIO] = None,
+    ) -> str:
         """Bulk close issues from JSON input containing issue IDs.
 
         Args:
-            json_input: JSON string or file path containing list of issue IDs.
+            json_input: JSON string, UTF-8 bytes or binary stream (JSON or
+                NDJSON) containing list of issue IDs.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
 
         Raises:
             ValueError: If JSON is invalid or issues cannot be closed.
         """
         # Parse JSON input
         try:
-            issue_ids = json.loads(json_input)
+            issue_ids = _load_json_input(json_input)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON input: {e}") from e
 
@@ -571,12 +1139,9 @@ class CLI:
         # Close issues
         closed_issues = self.repo.bulk_close_issues(issue_ids)
 
-        result = {
-            "message": f"Closed {len(closed_issues)} issue(s)",
-            "count": len(closed_issues),
-            "issues": [issue.to_dict() for issue in closed_issues],
-        }
-        return self.format_output(result, as_json)
+        return self._format_bulk_json_output(
+            f"Closed {len(closed_issues)} issue(s)", closed_issues, as_json, out
+        )
 
     def add_comment(self, issue_id: int, text: str, as_json: bool = False) -> str:
         """Add a comment to an issue.
@@ -595,36 +1160,47 @@ class CLI:
         comment = self.repo.add_comment(issue_id, text)
 
         if as_json:
-            return json.dumps(comment.to_dict(), indent=2)
+            return _dumps(comment.to_dict())
         else:
             return f"Comment added to issue {issue_id}"
 
-    def list_comments(self, issue_id: int, as_json: bool = False) -> str:
+    def list_comments(
+        self, issue_id: int, as_json: bool = False, out: Optional[TextIO] = None
+    ) -> str:
         """List all comments for an issue.
 
         Args:
             issue_id: Issue ID.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
         comments = self.repo.get_comments(issue_id)
 
         if as_json:
-            return json.dumps([c.to_dict() for c in comments], indent=2)
+            data = [c.to_dict() for c in comments]
+            if out is not None:
+                _write_json(data, out)
+                return ""
+            return _dumps(data)
         else:
             if not comments:
                 return f"No comments found for issue {issue_id}."
 
-            lines = []
-            for comment in comments:
-                lines.append("-" * 50)
-                lines.append(f"Comment ID: {comment.id}")
-                lines.append(f"Created: {comment.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                lines.append(f"Text: {comment.text}")
-
-            return "\n".join(lines)
+            blocks = (
+                f"{_SEPARATOR}\n"
+                f"Comment ID: {comment.id}\n"
+                f"Created: {comment.created_at.isoformat(' ', 'seconds')}\n"
+                f"Text: {comment.text}"
+                for comment in comments
+            )
+            if out is not None:
+                out.writelines(f"{block}\n" for block in blocks)
+                return ""
+            return "\n".join(blocks)
 
     def delete_comment(self, comment_id: int, as_json: bool = False) -> str:
         """Delete a comment.
@@ -692,22 +1268,22 @@ class CLI:
             similar_issues = similar_issues[:limit]
 
         if as_json:
-            results = []
-            for issue, similarity in similar_issues:
-                issue_dict = issue.to_dict()
-                issue_dict["similarity"] = round(similarity * 100, 1)
-                results.append(issue_dict)
-            return json.dumps(results, indent=2)
+            return _dumps(
+                [
+                    {**issue.to_dict(), "similarity": round(similarity * 100, 1)}
+                    for issue, similarity in similar_issues
+                ]
+            )
         else:
             if not similar_issues:
                 return "No similar issues found."
 
             lines = [f"Found {len(similar_issues)} similar issue(s):\n"]
             for issue, similarity in similar_issues:
-                lines.append(f"Issue #{issue.id} ({round(similarity * 100, 1)}% similar)")
+                lines.append(f"Issue #{issue.id} ({similarity * 100:.1f}% similar)")
                 lines.append(f"  Title: {issue.title}")
-                lines.append(f"  Status: {issue.status.value}")
-                lines.append(f"  Priority: {issue.priority.value}")
+                lines.append(f"  Status: {issue.status._value_}")
+                lines.append(f"  Priority: {issue.priority._value_}")
                 lines.append("")
 
             return "\n".join(lines)
@@ -735,19 +1311,18 @@ class CLI:
         duplicate_groups = find_duplicate_groups(all_issues, threshold=threshold)
 
         if as_json:
-            groups_data = []
-            for group in duplicate_groups:
-                duplicates_list: list[dict[str, Any]] = []
-                for issue, similarity in group[1:]:
-                    dup_dict = issue.to_dict()
-                    dup_dict["similarity"] = round(similarity * 100, 1)
-                    duplicates_list.append(dup_dict)
-                group_data = {"primary": group[0][0].to_dict(), "duplicates": duplicates_list}
-                groups_data.append(group_data)
-
-            return json.dumps(
-                {"total_groups": len(duplicate_groups), "groups": groups_data}, indent=2
-            )
+            groups_data = [
+                {
+                    "primary": group[0][0].to_dict(),
+                    "duplicates": [
+                        {**issue.to_dict(), "similarity": round(similarity * 100, 1)}
+                        for issue, similarity in group[1:]
+                    ],
+                }
+                for group in duplicate_groups
+            ]
+
+            return _dumps({"total_groups": len(duplicate_groups), "groups": groups_data})
         else:
             if not duplicate_groups:
                 return "No potential duplicates found."
@@ -762,8 +1337,7 @@ class CLI:
 
                 for issue, similarity in group[1:]:
                     lines.append(
-                        f"    - Issue #{issue.id}: {issue.title} "
-                        f"({round(similarity * 100, 1)}% similar)"
+                        f"    - Issue #{issue.id}: {issue.title} ({similarity * 100:.1f}% similar)"
                     )
                 lines.append("")
 
@@ -814,7 +1388,7 @@ class CLI:
             related_issues = [iss for iss in similar if iss.id != issue_id][:3]
 
         # Generate suggested actions
-        suggested_actions = self._generate_suggested_actions(issue)
+        suggested_actions = self._generate_suggested_actions(issue, len(comments))
 
         # Build context object
         context = {
@@ -834,7 +1408,7 @@ class CLI:
 
         # Format output
         if as_json:
-            return json.dumps(context, indent=2)
+            return _dumps(context)
         else:
             return self._format_issue_context(
                 issue=issue,
@@ -855,45 +1429,54 @@ class CLI:
         Returns:
             Dictionary with git info, or None if not in git repo.
         """
+        if issue_id not in self._git_info_cache:
+            self._git_info_cache[issue_id] = self._load_git_info(issue_id)
+        return self._git_info_cache[issue_id]
+
+    def _load_git_info(self, issue_id: int) -> Optional[dict[str, Any]]:
+        """Run git to collect the information returned by _get_git_info.
+
+        Args:
+            issue_id: Issue ID.
+
+        Returns:
+            Dictionary with git info, or None if not in git repo.
+        """
+        if self._in_git_repo is False:
+            return None
+
+        # Imported here: only the context command runs git.
         import subprocess
 
         try:
-            # Check if we're in a git repository
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
+            # Current branch; this also tells whether we're in a git repository
+            # (exit status 1 means detached HEAD, anything else means no repo)
+            branch_result = subprocess.run(
+                ["git", "symbolic-ref", "--short", "-q", "HEAD"],
                 capture_output=True,
                 text=True,
                 timeout=2,
             )
-            if result.returncode != 0:
+            if branch_result.returncode not in (0, 1):
+                self._in_git_repo = False
                 return None
+            self._in_git_repo = True
+            current_branch = branch_result.stdout.strip()
 
-            # Get current branch
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"],
+            # Search for commits mentioning this issue ID
+            # Look for patterns like "#ID", "issue ID", "issue #ID", etc.
+            # Repeated --grep options are OR-ed, so one git log covers them all.
+            patterns = [f"#{issue_id}", f"issue {issue_id}", f"issue #{issue_id}"]
+            commit_result = subprocess.run(
+                ["git", "log", "--all", "-i", "--oneline", "-n", "5"]
+                + [f"--grep={pattern}" for pattern in patterns],
                 capture_output=True,
                 text=True,
                 timeout=2,
             )
-            current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else None
-
-            # Search for commits mentioning this issue ID
-            # Look for patterns like "#ID", "issue ID", "issue #ID", etc.
-            patterns = [f"#{issue_id}", f"issue {issue_id}", f"issue #{issue_id}"]
             recent_commits = []
-
-            for pattern in patterns:
-                commit_result = subprocess.run(
-                    ["git", "log", "--all", f"--grep={pattern}", "-i", "--oneline", "-n", "5"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if commit_result.returncode == 0 and commit_result.stdout.strip():
-                    commits = commit_result.stdout.strip().split("\n")
-                    for commit in commits:
-                        if commit and commit not in recent_commits:
-                            recent_commits.append(commit)
+            if commit_result.returncode == 0:
+                recent_commits = [c for c in commit_result.stdout.strip().split("\n") if c]
 
             git_info = {
                 "current_branch": current_branch,
@@ -903,15 +1486,20 @@ class CLI:
 
             return git_info
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-            # Git not available or timeout
+        except FileNotFoundError:
+            # Git not installed
+            self._in_git_repo = False
+            return None
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            # Timeout or other git failure
             return None
 
-    def _generate_suggested_actions(self, issue: Issue) -> list[str]:
+    def _generate_suggested_actions(self, issue: Issue, comments_count: int) -> list[str]:
         """Generate suggested actions based on issue status.
 
         Args:
             issue: Issue object.
+            comments_count: Number of comments on the issue.
 
         Returns:
             List of suggested action strings.
@@ -933,7 +1521,6 @@ class CLI:
             actions.append("Issue marked as won't do - can be reopened if needed")
 
         # Check if there are no comments
-        comments_count = len(self.repo.get_comments(issue.id)) if issue.id else 0
         if comments_count == 0:
             actions.append(
                 f"No comments yet - add notes with: "
@@ -966,40 +1553,30 @@ class CLI:
         Returns:
             Formatted string.
         """
-        lines = []
-
-        # Header
-        lines.append("=" * 60)
-        lines.append("ISSUE CONTEXT")
-        lines.append("=" * 60)
-        lines.append("")
-
-        # Issue details
-        lines.append(f"## Issue #{issue.id}")
-        lines.append(f"Title: {issue.title}")
-        lines.append(f"Status: {issue.status.value}")
-        lines.append(f"Priority: {issue.priority.value}")
-        lines.append(f"Created: {issue.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Updated: {issue.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
+        # Each entry is one section ending in a newline; joining them with
+        # "\n" leaves a blank line between sections.
+        lines = [
+            f"{_CONTEXT_RULE}\nISSUE CONTEXT\n{_CONTEXT_RULE}\n\n"
+            f"## Issue #{issue.id}\n"
+            f"Title: {issue.title}\n"
+            f"Status: {issue.status._value_}\n"
+            f"Priority: {issue.priority._value_}\n"
+            f"Created: {issue.created_at.isoformat(' ', 'seconds')}\n"
+            f"Updated: {issue.updated_at.isoformat(' ', 'seconds')}\n"
+        ]
 
         # Description
         if issue.description:
-            lines.append("## Description")
-            lines.append(issue.description)
-            lines.append("")
+            lines.append(f"## Description\n{issue.description}\n")
 
         # Comments
         if comments:
-            lines.append(f"## Comments ({len(comments)})")
-            for comment in comments:
-                timestamp = comment.created_at.strftime("%Y-%m-%d %H:%M")
-                lines.append(f"[{timestamp}] {comment.text}")
-            lines.append("")
+            comment_lines = "\n".join(
+                f"[{c.created_at.isoformat(' ', 'minutes')}] {c.text}" for c in comments
+            )
+            lines.append(f"## Comments ({len(comments)})\n{comment_lines}\n")
         else:
-            lines.append("## Comments")
-            lines.append("No comments yet.")
-            lines.append("")
+            lines.append("## Comments\nNo comments yet.\n")
 
         # Skip the rest if compact mode
         if compact:
@@ -1007,56 +1584,40 @@ class CLI:
 
         # Recent activity
         if audit_logs:
-            lines.append(f"## Recent Activity (Last {len(audit_logs)} changes)")
+            activity = [f"## Recent Activity (Last {len(audit_logs)} changes)"]
             for log in audit_logs:
-                timestamp = log.timestamp.strftime("%Y-%m-%d %H:%M")
-                if log.action in ["CREATE", "BULK_CREATE"]:
-                    lines.append(f"- {timestamp}: Issue created")
-                elif log.action in ["UPDATE", "BULK_UPDATE"]:
-                    if log.field_name:
-                        lines.append(
-                            f"- {timestamp}: {log.field_name} changed "
-                            f"from '{log.old_value}' to '{log.new_value}'"
-                        )
-                    else:
-                        lines.append(f"- {timestamp}: Issue updated")
-                elif log.action == "DELETE":
-                    lines.append(f"- {timestamp}: Issue deleted")
-                elif log.action == "FETCH":
-                    lines.append(f"- {timestamp}: Issue fetched via get-next")
-            lines.append("")
+                describe = _ACTIVITY_DESCRIPTIONS.get(log.action)
+                if describe:
+                    timestamp = log.timestamp.isoformat(" ", "minutes")
+                    activity.append(f"- {timestamp}: {describe(log)}")
+            activity.append("")
+            lines.append("\n".join(activity))
 
         # Related issues
         if related_issues:
-            lines.append(f"## Related Issues ({len(related_issues)})")
-            for rel_issue in related_issues:
-                lines.append(
-                    f"- #{rel_issue.id}: {rel_issue.title} "
-                    f"({rel_issue.status.value}, {rel_issue.priority.value})"
-                )
-            lines.append("")
+            related_lines = "\n".join(
+                f"- #{rel.id}: {rel.title} ({rel.status._value_}, {rel.priority._value_})"
+                for rel in related_issues
+            )
+            lines.append(f"## Related Issues ({len(related_issues)})\n{related_lines}\n")
 
         # Git information
         if git_info:
-            lines.append("## Git Information")
+            git_lines = ["## Git Information"]
             if git_info.get("current_branch"):
-                lines.append(f"Current branch: {git_info['current_branch']}")
+                git_lines.append(f"Current branch: {git_info['current_branch']}")
             if git_info.get("related_commits"):
-                lines.append(f"Related commits ({len(git_info['related_commits'])}):")
-                for commit in git_info["related_commits"]:
-                    lines.append(f"  {commit}")
+                git_lines.append(f"Related commits ({len(git_info['related_commits'])}):")
+                git_lines.extend(f"  {commit}" for commit in git_info["related_commits"])
             elif git_info.get("current_branch"):
-                lines.append("No commits found mentioning this issue")
-            lines.append("")
+                git_lines.append("No commits found mentioning this issue")
+            git_lines.append("")
+            lines.append("\n".join(git_lines))
 
         # Suggested actions
         if suggested_actions:
-            lines.append("## Suggested Actions")
-            for action in suggested_actions:
-                lines.append(f"- {action}")
-            lines.append("")
-
-        return "\n".join(lines)
+            action_lines = "\n".join(f"- {action}" for action in suggested_actions)
+            lines.append(f"## Suggested Actions\n{action_lines}\n")
 
         return "\n".join(lines)
 
@@ -1069,10 +1630,10 @@ class CLI:
         try:
             memory = self.repo.add_memory(key, value, category)
             if as_json:
-                return json.dumps(memory.to_dict(), indent=2)
+                return _dumps(memory.to_dict())
             return f"Memory added: {key} ({category})"
         except ValueError as e:
-            return json.dumps({"error": str(e)}) if as_json else str(e)
+            return _dumps({"error": str(e)}) if as_json else str(e)
 
     def memory_list(
         self, category: Optional[str] = None, search: Optional[str] = None, as_json: bool = False
@@ -1080,7 +1641,7 @@ class CLI:
         """List memory items."""
         memories = self.repo.list_memory(category, search)
         if as_json:
-            return json.dumps([m.to_dict() for m in memories], indent=2)
+            return _dumps([m.to_dict() for m in memories])
 
         if not memories:
             return "No memory items found."
@@ -1101,19 +1662,19 @@ class CLI:
         memory = self.repo.update_memory(key, value, category)
         if not memory:
             msg = f"Memory '{key}' not found"
-            return json.dumps({"error": msg}) if as_json else msg
+            return _dumps({"error": msg}) if as_json else msg
 
         if as_json:
-            return json.dumps(memory.to_dict(), indent=2)
+            return _dumps(memory.to_dict())
         return f"Memory updated: {key}"
 
     def memory_delete(self, key: str, as_json: bool = False) -> str:
         """Delete memory item."""
         if self.repo.delete_memory(key):
             msg = f"Memory '{key}' deleted"
-            return json.dumps({"message": msg}) if as_json else msg
+            return _dumps({"message": msg}) if as_json else msg
         msg = f"Memory '{key}' not found"
-        return json.dumps({"error": msg}) if as_json else msg
+        return _dumps({"error": msg}) if as_json else msg
 
     # Lesson CLI methods
 
@@ -1128,10 +1689,10 @@ class CLI:
         try:
             ll = self.repo.add_lesson(lesson, issue_id, category)
             if as_json:
-                return json.dumps(ll.to_dict(), indent=2)
+                return _dumps(ll.to_dict())
             return f"Lesson added: {ll.id}"
         except ValueError as e:
-            return json.dumps({"error": str(e)}) if as_json else str(e)
+            return _dumps({"error": str(e)}) if as_json else str(e)
 
     def lesson_list(
         self, issue_id: Optional[int] = None, category: Optional[str] = None, as_json: bool = False
@@ -1139,7 +1700,7 @@ class CLI:
         """List lessons."""
         lessons = self.repo.list_lessons(issue_id, category)
         if as_json:
-            return json.dumps([lesson.to_dict() for lesson in lessons], indent=2)
+            return _dumps([lesson.to_dict() for lesson in lessons])
 
         if not lessons:
             return "No lessons found."
@@ -1154,32 +1715,25 @@ class CLI:
 
     def tag_issue(self, issue_id: int, tags: list[str], as_json: bool = False) -> str:
         """Add tags to issue."""
-        added = []
-        for tag in tags:
-            if self.repo.add_issue_tag(issue_id, tag):
-                added.append(tag)
+        added = self.repo.add_issue_tags(issue_id, tags)
 
         if as_json:
-            return json.dumps({"added": added}, indent=2)
+            return _dumps({"added": added})
         return f"Added tags to issue #{issue_id}: {', '.join(added)}"
 
     def untag_issue(self, issue_id: int, tags: list[str], as_json: bool = False) -> str:
         """Remove tags from issue."""
-        removed = []
-        for tag in tags:
-            if self.repo.remove_issue_tag(issue_id, tag):
-                removed.append(tag)
+        removed = self.repo.remove_issue_tags(issue_id, tags)
 
         if as_json:
-            return json.dumps({"removed": removed}, indent=2)
+            return _dumps({"removed": removed})
         return f"Removed tags from issue #{issue_id}: {', '.join(removed)}"
 
     def tag_list(self, as_json: bool = False) -> str:
         """List all available tags."""
-        tags = self.repo.list_tags()
         if as_json:
-            return json.dumps([t.to_dict() for t in tags], indent=2)
-        return ", ".join([t.name for t in tags])
+            return _dumps([t.to_dict() for t in self.repo.list_tags()])
+        return ", ".join(self.repo.list_tag_names())
 
     # Link CLI methods
 
@@ -1188,10 +1742,10 @@ class CLI:
         try:
             rel = self.repo.link_issues(source, target, type)
             if as_json:
-                return json.dumps(rel.to_dict(), indent=2)
+                return _dumps(rel.to_dict())
             return f"Linked #{source} to #{target} ({type})"
         except ValueError as e:
-            return json.dumps({"error": str(e)}) if as_json else str(e)
+            return _dumps({"error": str(e)}) if as_json else str(e)
 
     def unlink_issues(
         self, source: int, target: int, type: Optional[str] = None, as_json: bool = False
@@ -1199,9 +1753,9 @@ class CLI:
         """Unlink issues."""
         if self.repo.unlink_issues(source, target, type):
             msg = f"Unlinked #{source} and #{target}"
-            return json.dumps({"message": msg}) if as_json else msg
+            return _dumps({"message": msg}) if as_json else msg
         msg = "Link not found"
-        return json.dumps({"error": msg}) if as_json else msg
+        return _dumps({"error": msg}) if as_json else msg
 
     def workspace_status(self, as_json: bool = False) -> str:
         """Get workspace status.
@@ -1215,7 +1769,7 @@ class CLI:
         status = self.repo.get_workspace_status()
 
         if as_json:
-            return json.dumps(status, indent=2)
+            return _dumps(status)
         else:
             lines = ["=== Workspace Status ==="]
 
@@ -1266,20 +1820,19 @@ class CLI:
         issue, started_at = self.repo.start_issue(issue_id)
 
         if as_json:
-            return json.dumps(
+            return _dumps(
                 {
                     "message": f"Started working on issue {issue_id}",
                     "issue": issue.to_dict(),
                     "started_at": started_at.isoformat(),
-                },
-                indent=2,
+                }
             )
         else:
             lines = [
                 f"Started working on issue #{issue_id}",
                 f"Title: {issue.title}",
-                f"Status: {issue.status.value}",
-                f"Started at: {started_at.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"Status: {issue.status._value_}",
+                f"Started at: {started_at.isoformat(' ', 'seconds')}",
             ]
             return "\n".join(lines)
 
@@ -1298,33 +1851,31 @@ class CLI:
 
         if not result:
             msg = {"message": "No active issue to stop"}
-            return json.dumps(msg, indent=2) if as_json else msg["message"]
+            return _dumps(msg) if as_json else msg["message"]
 
         issue, started_at, stopped_at = result
         time_spent = stopped_at - started_at
-        hours = int(time_spent.total_seconds() // 3600)
-        minutes = int((time_spent.total_seconds() % 3600) // 60)
+        time_spent_str = _format_hm(time_spent.total_seconds())
 
         if as_json:
-            return json.dumps(
+            return _dumps(
                 {
                     "message": f"Stopped working on issue {issue.id}",
                     "issue": issue.to_dict(),
                     "started_at": started_at.isoformat(),
                     "stopped_at": stopped_at.isoformat(),
-                    "time_spent": f"{hours}h {minutes}m",
+                    "time_spent": time_spent_str,
                     "time_spent_seconds": int(time_spent.total_seconds()),
-                },
-                indent=2,
+                }
             )
         else:
             lines = [
                 f"Stopped working on issue #{issue.id}",
                 f"Title: {issue.title}",
-                f"Time spent: {hours}h {minutes}m",
+                f"Time spent: {time_spent_str}",
             ]
             if close:
-                lines.append(f"Status: {issue.status.value}")
+                lines.append(f"Status: {issue.status._value_}")
             return "\n".join(lines)
 
     def get_active_issue_workspace(self, as_json: bool = False) -> str:
@@ -1336,37 +1887,33 @@ class CLI:
         Returns:
             Formatted output.
         """
-        from datetime import datetime
-
         active = self.repo.get_active_issue()
 
         if not active:
             msg = {"message": "No active issue"}
-            return json.dumps(msg, indent=2) if as_json else msg["message"]
+            return _dumps(msg) if as_json else msg["message"]
 
         issue, started_at = active
         time_spent = datetime.now() - started_at
-        hours = int(time_spent.total_seconds() // 3600)
-        minutes = int((time_spent.total_seconds() % 3600) // 60)
+        time_spent_str = _format_hm(time_spent.total_seconds())
 
         if as_json:
-            return json.dumps(
+            return _dumps(
                 {
                     "issue": issue.to_dict(),
                     "started_at": started_at.isoformat(),
-                    "time_spent": f"{hours}h {minutes}m",
+                    "time_spent": time_spent_str,
                     "time_spent_seconds": int(time_spent.total_seconds()),
-                },
-                indent=2,
+                }
             )
         else:
             lines = [
                 f"Active Issue: #{issue.id}",
                 f"Title: {issue.title}",
-                f"Status: {issue.status.value}",
-                f"Priority: {issue.priority.value}",
-                f"Started at: {started_at.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Time spent: {hours}h {minutes}m",
+                f"Status: {issue.status._value_}",
+                f"Priority: {issue.priority._value_}",
+                f"Started at: {started_at.isoformat(' ', 'seconds')}",
+                f"Time spent: {time_spent_str}",
             ]
             return "\n".join(lines)
 
@@ -1406,9 +1953,7 @@ class CLI:
         try:
             entry = self.repo.stop_timer(issue_id)
             duration = entry.get("duration_seconds", 0)
-            hours = duration // 3600
-            minutes = (duration % 3600) // 60
-            seconds = duration % 60
+            hours, minutes, seconds = _hms(duration)
             result = {
                 "message": "Timer stopped",
                 "entry_id": entry.get("id"),
@@ -1439,22 +1984,20 @@ class CLI:
         for entry in running:
             # Repo already calculates elapsed_seconds
             elapsed = entry.get("elapsed_seconds", 0)
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
             timers.append(
                 {
                     "entry_id": entry["id"],
                     "issue_id": entry["issue_id"],
                     "issue_title": entry.get("issue_title", ""),
                     "started_at": entry["started_at"],
-                    "elapsed": f"{hours}h {minutes}m",
+                    "elapsed": _format_hm(elapsed),
                     "elapsed_seconds": elapsed,
                     "note": entry.get("note"),
                 }
             )
 
         if as_json:
-            return json.dumps({"timers": timers}, indent=2)
+            return _dumps({"timers": timers})
         else:
             lines = ["Running Timers:"]
             for t in timers:
@@ -1481,63 +2024,76 @@ class CLI:
         }
         return self.format_output(result, as_json)
 
-    def time_log(self, issue_id: int, as_json: bool = False) -> str:
+    def time_log(self, issue_id: int, as_json: bool = False, out: Optional[TextIO] = None) -> str:
         """Show time entries for an issue.
 
         Args:
             issue_id: Issue ID.
             as_json: Output as JSON.
+            out: If given, stream the text output to this text stream instead
+                of returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
-        entries = self.repo.get_time_entries(issue_id)
+        entries, total_seconds = self.repo.get_time_entries_with_total(issue_id)
 
         if not entries:
             result = {"message": f"No time entries for issue {issue_id}", "entries": []}
             return self.format_output(result, as_json)
 
-        formatted = []
-        total_seconds = 0
-        for entry in entries:
-            duration = entry.get("duration_seconds", 0) or 0
-            total_seconds += duration
-            hours = duration // 3600
-            minutes = (duration % 3600) // 60
-            formatted.append(
-                {
-                    "id": entry["id"],
-                    "started_at": entry.get("started_at"),  # Already a string from SQLite
-                    "ended_at": entry.get("ended_at"),
-                    "duration": f"{hours}h {minutes}m",
-                    "duration_seconds": duration,
-                    "note": entry.get("note"),
-                    "running": entry.get("ended_at") is None,
-                }
-            )
-
-        total_hours = total_seconds // 3600
-        total_minutes = (total_seconds % 3600) // 60
-
         if as_json:
-            return json.dumps(
+            formatted = []
+            for entry in entries:
+                duration = entry["duration_seconds"] or 0
+                formatted.append(
+                    {
+                        "id": entry["id"],
+                        "started_at": entry["started_at"],  # Already a string from SQLite
+                        "ended_at": entry["ended_at"],
+                        "duration": _format_hm(duration),
+                        "duration_seconds": duration,
+                        "note": entry["note"],
+                        "running": entry["ended_at"] is None,
+                    }
+                )
+            return _dumps(
                 {
                     "issue_id": issue_id,
                     "entries": formatted,
                     "total_seconds": total_seconds,
-                    "total_formatted": f"{total_hours}h {total_minutes}m",
-                },
-                indent=2,
+                    "total_formatted": _format_hm(total_seconds),
+                }
             )
-        else:
-            lines = [f"Time Log for Issue #{issue_id}:", ""]
-            for e in formatted:
-                status = "[RUNNING]" if e["running"] else ""
-                note_str = f" - {e['note']}" if e.get("note") else ""
-                lines.append(f"  {e['started_at']}: {e['duration']}{note_str} {status}")
-            lines.append("")
-            lines.append(f"Total: {total_hours}h {total_minutes}m")
-            return "\n".join(lines)
+
+        lines = self._time_log_lines(issue_id, entries, _format_hm(total_seconds))
+        if out is not None:
+            for line in lines:
+                out.write(f"{line}\n")
+            return ""
+        return "\n".join(lines)
+
+    @staticmethod
+    def _time_log_lines(issue_id: int, entries: list[dict[str, Any]], total: str) -> Iterator[str]:
+        """Yield the lines of the text time log.
+
+        Args:
+            issue_id: Issue ID.
+            entries: Time entry dictionaries.
+            total: Formatted total duration.
+
+        Yields:
+            Output lines, without line endings.
+        """
+        yield f"Time Log for Issue #{issue_id}:"
+        yield ""
+        for entry in entries:
+            duration = _format_hm(entry["duration_seconds"] or 0)
+            status = "[RUNNING]" if entry["ended_at"] is None else ""
+            note_str = f" - {entry['note']}" if entry["note"] else ""
+            yield f"  {entry['started_at']}: {duration}{note_str} {status}"
+        yield ""
+        yield f"Total: {total}"
 
     def time_report(
         self, period: str = "all", issue_id: Optional[int] = None, as_json: bool = False
@@ -1555,23 +2111,19 @@ class CLI:
         report = self.repo.get_time_report(period, issue_id)
 
         if as_json:
-            return json.dumps(report, indent=2)
+            return _dumps(report)
         else:
             period_labels = {"all": "All Time", "week": "This Week", "month": "This Month"}
             period_label = period_labels.get(period, period)
             lines = [f"Time Report ({period_label})", "=" * 30]
 
-            total_hours = report["total_seconds"] // 3600
-            total_minutes = (report["total_seconds"] % 3600) // 60
-            lines.append(f"Total: {total_hours}h {total_minutes}m")
+            lines.append(f"Total: {_format_hm(report['total_seconds'])}")
             lines.append("")
 
             if report.get("issues"):
                 lines.append("By Issue:")
                 for item in report["issues"]:
-                    seconds = item.get("total_seconds", 0)
-                    hours = seconds // 3600
-                    minutes = (seconds % 3600) // 60
+                    duration = _format_hm(item.get("total_seconds", 0))
                     estimate_str = ""
                     if item.get("estimated_hours"):
                         est_h = item["estimated_hours"]
@@ -1581,7 +2133,7 @@ class CLI:
                             estimate_str = f" (est: {est_h}h)"
                     issue_id = item["issue_id"]
                     title = item["title"]
-                    lines.append(f"  #{issue_id} {title}: {hours}h {minutes}m{estimate_str}")
+                    lines.append(f"  #{issue_id} {title}: {duration}{estimate_str}")
 
             return "\n".join(lines)
 
@@ -1671,35 +2223,17 @@ class CLI:
         if not issue:
             raise ValueError(f"Issue {issue_id} not found")
 
-        blockers = self.repo.get_blockers(issue_id)
-        blocking = self.repo.get_blocking(issue_id)
-        is_blocked = self.repo.is_blocked(issue_id)
+        blockers, blocking, is_blocked = self.repo.get_dependency_graph(issue_id)
 
         if as_json:
             result = {
                 "issue_id": issue_id,
                 "title": issue.title,
                 "is_blocked": is_blocked,
-                "blocked_by": [
-                    {
-                        "id": b.id,
-                        "title": b.title,
-                        "status": b.status.value,
-                        "priority": b.priority.value,
-                    }
-                    for b in blockers
-                ],
-                "blocking": [
-                    {
-                        "id": b.id,
-                        "title": b.title,
-                        "status": b.status.value,
-                        "priority": b.priority.value,
-                    }
-                    for b in blocking
-                ],
+                "blocked_by": [b.to_brief_dict() for b in blockers],
+                "blocking": [b.to_brief_dict() for b in blocking],
             }
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         else:
             lines = []
             lines.append(f"Dependencies for Issue #{issue_id}: {issue.title}")
@@ -1712,7 +2246,7 @@ class CLI:
                     status_marker = "OPEN" if blocker.status != Status.CLOSED else "CLOSED"
                     lines.append(
                         f"  - Issue #{blocker.id}: {blocker.title} "
-                        f"[{status_marker}, {blocker.priority.value}]"
+                        f"[{status_marker}, {blocker.priority._value_}]"
                     )
                 if is_blocked:
                     lines.append("\nThis issue is BLOCKED (has unresolved blockers)")
@@ -1727,7 +2261,7 @@ class CLI:
                     status_marker = "OPEN" if blocked.status != Status.CLOSED else "CLOSED"
                     lines.append(
                         f"  - Issue #{blocked.id}: {blocked.title} "
-                        f"[{status_marker}, {blocked.priority.value}]"
+                        f"[{status_marker}, {blocked.priority._value_}]"
                     )
             else:
                 lines.append("Blocking: None")
@@ -1745,37 +2279,41 @@ class CLI:
             Formatted output.
         """
         issues = self.repo.get_all_blocked_issues(status=status)
+        # Rows of the issues table always carry their INTEGER PRIMARY KEY id.
+        issue_ids = cast(list[int], [issue.id for issue in issues])
+        blockers_map = self.repo.get_blockers_for_issues(issue_ids)
 
         if as_json:
-            result = []
-            for issue in issues:
-                if issue.id is None:
-                    continue
-                blockers = self.repo.get_blockers(issue.id)
-                issue_dict = issue.to_dict()
-                issue_dict["blockers"] = [
-                    {"id": b.id, "title": b.title, "status": b.status.value} for b in blockers
+            return _dumps(
+                [
+                    {
+                        **issue.to_dict(),
+                        "blockers": [
+                            {"id": b.id, "title": b.title, "status": b.status._value_}
+                            for b in blockers_map.get(issue_id, [])
+                        ],
+                    }
+                    for issue, issue_id in zip(issues, issue_ids)
                 ]
-                result.append(issue_dict)
-            return json.dumps(result, indent=2)
+            )
         else:
             if not issues:
                 return "No blocked issues found."
 
-            lines = [f"Found {len(issues)} blocked issue(s):\n"]
-            for issue in issues:
-                if issue.id is None:
-                    continue
-                blockers = self.repo.get_blockers(issue.id)
-                blocker_ids = ", ".join([f"#{b.id}" for b in blockers])
-                lines.append(
-                    f"Issue #{issue.id}: {issue.title} "
-                    f"[{issue.status.value}, {issue.priority.value}]"
-                )
-                lines.append(f"  Blocked by: {blocker_ids}")
-                lines.append("")
-
-            return "\n".join(lines)
+            # Every list in blockers_map holds at least one blocker, so the
+            # leading "#" always has an id to go with.
+            blocker_ids = {
+                issue_id: "#" + ", #".join([str(b.id) for b in blockers])
+                for issue_id, blockers in blockers_map.items()
+            }
+            # One entry per issue: its line, its blockers and a blank separator.
+            blocks = [
+                f"Issue #{issue_id}: {issue.title} "
+                f"[{issue.status._value_}, {issue.priority._value_}]\n"
+                f"  Blocked by: {blocker_ids[issue_id]}\n"
+                for issue, issue_id in zip(issues, issue_ids)
+            ]
+            return "\n".join([f"Found {len(issues)} blocked issue(s):\n", *blocks])
 
     # Code Reference Methods
     def attach_code_reference(
@@ -1808,7 +2346,7 @@ class CLI:
         )
 
         if as_json:
-            return json.dumps(ref.to_dict(), indent=2)
+            return _dumps(ref.to_dict())
         else:
             lines = ["Code reference added:"]
             lines.append(f"  Issue: #{issue_id}")
@@ -1852,7 +2390,7 @@ class CLI:
         )
 
         if as_json:
-            return json.dumps({"removed_count": count}, indent=2)
+            return _dumps({"removed_count": count})
         else:
             return f"Removed {count} code reference(s) from issue #{issue_id}"
 
@@ -1869,20 +2407,21 @@ class CLI:
         refs = self.repo.get_code_references(issue_id)
 
         if as_json:
-            return json.dumps([ref.to_dict() for ref in refs], indent=2)
+            return _dumps([ref.to_dict() for ref in refs])
         else:
             if not refs:
                 return "No code references found."
 
             lines = [f"Code references for issue #{issue_id}:"]
+            lines_append = lines.append
             for ref in refs:
-                lines.append(f"\n  File: {ref.file_path}")
+                lines_append(f"\n  File: {ref.file_path}")
                 if ref.start_line and ref.end_line:
-                    lines.append(f"  Lines: {ref.start_line}-{ref.end_line}")
+                    lines_append(f"  Lines: {ref.start_line}-{ref.end_line}")
                 elif ref.start_line:
-                    lines.append(f"  Line: {ref.start_line}")
+                    lines_append(f"  Line: {ref.start_line}")
                 if ref.note:
-                    lines.append(f"  Note: {ref.note}")
+                    lines_append(f"  Note: {ref.note}")
             return "\n".join(lines)
 
     def list_affected_issues(self, file_path: str, as_json: bool = False) -> str:
@@ -1898,17 +2437,17 @@ class CLI:
         issues = self.repo.get_issues_by_file(file_path)
 
         if as_json:
-            return json.dumps([issue.to_dict() for issue in issues], indent=2)
+            return _dumps([issue.to_dict() for issue in issues])
         else:
             if not issues:
                 return f"No issues found referencing {file_path}"
 
             lines = [f"Issues referencing {file_path}:"]
-            for issue in issues:
-                lines.append(
-                    f"  - Issue #{issue.id}: {issue.title} "
-                    f"[{issue.status.value}, {issue.priority.value}]"
-                )
+            lines += [
+                f"  - Issue #{issue.id}: {issue.title} "
+                f"[{issue.status._value_}, {issue.priority._value_}]"
+                for issue in issues
+            ]
             return "\n".join(lines)
 
     # Bulk Pattern Methods
@@ -1919,6 +2458,7 @@ class CLI:
         use_regex: bool = False,
         dry_run: bool = False,
         as_json: bool = False,
+        out: Optional[TextIO] = None,
     ) -> str:
         """Close issues matching a pattern.
 
@@ -1928,9 +2468,11 @@ class CLI:
             use_regex: If True, patterns are regex; if False, glob patterns.
             dry_run: If True, only show what would be done.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
         closed = self.repo.bulk_close_by_pattern(
             title_pattern=title_pattern,
@@ -1945,19 +2487,7 @@ class CLI:
         else:
             message = f"Closed {count} issue(s)"
 
-        if as_json:
-            result = {
-                "count": count,
-                "message": message,
-                "issues": [issue.to_dict() for issue in closed],
-            }
-            return json.dumps(result, indent=2)
-        else:
-            lines = [message]
-            if closed:
-                for issue in closed:
-                    lines.append(f"  - Issue #{issue.id}: {issue.title}")
-            return "\n".join(lines)
+        return self._format_bulk_pattern_output(message, closed, as_json, out)
 
     def bulk_update_pattern(
         self,
@@ -1968,6 +2498,7 @@ class CLI:
         new_priority: Optional[str] = None,
         dry_run: bool = False,
         as_json: bool = False,
+        out: Optional[TextIO] = None,
     ) -> str:
         """Update issues matching a pattern.
 
@@ -1979,9 +2510,11 @@ class CLI:
             new_priority: New priority to set.
             dry_run: If True, only show what would be done.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
         """
         updated = self.repo.bulk_update_by_pattern(
             title_pattern=title_pattern,
@@ -1998,19 +2531,7 @@ class CLI:
         else:
             message = f"Updated {count} issue(s)"
 
-        if as_json:
-            result = {
-                "count": count,
-                "message": message,
-                "issues": [issue.to_dict() for issue in updated],
-            }
-            return json.dumps(result, indent=2)
-        else:
-            lines = [message]
-            if updated:
-                for issue in updated:
-                    lines.append(f"  - Issue #{issue.id}: {issue.title}")
-            return "\n".join(lines)
+        return self._format_bulk_pattern_output(message, updated, as_json, out)
 
     def bulk_delete_pattern(
         self,
@@ -2020,6 +2541,7 @@ class CLI:
         confirm: bool = False,
         dry_run: bool = False,
         as_json: bool = False,
+        out: Optional[TextIO] = None,
     ) -> str:
         """Delete issues matching a pattern.
 
@@ -2030,9 +2552,11 @@ class CLI:
             confirm: Must be True to actually delete (unless dry_run is True).
             dry_run: If True, only show what would be done.
             as_json: Output as JSON.
+            out: If given, stream the output to this text stream instead of
+                returning it.
 
         Returns:
-            Formatted output.
+            Formatted output, or an empty string if it was written to out.
 
         Raises:
             ValueError: If confirm is False and dry_run is False.
@@ -2053,28 +2577,51 @@ class CLI:
         else:
             message = f"Deleted {count} issue(s)"
 
-        if as_json:
-            result = {
-                "count": count,
-                "message": message,
-                "issues": [issue.to_dict() for issue in deleted],
-            }
-            return json.dumps(result, indent=2)
-        else:
-            lines = [message]
-            if deleted:
-                for issue in deleted:
-                    lines.append(f"  - Issue #{issue.id}: {issue.title}")
-            return "\n".join(lines)
+        return self._format_bulk_pattern_output(message, deleted, as_json, out)
 
 
-def main() -> None:
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(
-        prog="issuedb-cli",
-        description="Command-line issue tracking system for software development projects",
-    )
+def _format_bulk_pattern_result(message: str, issues: list[Issue]) -> str:
+    """Format the text output of a bulk pattern command.
+
+    Args:
+        message: Summary line.
+        issues: Issues the command matched.
+
+    Returns:
+        Summary line followed by one line per issue.
+    """
+    return "\n".join([message, *[f"  - Issue #{issue.id}: {issue.title}" for issue in issues]])
+
 
+@contextlib.contextmanager
+def _read_json_input(args: argparse.Namespace) -> Iterator[Union[str, BinaryIO]]:
+    """Get the JSON input of a bulk command from --data, --file or stdin.
+
+    Files and stdin are handed over as binary streams, so the parser reads
+    raw bytes without an intermediate str copy, and NDJSON input one line
+    at a time.
+
+    Args:
+        args: Parsed command-line arguments with data and file attributes.
+
+    Yields:
+        JSON document as text, or a binary stream to parse.
+    """
+    if args.data:
+        yield args.data
+    elif args.file:
+        with open(args.file, "rb") as f:
+            yield f
+    else:
+        yield sys.stdin.buffer
+
+
+def _add_global_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that apply to every invocation.
+
+    Args:
+        parser: Parser to add the options to.
+    """
     parser.add_argument(
         "--db",
         help="Path to database file (default: ~/.issuedb/issuedb.sqlite)",
@@ -2122,7 +2669,56 @@ def main() -> None:
         "Example: issuedb-cli --ollama-model llama3 --ollama create a high priority bug",
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+def _build_global_parser() -> argparse.ArgumentParser:
+    """Build a parser that only knows the global options.
+
+    Used to spot --prompt and --ollama before the full parser is built.
+
+    Returns:
+        Parser without help or subcommands.
+    """
+    parser = argparse.ArgumentParser(prog="issuedb-cli", add_help=False)
+    _add_global_arguments(parser)
+    return parser
+
+
+def _build_parser(argv: Optional[list[str]] = None) -> argparse.ArgumentParser:
+    """Get the full issuedb-cli argument parser for a command line.
+
+    Args:
+        argv: Command-line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        Configured argument parser, shared by every invocation in this process
+        that needs the same git subcommands.
+    """
+    # Strip the global options first so that an option value, as in
+    # "--db links", is not mistaken for the command.
+    _, extras = _build_global_parser().parse_known_args(argv)
+    return _build_parser_for(git_parser_names(extras))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_parser_for(git_names: tuple[str, ...]) -> argparse.ArgumentParser:
+    """Build the full issuedb-cli argument parser with every subcommand.
+
+    Parsing does not modify the parser, so one instance is built per set of
+    git subcommands and reused by later calls to main() in the same process.
+
+    Args:
+        git_names: Git subcommands to register, see git_parser_names.
+
+    Returns:
+        Configured argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="issuedb-cli",
+        description="Command-line issue tracking system for software development projects",
+    )
+    _add_global_arguments(parser)
+
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Available commands")
 
     # Create command
     create_parser = subparsers.add_parser("create", help="Create a new issue")
@@ -2176,7 +2772,9 @@ def main() -> None:
 
     # Memory commands
     memory_parser = subparsers.add_parser("memory", help="Manage memory")
-    memory_subparsers = memory_parser.add_subparsers(dest="memory_command", help="Memory commands")
+    memory_subparsers = memory_parser.add_subparsers(
+        dest="memory_command", required=True, help="Memory commands"
+    )
 
     mem_add = memory_subparsers.add_parser("add", help="Add memory item")
     mem_add.add_argument("key", help="Memory key")
@@ -2197,7 +2795,9 @@ def main() -> None:
 
     # Lesson commands
     lesson_parser = subparsers.add_parser("lesson", help="Manage lessons learned")
-    lesson_subparsers = lesson_parser.add_subparsers(dest="lesson_command", help="Lesson commands")
+    lesson_subparsers = lesson_parser.add_subparsers(
+        dest="lesson_command", required=True, help="Lesson commands"
+    )
 
     les_add = lesson_subparsers.add_parser("add", help="Add lesson")
     les_add.add_argument("lesson", help="Lesson text")
@@ -2210,7 +2810,9 @@ def main() -> None:
 
     # Tag commands
     tag_parser = subparsers.add_parser("tag", help="Manage tags")
-    tag_subparsers = tag_parser.add_subparsers(dest="tag_command", help="Tag commands")
+    tag_subparsers = tag_parser.add_subparsers(
+        dest="tag_command", required=True, help="Tag commands"
+    )
 
     tag_subparsers.add_parser("list", help="List tags")
 
@@ -2224,7 +2826,9 @@ def main() -> None:
 
     # Link commands
     link_parser = subparsers.add_parser("link", help="Manage issue links")
-    link_subparsers = link_parser.add_subparsers(dest="link_command", help="Link commands")
+    link_subparsers = link_parser.add_subparsers(
+        dest="link_command", required=True, help="Link commands"
+    )
 
     link_add = link_subparsers.add_parser("add", help="Link issues")
     link_add.add_argument("source", type=int, help="Source Issue ID")
@@ -2319,7 +2923,7 @@ def main() -> None:
     bulk_create_parser.add_argument(
         "-f",
         "--file",
-        help="JSON file path (if not provided, reads from stdin)",
+        help="JSON or NDJSON file path (if not provided, reads from stdin)",
     )
     bulk_create_parser.add_argument(
         "-d",
@@ -2334,7 +2938,7 @@ def main() -> None:
     bulk_update_json_parser.add_argument(
         "-f",
         "--file",
-        help="JSON file path (if not provided, reads from stdin)",
+        help="JSON or NDJSON file path (if not provided, reads from stdin)",
     )
     bulk_update_json_parser.add_argument(
         "-d",
@@ -2349,7 +2953,7 @@ def main() -> None:
     bulk_close_parser.add_argument(
         "-f",
         "--file",
-        help="JSON file path (if not provided, reads from stdin)",
+        help="JSON or NDJSON file path (if not provided, reads from stdin)",
     )
     bulk_close_parser.add_argument(
         "-d",
@@ -2357,6 +2961,44 @@ def main() -> None:
         help="JSON data as string",
     )
 
+    # Bulk pattern commands
+    bulk_close_pattern_parser = subparsers.add_parser(
+        "bulk-close-pattern", help="Close issues matching a pattern"
+    )
+    bulk_update_pattern_parser = subparsers.add_parser(
+        "bulk-update-pattern", help="Update issues matching a pattern"
+    )
+    bulk_delete_pattern_parser = subparsers.add_parser(
+        "bulk-delete-pattern", help="Delete issues matching a pattern"
+    )
+    for pattern_parser in (
+        bulk_close_pattern_parser,
+        bulk_update_pattern_parser,
+        bulk_delete_pattern_parser,
+    ):
+        pattern_parser.add_argument("--title", help="Pattern to match against title")
+        pattern_parser.add_argument("--desc", help="Pattern to match against description")
+        pattern_parser.add_argument(
+            "--regex", action="store_true", help="Treat patterns as regex (default: glob)"
+        )
+        pattern_parser.add_argument(
+            "--dry-run", action="store_true", help="Preview without making changes"
+        )
+    bulk_update_pattern_parser.add_argument(
+        "-s",
+        "--status",
+        choices=["open", "in-progress", "closed", "wont-do"],
+        help="New status",
+    )
+    bulk_update_pattern_parser.add_argument(
+        "--priority",
+        choices=["low", "medium", "high", "critical"],
+        help="New priority",
+    )
+    bulk_delete_pattern_parser.add_argument(
+        "--confirm", action="store_true", help="Required unless using --dry-run"
+    )
+
     # Comment command
     comment_parser = subparsers.add_parser("comment", help="Add a comment to an issue")
     comment_parser.add_argument("issue_id", type=int, help="Issue ID")
@@ -2454,8 +3096,6 @@ def main() -> None:
         help="Enable debug mode",
     )
 
-    args = parser.parse_args()
-
     # Find-similar command
     find_similar_parser = subparsers.add_parser(
         "find-similar", help="Find issues similar to given text"
@@ -2486,328 +3126,457 @@ def main() -> None:
         help="Similarity threshold for duplicates (0.0 to 1.0, default: 0.7)",
     )
 
-    # Handle --prompt flag
-    if args.prompt:
-        from pathlib import Path
+    # Each command's parser carries its handler, so main() calls
+    # args.handler without looking the command name up again.
+    for name, handler in _COMMANDS.items():
+        subparsers.choices[name].set_defaults(handler=handler)
+    group_subparsers = {
+        "memory": memory_subparsers,
+        "lesson": lesson_subparsers,
+        "tag": tag_subparsers,
+        "link": link_subparsers,
+    }
+    for group, handlers in _SUBCOMMANDS.items():
+        for name, handler in handlers.items():
+            group_subparsers[group].choices[name].set_defaults(handler=handler)
+
+    # Git commands (git-link/unlink/links/linked/git-scan/git-status)
+    register_git_parsers(subparsers, names=git_names)
+
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _prompt_text() -> Optional[str]:
+    """Read the LLM agent prompt once per process.
+
+    Returns:
+        Contents of PROMPT.txt, or None if the file is missing.
+    """
+    try:
+        return _PROMPT_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
 
-        # Get the prompt file path
-        package_dir = Path(__file__).parent
-        prompt_file = package_dir / "data" / "agents" / "PROMPT.txt"
 
-        if prompt_file.exists():
-            print(prompt_file.read_text(), file=sys.stdout, flush=True)
-        else:
-            print(f"Error: Prompt file not found at {prompt_file}", file=sys.stderr, flush=True)
-            sys.exit(1)
-        sys.exit(0)
+def _run_prompt() -> None:
+    """Print the LLM agent prompt and exit (--prompt)."""
+    prompt_text = _prompt_text()
+    if prompt_text is None:
+        print(f"Error: Prompt file not found at {_PROMPT_FILE}", file=sys.stderr, flush=True)
+        sys.exit(1)
+
+    _emit(prompt_text)
+    # Flush here, inside main()'s BrokenPipeError handling, rather than at exit.
+    sys.stdout.flush()
+    sys.exit(0)
 
-    # Handle --ollama flag
+
+def _run_ollama(args: argparse.Namespace) -> None:
+    """Hand a natural language request to Ollama and exit (--ollama).
+
+    Args:
+        args: Parsed command-line arguments.
+    """
+    from issuedb.ollama_client import handle_ollama_request
+
+    # Join the list of words into a single request string
+    user_request = " ".join(args.ollama)
+
+    if not user_request.strip():
+        print("Error: No request provided for --ollama", file=sys.stderr)
+        sys.exit(1)
+
+    prompt_text = _prompt_text()
+    if prompt_text is None:
+        print(f"Error: Prompt file not found at {_PROMPT_FILE}", file=sys.stderr)
+        sys.exit(1)
+
+    # Handle Ollama request
+    exit_code = handle_ollama_request(
+        user_request=user_request,
+        prompt_text=prompt_text,
+        host=args.ollama_host,
+        port=args.ollama_port,
+        model=args.ollama_model,
+    )
+    sys.exit(exit_code)
+
+
+def _run_fast_path(args: argparse.Namespace) -> None:
+    """Handle --prompt or --ollama, which exit without running a subcommand.
+
+    Args:
+        args: Parsed command-line arguments.
+    """
+    if args.prompt:
+        _run_prompt()
     if args.ollama:
-        from pathlib import Path
+        _run_ollama(args)
+
 
-        from issuedb.ollama_client import handle_ollama_request
+# Command handlers return the text to print, or None when they wrote their
+# output themselves.
+_CommandHandler = Callable[[CLI, argparse.Namespace], Optional[str]]
 
-        # Join the list of words into a single request string
-        user_request = " ".join(args.ollama)
 
-        if not user_request.strip():
-            print("Error: No request provided for --ollama", file=sys.stderr)
-            sys.exit(1)
+def _cmd_create(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.create_issue(
+        title=args.title,
+        description=args.description,
+        priority=args.priority,
+        status=args.status,
+        due_date=args.due_date,
+        as_json=args.json,
+    )
+
 
-        # Get the prompt file path
-        package_dir = Path(__file__).parent
-        prompt_file = package_dir / "data" / "agents" / "PROMPT.txt"
+def _cmd_list(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    cli.list_issues(
+        status=args.status,
+        priority=args.priority,
+        limit=args.limit,
+        due_date=args.due_date,
+        tag=args.tag,
+        as_json=args.json,
+        out=sys.stdout,
+    )
+    return None
 
-        if not prompt_file.exists():
-            print(f"Error: Prompt file not found at {prompt_file}", file=sys.stderr)
-            sys.exit(1)
 
-        prompt_text = prompt_file.read_text()
+def _cmd_get(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_issue(args.id, as_json=args.json)
 
-        # Handle Ollama request
-        exit_code = handle_ollama_request(
-            user_request=user_request,
-            prompt_text=prompt_text,
-            host=args.ollama_host,
-            port=args.ollama_port,
-            model=args.ollama_model,
-        )
-        sys.exit(exit_code)
 
-    if not args.command:
-        parser.print_help()
+def _cmd_update(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    updates = {}
+    if args.title:
+        updates["title"] = args.title
+    if args.description:
+        updates["description"] = args.description
+    if args.priority:
+        updates["priority"] = args.priority
+    if args.status:
+        updates["status"] = args.status
+    if args.due_date:
+        updates["due_date"] = args.due_date
+
+    if not updates:
+        print("Error: No updates specified", file=sys.stderr, flush=True)
         sys.exit(1)
 
-    try:
-        cli = CLI(args.db)
+    return cli.update_issue(args.id, as_json=args.json, **updates)
 
-        if args.command == "create":
-            result = cli.create_issue(
-                title=args.title,
-                description=args.description,
-                priority=args.priority,
-                status=args.status,
-                due_date=args.due_date,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "list":
-            result = cli.list_issues(
-                status=args.status,
-                priority=args.priority,
-                limit=args.limit,
-                due_date=args.due_date,
-                tag=args.tag,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "get":
-            result = cli.get_issue(args.id, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "update":
-            updates = {}
-            if args.title:
-                updates["title"] = args.title
-            if args.description:
-                updates["description"] = args.description
-            if args.priority:
-                updates["priority"] = args.priority
-            if args.status:
-                updates["status"] = args.status
-            if args.due_date:
-                updates["due_date"] = args.due_date
-
-            if not updates:
-                print("Error: No updates specified", file=sys.stderr, flush=True)
-                sys.exit(1)
-
-            result = cli.update_issue(args.id, as_json=args.json, **updates)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "memory":
-            if not args.memory_command:
-                parser.parse_args(["memory", "--help"])
-
-            if args.memory_command == "add":
-                result = cli.memory_add(args.key, args.value, args.category, args.json)
-                print(result, file=sys.stdout, flush=True)
-            elif args.memory_command == "list":
-                result = cli.memory_list(args.category, args.search, args.json)
-                print(result, file=sys.stdout, flush=True)
-            elif args.memory_command == "update":
-                result = cli.memory_update(args.key, args.value, args.category, args.json)
-                print(result, file=sys.stdout, flush=True)
-            elif args.memory_command == "delete":
-                print(cli.memory_delete(args.key, args.json), file=sys.stdout, flush=True)
-
-        elif args.command == "lesson":
-            if not args.lesson_command:
-                parser.parse_args(["lesson", "--help"])
-
-            if args.lesson_command == "add":
-                result = cli.lesson_add(args.lesson, args.issue_id, args.category, args.json)
-                print(result, file=sys.stdout, flush=True)
-            elif args.lesson_command == "list":
-                result = cli.lesson_list(args.issue_id, args.category, args.json)
-                print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "tag":
-            if not args.tag_command:
-                parser.parse_args(["tag", "--help"])
-
-            if args.tag_command == "list":
-                print(cli.tag_list(args.json), file=sys.stdout, flush=True)
-            elif args.tag_command == "add":
-                result = cli.tag_issue(args.issue_id, args.tags, args.json)
-                print(result, file=sys.stdout, flush=True)
-            elif args.tag_command == "remove":
-                result = cli.untag_issue(args.issue_id, args.tags, args.json)
-                print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "link":
-            if not args.link_command:
-                parser.parse_args(["link", "--help"])
-
-            if args.link_command == "add":
-                result = cli.link_issues(args.source, args.target, args.type, args.json)
-                print(result, file=sys.stdout, flush=True)
-            elif args.link_command == "remove":
-                result = cli.unlink_issues(args.source, args.target, args.type, args.json)
-                print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "bulk-update":
-            if not args.status and not args.priority:
-                msg = "Error: No updates specified (use -s or --priority)"
-                print(msg, file=sys.stderr, flush=True)
-                sys.exit(1)
-
-            result = cli.bulk_update_issues(
-                new_status=args.status,
-                new_priority=args.priority,
-                filter_status=args.filter_status,
-                filter_priority=args.filter_priority,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "delete":
-            result = cli.delete_issue(args.id, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
+def _cmd_memory_add(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.memory_add(args.key, args.value, args.category, args.json)
 
-        elif args.command == "get-next":
-            result = cli.get_next_issue(status=args.status, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "get-last":
-            result = cli.get_last_fetched(limit=args.number, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
+def _cmd_memory_list(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.memory_list(args.category, args.search, args.json)
 
-        elif args.command == "search":
-            result = cli.search_issues(
-                keyword=args.keyword,
-                limit=args.limit,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "clear":
-            result = cli.clear_all(confirm=args.confirm, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "audit":
-            result = cli.get_audit_logs(issue_id=args.issue, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "info":
-            result = cli.get_info(as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "summary":
-            result = cli.get_summary(as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "report":
-            result = cli.get_report(group_by=args.group_by, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "bulk-create":
-            # Get JSON input from file, data arg, or stdin
-            json_input = None
-            if args.data:
-                json_input = args.data
-            elif args.file:
-                with open(args.file) as f:
-                    json_input = f.read()
-            else:
-                # Read from stdin
-                json_input = sys.stdin.read()
-
-            result = cli.bulk_create(json_input, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "bulk-update-json":
-            # Get JSON input from file, data arg, or stdin
-            json_input = None
-            if args.data:
-                json_input = args.data
-            elif args.file:
-                with open(args.file) as f:
-                    json_input = f.read()
-            else:
-                # Read from stdin
-                json_input = sys.stdin.read()
-
-            result = cli.bulk_update_json(json_input, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
-
-        elif args.command == "bulk-close":
-            # Get JSON input from file, data arg, or stdin
-            json_input = None
-            if args.data:
-                json_input = args.data
-            elif args.file:
-                with open(args.file) as f:
-                    json_input = f.read()
-            else:
-                # Read from stdin
-                json_input = sys.stdin.read()
 
-            result = cli.bulk_close(json_input, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
+def _cmd_memory_update(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.memory_update(args.key, args.value, args.category, args.json)
 
-        elif args.command == "comment":
-            result = cli.add_comment(args.issue_id, args.text, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "list-comments":
-            result = cli.list_comments(args.issue_id, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
+def _cmd_memory_delete(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.memory_delete(args.key, args.json)
 
-        elif args.command == "delete-comment":
-            result = cli.delete_comment(args.comment_id, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "context":
-            result = cli.get_issue_context(
-                args.issue_id,
-                as_json=args.json,
-                compact=args.compact,
-            )
-            print(result, file=sys.stdout, flush=True)
+def _cmd_lesson_add(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.lesson_add(args.lesson, args.issue_id, args.category, args.json)
 
-        elif args.command == "block":
-            result = cli.block_issue(
-                issue_id=args.issue_id,
-                blocker_id=args.blocker_id,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "unblock":
-            result = cli.unblock_issue(
-                issue_id=args.issue_id,
-                blocker_id=args.blocker_id,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
+def _cmd_lesson_list(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.lesson_list(args.issue_id, args.category, args.json)
 
-        elif args.command == "deps":
-            result = cli.show_dependencies(
-                issue_id=args.issue_id,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "blocked":
-            result = cli.list_blocked_issues(
-                status=args.status,
-                as_json=args.json,
-            )
-            print(result, file=sys.stdout, flush=True)
+def _cmd_tag_list(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.tag_list(args.json)
+
+
+def _cmd_tag_add(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.tag_issue(args.issue_id, args.tags, args.json)
+
+
+def _cmd_tag_remove(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.untag_issue(args.issue_id, args.tags, args.json)
+
+
+def _cmd_link_add(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.link_issues(args.source, args.target, args.type, args.json)
+
+
+def _cmd_link_remove(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.unlink_issues(args.source, args.target, args.type, args.json)
+
+
+def _cmd_bulk_update(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.bulk_update_issues(
+        new_status=args.status,
+        new_priority=args.priority,
+        filter_status=args.filter_status,
+        filter_priority=args.filter_priority,
+        as_json=args.json,
+    )
+
+
+def _cmd_delete(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.delete_issue(args.id, as_json=args.json)
+
+
+def _cmd_get_next(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_next_issue(status=args.status, as_json=args.json)
+
+
+def _cmd_get_last(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_last_fetched(limit=args.number, as_json=args.json)
+
+
+def _cmd_search(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    cli.search_issues(
+        keyword=args.keyword,
+        limit=args.limit,
+        as_json=args.json,
+        out=sys.stdout,
+    )
+    return None
+
+
+def _cmd_clear(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.clear_all(confirm=args.confirm, as_json=args.json)
+
 
-        elif args.command == "workspace":
-            result = cli.workspace_status(as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
+def _cmd_audit(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    result = cli.get_audit_logs(issue_id=args.issue, as_json=args.json, out=sys.stdout)
+    return result or None
 
-        elif args.command == "start":
-            result = cli.start_issue_workspace(args.issue_id, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "stop":
-            result = cli.stop_issue_workspace(close=args.close, as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
+def _cmd_info(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_info(as_json=args.json)
 
-        elif args.command == "active":
-            result = cli.get_active_issue_workspace(as_json=args.json)
-            print(result, file=sys.stdout, flush=True)
 
-        elif args.command == "web":
-            from issuedb.web import run_server
+def _cmd_summary(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_summary(as_json=args.json)
 
-            run_server(host=args.host, port=args.port, debug=args.debug)
+
+def _cmd_report(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_report(group_by=args.group_by, as_json=args.json)
+
+
+def _cmd_bulk_create(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    with _read_json_input(args) as json_input:
+        cli.bulk_create(json_input, as_json=args.json, out=sys.stdout)
+    return None
+
+
+def _cmd_bulk_update_json(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    with _read_json_input(args) as json_input:
+        cli.bulk_update_json(json_input, as_json=args.json, out=sys.stdout)
+    return None
+
+
+def _cmd_bulk_close(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    with _read_json_input(args) as json_input:
+        cli.bulk_close(json_input, as_json=args.json, out=sys.stdout)
+    return None
+
+
+def _cmd_bulk_close_pattern(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    cli.bulk_close_pattern(
+        title_pattern=args.title,
+        desc_pattern=args.desc,
+        use_regex=args.regex,
+        dry_run=args.dry_run,
+        as_json=args.json,
+        out=sys.stdout,
+    )
+    return None
+
+
+def _cmd_bulk_update_pattern(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    cli.bulk_update_pattern(
+        title_pattern=args.title,
+        desc_pattern=args.desc,
+        use_regex=args.regex,
+        new_status=args.status,
+        new_priority=args.priority,
+        dry_run=args.dry_run,
+        as_json=args.json,
+        out=sys.stdout,
+    )
+    return None
+
+
+def _cmd_bulk_delete_pattern(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    cli.bulk_delete_pattern(
+        title_pattern=args.title,
+        desc_pattern=args.desc,
+        use_regex=args.regex,
+        confirm=args.confirm,
+        dry_run=args.dry_run,
+        as_json=args.json,
+        out=sys.stdout,
+    )
+    return None
+
+
+def _cmd_comment(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.add_comment(args.issue_id, args.text, as_json=args.json)
+
+
+def _cmd_list_comments(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    result = cli.list_comments(args.issue_id, as_json=args.json, out=sys.stdout)
+    return result or None
+
+
+def _cmd_delete_comment(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.delete_comment(args.comment_id, as_json=args.json)
+
+
+def _cmd_context(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_issue_context(args.issue_id, as_json=args.json, compact=args.compact)
+
+
+def _cmd_block(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.block_issue(issue_id=args.issue_id, blocker_id=args.blocker_id, as_json=args.json)
+
+
+def _cmd_unblock(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.unblock_issue(issue_id=args.issue_id, blocker_id=args.blocker_id, as_json=args.json)
+
+
+def _cmd_deps(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.show_dependencies(issue_id=args.issue_id, as_json=args.json)
+
+
+def _cmd_blocked(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.list_blocked_issues(status=args.status, as_json=args.json)
+
+
+def _cmd_workspace(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.workspace_status(as_json=args.json)
+
+
+def _cmd_start(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.start_issue_workspace(args.issue_id, as_json=args.json)
+
+
+def _cmd_stop(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.stop_issue_workspace(close=args.close, as_json=args.json)
+
+
+def _cmd_active(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.get_active_issue_workspace(as_json=args.json)
+
+
+def _cmd_find_similar(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.find_similar_issues(
+        args.query,
+        threshold=args.threshold,
+        limit=args.limit,
+        as_json=args.json,
+    )
+
+
+def _cmd_dedupe(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    return cli.find_duplicates(threshold=args.threshold, as_json=args.json)
+
+
+def _cmd_web(cli: CLI, args: argparse.Namespace) -> Optional[str]:
+    from issuedb.web import run_server
+
+    run_server(host=args.host, port=args.port, debug=args.debug)
+    return None
+
+
+_COMMANDS: dict[str, _CommandHandler] = {
+    "create": _cmd_create,
+    "list": _cmd_list,
+    "get": _cmd_get,
+    "update": _cmd_update,
+    "bulk-update": _cmd_bulk_update,
+    "delete": _cmd_delete,
+    "get-next": _cmd_get_next,
+    "get-last": _cmd_get_last,
+    "search": _cmd_search,
+    "clear": _cmd_clear,
+    "audit": _cmd_audit,
+    "info": _cmd_info,
+    "summary": _cmd_summary,
+    "report": _cmd_report,
+    "bulk-create": _cmd_bulk_create,
+    "bulk-update-json": _cmd_bulk_update_json,
+    "bulk-close": _cmd_bulk_close,
+    "bulk-close-pattern": _cmd_bulk_close_pattern,
+    "bulk-update-pattern": _cmd_bulk_update_pattern,
+    "bulk-delete-pattern": _cmd_bulk_delete_pattern,
+    "comment": _cmd_comment,
+    "list-comments": _cmd_list_comments,
+    "delete-comment": _cmd_delete_comment,
+    "context": _cmd_context,
+    "block": _cmd_block,
+    "unblock": _cmd_unblock,
+    "deps": _cmd_deps,
+    "blocked": _cmd_blocked,
+    "workspace": _cmd_workspace,
+    "start": _cmd_start,
+    "stop": _cmd_stop,
+    "active": _cmd_active,
+    "find-similar": _cmd_find_similar,
+    "dedupe": _cmd_dedupe,
+    "web": _cmd_web,
+}
+
+# Commands with their own subcommands, and the handler of each subcommand.
+_SUBCOMMANDS: dict[str, dict[str, _CommandHandler]] = {
+    "memory": {
+        "add": _cmd_memory_add,
+        "list": _cmd_memory_list,
+        "update": _cmd_memory_update,
+        "delete": _cmd_memory_delete,
+    },
+    "lesson": {"add": _cmd_lesson_add, "list": _cmd_lesson_list},
+    "tag": {"list": _cmd_tag_list, "add": _cmd_tag_add, "remove": _cmd_tag_remove},
+    "link": {"add": _cmd_link_add, "remove": _cmd_link_remove},
+}
+
+
+def main() -> None:
+    """Main entry point for the CLI."""
+    global _PRETTY_JSON
+
+    try:
+        # --prompt and --ollama never need the subcommands, so try them against
+        # the global options alone and only build the full parser otherwise.
+        fast_args, extras = _build_global_parser().parse_known_args()
+        if not extras:
+            _run_fast_path(fast_args)
+
+        args = _build_parser_for(git_parser_names(extras)).parse_args()
+        _run_fast_path(args)
+
+        _PRETTY_JSON = sys.stdout.isatty()
+
+        if dispatch_git_command(args):
+            return
+
+        cli = CLI(args.db)
+        atexit.register(cli.close)
+
+        handler: _CommandHandler = args.handler
+        result = handler(cli, args)
+        if result is not None:
+            _emit(result)
+
+        sys.stdout.flush()
+
+    except BrokenPipeError:
+        # The reader went away, as with "issuedb-cli list | head". Point stdout
+        # at devnull so the flush at interpreter exit doesn't fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr, flush=True)
@@ -7,6 +7,29 @@ import threading
 from pathlib import Path
 from typing import Any, Generator, Optional
 
+# Default SQLITE_MAX_VARIABLE_NUMBER on SQLite builds before 3.32. Queries
+# binding a list of IDs are split into batches of at most this many.
+MAX_SQL_VARIABLES = 999
+
+
+def _same_file(current: Path, db_path: str) -> bool:
+    """Tell whether db_path names the database file at current.
+
+    Identical strings, the usual case of a repeated --db value, are compared
+    without touching the filesystem. Otherwise both paths are resolved, so
+    spellings such as "x.db", "./x.db" and the absolute path match.
+
+    Args:
+        current: Path of the open database.
+        db_path: Requested database path.
+
+    Returns:
+        True if both refer to the same file.
+    """
+    if str(current) == db_path:
+        return True
+    return current.resolve() == Path(db_path).resolve()
+
 
 class DatabaseMeta(type):
     """Singleton metaclass for Database.
@@ -17,11 +40,13 @@ class DatabaseMeta(type):
     _instance: Optional["Database"] = None
 
     def __call__(cls, db_path: Optional[str] = None) -> "Database":
-        # Create new instance if none exists or if a different path is provided
-        if cls._instance is None or (db_path and str(cls._instance.db_path) != db_path):
-            cls._instance = super().__call__(db_path)
+        # Create new instance if none exists or if a different file is requested,
+        # so another spelling of the current path does not re-run initialization
+        instance = cls._instance
+        if instance is None or (db_path and not _same_file(instance.db_path, db_path)):
+            instance = cls._instance = super().__call__(db_path)
 
-        return cls._instance
+        return instance
 
 
 class Database(metaclass=DatabaseMeta):
@@ -438,10 +463,13 @@ class Database(metaclass=DatabaseMeta):
         if conn is None:
             # Create new connection for this thread
             # check_same_thread=False is safe because we use thread-local storage
+            # A larger statement cache keeps prepared statements for the many
+            # distinct queries (including IN-list variants) alive across calls
             conn = sqlite3.connect(
                 str(self.db_path),
                 timeout=30.0,
                 check_same_thread=False,
+                cached_statements=512,
             )
             conn.row_factory = sqlite3.Row
 
@@ -450,11 +478,12 @@ class Database(metaclass=DatabaseMeta):
             conn.execute("PRAGMA busy_timeout = 30000")
             conn.execute("PRAGMA cache_size = 10000")
             conn.execute("PRAGMA temp_store = MEMORY")
+            # synchronous is per connection, unlike journal_mode below
+            conn.execute("PRAGMA synchronous = NORMAL")
 
             # Set WAL mode (persists in database file, but we set it to be sure)
             if not self._wal_initialized:
                 conn.execute("PRAGMA journal_mode = WAL")
-                conn.execute("PRAGMA synchronous = NORMAL")
                 self._wal_initialized = True
 
             self._local.connection = conn
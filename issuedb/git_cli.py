@@ -1,6 +1,9 @@
 """Git integration CLI methods for IssueDB."""
 
+import functools
 import json
+import os
+from pathlib import Path
 from typing import Any, Optional
 
 from issuedb.git_repository import GitLinkRepository
@@ -12,6 +15,63 @@ from issuedb.git_utils import (
 )
 
 
+def _head_mtime_ns(cwd: str) -> int:
+    """Return the mtime of the enclosing repository's HEAD file, or 0 if none is found.
+
+    A .git file, as used by linked worktrees and submodules, is followed to
+    the git directory named by its "gitdir:" line.
+
+    Args:
+        cwd: Directory to start searching from.
+
+    Returns:
+        Modification time of the repository's HEAD in nanoseconds.
+    """
+    path = Path(cwd)
+    for directory in (path, *path.parents):
+        git_path = directory / ".git"
+        try:
+            if git_path.is_file():
+                content = git_path.read_text(encoding="utf-8").strip()
+                if not content.startswith("gitdir:"):
+                    continue
+                git_path = directory / content[len("gitdir:") :].strip()
+            return (git_path / "HEAD").stat().st_mtime_ns
+        except (OSError, UnicodeDecodeError):
+            continue
+    return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _git_status_snapshot(cwd: str, head_mtime_ns: int) -> dict[str, Any]:
+    """Collect git status for a directory, memoized per HEAD state.
+
+    The cache key includes the HEAD mtime. Checking out a branch rewrites
+    HEAD and so invalidates the cached result; a commit only moves the
+    branch ref, which leaves both cached fields unchanged.
+
+    Args:
+        cwd: Working directory the status was collected for.
+        head_mtime_ns: Modification time of the repository's HEAD (cache
+            key only).
+
+    Returns:
+        Dictionary with is_git_repo, current_branch and optional error.
+    """
+    result: dict[str, Any] = {
+        "is_git_repo": is_git_repo(cwd),
+        "current_branch": None,
+    }
+
+    if result["is_git_repo"]:
+        try:
+            result["current_branch"] = get_current_branch(cwd)
+        except GitError as e:
+            result["error"] = str(e)
+
+    return result
+
+
 class GitCLI:
     """Git integration CLI handler."""
 
@@ -23,6 +83,10 @@ class GitCLI:
         """
         self.repo = GitLinkRepository(db_path)
 
+    def close(self) -> None:
+        """Release the database connection held by this handler."""
+        self.repo.db.close_connection()
+
     def format_output(self, data: Any, as_json: bool = False) -> str:
         """Format output for display.
 
@@ -201,8 +265,8 @@ class GitCLI:
                 lines.append("-" * 50)
                 lines.append(f"ID: {issue.id}")
                 lines.append(f"Title: {issue.title}")
-                lines.append(f"Status: {issue.status.value}")
-                lines.append(f"Priority: {issue.priority.value}")
+                lines.append(f"Status: {issue.status._value_}")
+                lines.append(f"Priority: {issue.priority._value_}")
 
             return "\n".join(lines)
 
@@ -265,15 +329,6 @@ class GitCLI:
         Returns:
             Formatted output.
         """
-        result: dict[str, Any] = {
-            "is_git_repo": is_git_repo(),
-            "current_branch": None,
-        }
-
-        if result["is_git_repo"]:
-            try:
-                result["current_branch"] = get_current_branch()
-            except GitError as e:
-                result["error"] = str(e)
-
+        cwd = os.getcwd()
+        result = dict(_git_status_snapshot(cwd, _head_mtime_ns(cwd)))
         return self.format_output(result, as_json)
@@ -0,0 +1,281 @@
+"""Git subcommands for the issuedb-cli entry point.
+
+``register_git_parsers`` adds the git subparsers picked by ``git_parser_names``
+to the main parser and ``dispatch_git_command`` runs the parsed command.
+``issuedb.git_cli`` is only imported once a git command actually runs.
+"""
+
+import argparse
+import atexit
+import functools
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from issuedb.git_cli import GitCLI
+
+# Command names, interned so the parser choices, the git_command tag set on
+# args and the dispatch-table keys are the very same string objects.
+_CMD_LINK, _CMD_UNLINK, _CMD_LINKS, _CMD_LINKED, _CMD_GIT_SCAN, _CMD_GIT_STATUS = map(
+    sys.intern, ("git-link", "unlink", "links", "linked", "git-scan", "git-status")
+)
+
+# A bare hex string of abbreviated-to-full SHA-1 length is taken to be a commit.
+_SHA1_RE = re.compile(r"^[0-9a-f]{7,40}$")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_git_cli(db_path: Optional[str]) -> "GitCLI":
+    """Build one GitCLI per database path, importing issuedb.git_cli lazily.
+
+    Args:
+        db_path: Optional path to database file.
+
+    Returns:
+        Cached GitCLI instance, closed automatically at interpreter exit.
+    """
+    from issuedb.git_cli import GitCLI
+
+    git_cli = GitCLI(db_path)
+    atexit.register(git_cli.close)
+    return git_cli
+
+
+def _non_negative_int(value: str) -> int:
+    """Argparse type for issue IDs and counts.
+
+    Plain ASCII digits, by far the common case, are converted directly
+    without going through int()'s exception path on bad input.
+
+    Args:
+        value: Raw command-line value.
+
+    Returns:
+        Parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a non-negative integer.
+    """
+    if value.isascii() and value.isdigit():
+        return int(value)
+    raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+
+
+def _add_ref_arguments(parser: Any, verb: str) -> None:
+    """Add the REF positional plus the explicit -c/--commit and -b/--branch forms."""
+    parser.add_argument(
+        "ref",
+        nargs="?",
+        help=f"Commit hash or branch name to {verb} (hex strings are treated as commits)",
+    )
+    parser.add_argument("-c", "--commit", help="Commit hash (overrides REF detection)")
+    parser.add_argument("-b", "--branch", help="Branch name (overrides REF detection)")
+
+
+def _resolve_ref(args: Any) -> tuple[Optional[str], Optional[str]]:
+    """Split the parsed REF/--commit/--branch arguments into a commit or a branch.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Tuple of (commit_hash, branch_name); exactly one of them is set.
+
+    Raises:
+        ValueError: If none or more than one of REF, --commit and --branch is given.
+    """
+    given = [v for v in (args.ref, args.commit, args.branch) if v]
+    if len(given) != 1:
+        raise ValueError("Specify exactly one of REF, --commit or --branch")
+
+    if args.commit:
+        return args.commit, None
+    if args.branch:
+        return None, args.branch
+    if _SHA1_RE.match(args.ref):
+        return args.ref, None
+    return None, args.ref
+
+
+def _build_link_parser(subparsers: Any) -> Any:
+    link_parser = subparsers.add_parser(_CMD_LINK, help="Link an issue to a git commit or branch")
+    link_parser.add_argument("issue_id", type=_non_negative_int, help="Issue ID")
+    _add_ref_arguments(link_parser, "link")
+    return link_parser
+
+
+def _build_unlink_parser(subparsers: Any) -> Any:
+    unlink_parser = subparsers.add_parser(_CMD_UNLINK, help="Remove git link(s) from an issue")
+    unlink_parser.add_argument("issue_id", type=_non_negative_int, help="Issue ID")
+    _add_ref_arguments(unlink_parser, "unlink")
+    return unlink_parser
+
+
+def _build_links_parser(subparsers: Any) -> Any:
+    links_parser = subparsers.add_parser(_CMD_LINKS, help="Show all git links for an issue")
+    links_parser.add_argument("issue_id", type=_non_negative_int, help="Issue ID")
+    return links_parser
+
+
+def _build_linked_parser(subparsers: Any) -> Any:
+    linked_parser = subparsers.add_parser(
+        _CMD_LINKED, help="Show issues linked to a commit or branch"
+    )
+    _add_ref_arguments(linked_parser, "look up")
+    return linked_parser
+
+
+def _build_git_scan_parser(subparsers: Any) -> Any:
+    git_scan_parser = subparsers.add_parser(
+        _CMD_GIT_SCAN,
+        help="Scan recent git commits for issue references and link them",
+    )
+    git_scan_parser.add_argument(
+        "-n",
+        "--num-commits",
+        type=_non_negative_int,
+        default=10,
+        help="Number of recent commits to scan (default: 10)",
+    )
+    git_scan_parser.add_argument(
+        "--auto-close",
+        action="store_true",
+        help="Auto-close issues with 'fixes #N' or 'closes #N' patterns",
+    )
+    return git_scan_parser
+
+
+def _build_git_status_parser(subparsers: Any) -> Any:
+    return subparsers.add_parser(_CMD_GIT_STATUS, help="Show git repository status")
+
+
+_GIT_PARSER_BUILDERS: dict[str, Callable[[Any], Any]] = {
+    _CMD_LINK: _build_link_parser,
+    _CMD_UNLINK: _build_unlink_parser,
+    _CMD_LINKS: _build_links_parser,
+    _CMD_LINKED: _build_linked_parser,
+    _CMD_GIT_SCAN: _build_git_scan_parser,
+    _CMD_GIT_STATUS: _build_git_status_parser,
+}
+
+
+def git_parser_names(argv: Optional[list[str]] = None) -> tuple[str, ...]:
+    """Pick the git commands whose subparsers an invocation needs.
+
+    Only the git command named on the command line is needed, and the
+    command is its first non-option argument. Top-level help, or no
+    arguments at all, needs every git command so the help text stays
+    complete.
+
+    Args:
+        argv: Command-line arguments to inspect, with the options that take
+            a value (such as --db PATH) already removed. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        Names of the git commands to register, in registration order.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not argv or "-h" in argv or "--help" in argv:
+        return tuple(_GIT_PARSER_BUILDERS)
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command is not None and command in _GIT_PARSER_BUILDERS:
+        return (sys.intern(command),)
+    return ()
+
+
+def register_git_parsers(
+    subparsers: Any,
+    argv: Optional[list[str]] = None,
+    names: Optional[tuple[str, ...]] = None,
+) -> None:
+    """Add the git subparsers needed for this invocation.
+
+    Commands whose name is already taken by the main parser are skipped.
+
+    Args:
+        subparsers: Subparsers action of the main argument parser.
+        argv: Command-line arguments to inspect. Defaults to sys.argv[1:].
+        names: Git commands to register, as returned by git_parser_names.
+            Worked out from argv when omitted.
+    """
+    if names is None:
+        names = git_parser_names(argv)
+
+    for name in names:
+        if name in subparsers.choices:
+            continue
+        _GIT_PARSER_BUILDERS[name](subparsers).set_defaults(git_command=name)
+
+
+def _handle_link(args: Any, git_cli: "GitCLI") -> str:
+    commit_hash, branch_name = _resolve_ref(args)
+    if commit_hash:
+        return git_cli.link_commit(args.issue_id, commit_hash, as_json=args.json)
+    return git_cli.link_branch(args.issue_id, branch_name or "", as_json=args.json)
+
+
+def _handle_unlink(args: Any, git_cli: "GitCLI") -> str:
+    commit_hash, branch_name = _resolve_ref(args)
+    return git_cli.unlink(
+        args.issue_id,
+        commit_hash=commit_hash,
+        branch_name=branch_name,
+        as_json=args.json,
+    )
+
+
+def _handle_links(args: Any, git_cli: "GitCLI") -> str:
+    return git_cli.list_links(args.issue_id, as_json=args.json)
+
+
+def _handle_linked(args: Any, git_cli: "GitCLI") -> str:
+    commit_hash, branch_name = _resolve_ref(args)
+    return git_cli.find_linked_issues(
+        commit_hash=commit_hash,
+        branch_name=branch_name,
+        as_json=args.json,
+    )
+
+
+def _handle_git_scan(args: Any, git_cli: "GitCLI") -> str:
+    return git_cli.git_scan(
+        num_commits=args.num_commits,
+        auto_close=args.auto_close,
+        as_json=args.json,
+    )
+
+
+def _handle_git_status(args: Any, git_cli: "GitCLI") -> str:
+    return git_cli.git_status(as_json=args.json)
+
+
+_GIT_HANDLERS: dict[str, Callable[[Any, "GitCLI"], str]] = {
+    _CMD_LINK: _handle_link,
+    _CMD_UNLINK: _handle_unlink,
+    _CMD_LINKS: _handle_links,
+    _CMD_LINKED: _handle_linked,
+    _CMD_GIT_SCAN: _handle_git_scan,
+    _CMD_GIT_STATUS: _handle_git_status,
+}
+
+
+def dispatch_git_command(args: Any) -> bool:
+    """Run the parsed git command, if any.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        True if a git command was handled, False otherwise.
+    """
+    handler = _GIT_HANDLERS.get(getattr(args, "git_command", None) or "")
+    if handler is None:
+        return False
+
+    result = handler(args, _get_git_cli(args.db))
+    sys.stdout.write(result if result.endswith("\n") else result + "\n")
+    return True
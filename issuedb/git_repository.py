@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, List, Optional
 
-from issuedb.database import get_database
+from issuedb.database import MAX_SQL_VARIABLES, get_database
 from issuedb.models import Issue, IssueLink, Priority, Status
 
 
@@ -46,6 +46,52 @@ class GitLinkRepository:
             (issue_id, action, field_name, old_value, new_value),
         )
 
+    def _insert_link(self, conn: Any, issue_id: int, link_type: str, reference: str) -> IssueLink:
+        """Insert a git link and record it in the audit log.
+
+        Args:
+            conn: Database connection to use
+            issue_id: ID of the issue to link
+            link_type: Type of link ('commit' or 'branch')
+            reference: Commit hash or branch name
+
+        Returns:
+            Created IssueLink object.
+        """
+        link = IssueLink(
+            issue_id=issue_id,
+            link_type=link_type,
+            reference=reference,
+        )
+
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO issue_links (issue_id, link_type, reference, created_at)
+            VALUES (?, ?, ?, ?)
+        """,
+            (
+                link.issue_id,
+                link.link_type,
+                link.reference,
+                link.created_at.isoformat(),
+            ),
+        )
+
+        link.id = cursor.lastrowid
+
+        # Log in audit log
+        self._log_audit(
+            conn,
+            issue_id,
+            "LINK_ADD",
+            link_type,
+            None,
+            reference,
+        )
+
+        return link
+
     def get_issue(self, issue_id: int) -> Optional[Issue]:
         """Get an issue by ID.
 
@@ -116,38 +162,7 @@ class GitLinkRepository:
                 )
 
             # Create the link
-            link = IssueLink(
-                issue_id=issue_id,
-                link_type=link_type,
-                reference=reference,
-            )
-
-            cursor.execute(
-                """
-                INSERT INTO issue_links (issue_id, link_type, reference, created_at)
-                VALUES (?, ?, ?, ?)
-            """,
-                (
-                    link.issue_id,
-                    link.link_type,
-                    link.reference,
-                    link.created_at.isoformat(),
-                ),
-            )
-
-            link.id = cursor.lastrowid
-
-            # Log in audit log
-            self._log_audit(
-                conn,
-                issue_id,
-                "LINK_ADD",
-                link_type,
-                None,
-                reference,
-            )
-
-            return link
+            return self._insert_link(conn, issue_id, link_type, reference)
 
     def remove_link(
         self, issue_id: int, link_type: Optional[str] = None, reference: Optional[str] = None
@@ -326,6 +341,9 @@ class GitLinkRepository:
         issues_closed = 0
         details = []
 
+        # Parse every commit message up front so the referenced issues and
+        # existing links can be fetched with one query each.
+        parsed = []
         for commit in commits:
             commit_hash = commit.get("hash", "")
             message = commit.get("message", "")
@@ -334,29 +352,68 @@ class GitLinkRepository:
                 continue
 
             scanned += 1
+            parsed.append((commit_hash, parse_issue_refs(message), parse_close_refs(message)))
+
+        referenced_ids = sorted({issue_id for _, refs, _ in parsed for issue_id in refs})
+        if not referenced_ids:
+            return {
+                "scanned": scanned,
+                "links_created": 0,
+                "issues_closed": 0,
+                "details": details,
+            }
+
+        to_close: List[int] = []
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            statuses: dict[int, str] = {}
+            existing_links: set[tuple[int, str]] = set()
+            for start in range(0, len(referenced_ids), MAX_SQL_VARIABLES):
+                batch = referenced_ids[start : start + MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+
+                cursor.execute(
+                    f"SELECT id, status FROM issues WHERE id IN ({placeholders})",
+                    batch,
+                )
+                statuses.update((row["id"], row["status"]) for row in cursor.fetchall())
+
+                cursor.execute(
+                    f"""
+                    SELECT issue_id, reference FROM issue_links
+                    WHERE link_type = 'commit' AND issue_id IN ({placeholders})
+                """,
+                    batch,
+                )
+                existing_links.update((row["issue_id"], row["reference"]) for row in cursor)
+
+            for commit_hash, issue_refs, close_refs in parsed:
+                for issue_id in issue_refs:
+                    # Check if issue exists
+                    if issue_id not in statuses:
+                        details.append(
+                            {
+                                "commit": commit_hash,
+                                "issue_id": issue_id,
+                                "action": "skipped",
+                                "reason": "issue not found",
+                            }
+                        )
+                        continue
 
-            # Parse issue references
-            issue_refs = parse_issue_refs(message)
-            close_refs = parse_close_refs(message)
-
-            for issue_id in issue_refs:
-                # Check if issue exists
-                issue = self.get_issue(issue_id)
-                if not issue:
-                    details.append(
-                        {
-                            "commit": commit_hash,
-                            "issue_id": issue_id,
-                            "action": "skipped",
-                            "reason": "issue not found",
-                        }
-                    )
-                    continue
-
-                # Add link if doesn't exist
-                try:
-                    link = self.add_link(issue_id, "commit", commit_hash)
-                    if link:
+                    # Add link if doesn't exist
+                    if (issue_id, commit_hash) in existing_links:
+                        details.append(
+                            {
+                                "commit": commit_hash,
+                                "issue_id": issue_id,
+                                "action": "skipped",
+                                "reason": "link already exists",
+                            }
+                        )
+                    else:
+                        link = self._insert_link(conn, issue_id, "commit", commit_hash)
+                        existing_links.add((issue_id, commit_hash))
                         links_created += 1
                         details.append(
                             {
@@ -366,28 +423,22 @@ class GitLinkRepository:
                                 "link_id": link.id,
                             }
                         )
-                except ValueError:
-                    # Link already exists, skip
-                    details.append(
-                        {
-                            "commit": commit_hash,
-                            "issue_id": issue_id,
-                            "action": "skipped",
-                            "reason": "link already exists",
-                        }
-                    )
-
-                # Auto-close if in close_refs and auto_close is True
-                if auto_close and issue_id in close_refs and issue.status.value != "closed":
-                    repo.update_issue(issue_id, status="closed")
-                    issues_closed += 1
-                    details.append(
-                        {
-                            "commit": commit_hash,
-                            "issue_id": issue_id,
-                            "action": "closed",
-                        }
-                    )
+
+                    # Auto-close if in close_refs and auto_close is True
+                    if auto_close and issue_id in close_refs and statuses[issue_id] != "closed":
+                        statuses[issue_id] = "closed"
+                        to_close.append(issue_id)
+                        issues_closed += 1
+                        details.append(
+                            {
+                                "commit": commit_hash,
+                                "issue_id": issue_id,
+                                "action": "closed",
+                            }
+                        )
+
+        for issue_id in to_close:
+            repo.update_issue(issue_id, status="closed")
 
         return {
             "scanned": scanned,
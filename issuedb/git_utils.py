@@ -4,6 +4,15 @@ import re
 import subprocess
 from typing import Any, List, Optional, Set
 
+# Matches: #123, fix #123, fixes #123, close #123, closes #123, etc.
+# Note: fix(?:es)? matches "fix" or "fixes", close(?:s)? matches "close" or "closes"
+_ISSUE_REF_RE = re.compile(
+    r"(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)|#(\d+)", re.IGNORECASE
+)
+
+# Matches only closing keywords: fix #123, closes #123, resolves #123, etc.
+_CLOSE_REF_RE = re.compile(r"(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)", re.IGNORECASE)
+
 
 class GitError(Exception):
     """Raised when git operations fail."""
@@ -144,15 +153,9 @@ def parse_issue_refs(message: str) -> Set[int]:
     Returns:
         Set of issue IDs referenced in the message.
     """
-    # Pattern to match issue references
-    # Matches: #123, fix #123, fixes #123, close #123, closes #123, etc.
-    # Note: fix(?:es)? matches "fix" or "fixes", close(?:s)? matches "close" or "closes"
-    pattern = r"(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)|#(\d+)"
-
-    matches = re.finditer(pattern, message, re.IGNORECASE)
     issue_ids = set()
 
-    for match in matches:
+    for match in _ISSUE_REF_RE.finditer(message):
         # match.group(1) is for "fix #123" pattern
         # match.group(2) is for "#123" pattern
         issue_id = match.group(1) or match.group(2)
@@ -179,14 +182,9 @@ def parse_close_refs(message: str) -> Set[int]:
     Returns:
         Set of issue IDs that should be closed based on the message.
     """
-    # Pattern to match only closing keywords
-    # Note: fix(?:es)? matches "fix" or "fixes", close(?:s)? matches "close" or "closes"
-    pattern = r"(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)"
-
-    matches = re.finditer(pattern, message, re.IGNORECASE)
     issue_ids = set()
 
-    for match in matches:
+    for match in _CLOSE_REF_RE.finditer(message):
         issue_id = match.group(1)
         if issue_id:
             issue_ids.add(int(issue_id))
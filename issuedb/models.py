@@ -1,10 +1,16 @@
 """Data models and enums for IssueDB."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
+# Issues and their tags are loaded by the thousand for list, search and bulk
+# output. On Python 3.10+ they are slotted, which drops the per-instance
+# __dict__ and makes attribute reads a little cheaper.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class Priority(Enum):
     """Priority levels for issues."""
@@ -17,12 +23,16 @@ class Priority(Enum):
     @classmethod
     def from_string(cls, value: str) -> "Priority":
         """Create Priority from string value."""
-        try:
-            return cls(value.lower())
-        except ValueError:
+        # A dict lookup instead of cls(value.lower()), which goes through the
+        # Enum constructor; this runs for every row loaded from the database.
+        member = _PRIORITY_BY_VALUE.get(value)
+        if member is None:
+            member = _PRIORITY_BY_VALUE.get(value.lower())
+        if member is None:
             raise ValueError(
                 f"Invalid priority: {value}. Must be one of: {', '.join([p.value for p in cls])}"
-            ) from None
+            )
+        return member
 
     def to_int(self) -> int:
         """Convert priority to integer for sorting (higher number = higher priority)."""
@@ -35,6 +45,9 @@ class Priority(Enum):
         return priority_map[self]
 
 
+_PRIORITY_BY_VALUE: dict[str, Priority] = {p._value_: p for p in Priority}
+
+
 class Status(Enum):
     """Status levels for issues."""
 
@@ -46,12 +59,17 @@ class Status(Enum):
     @classmethod
     def from_string(cls, value: str) -> "Status":
         """Create Status from string value."""
-        try:
-            return cls(value.lower())
-        except ValueError:
+        member = _STATUS_BY_VALUE.get(value)
+        if member is None:
+            member = _STATUS_BY_VALUE.get(value.lower())
+        if member is None:
             raise ValueError(
                 f"Invalid status: {value}. Must be one of: {', '.join([s.value for s in cls])}"
-            ) from None
+            )
+        return member
+
+
+_STATUS_BY_VALUE: dict[str, Status] = {s._value_: s for s in Status}
 
 
 @dataclass
@@ -144,7 +162,7 @@ class CodeReference:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Tag:
     """Represents a tag."""
 
@@ -153,17 +171,23 @@ class Tag:
     color: Optional[str] = field(default=None)
     created_at: datetime = field(default_factory=datetime.now)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert tag to dictionary."""
+    def to_dict(self, iso_dates: bool = True) -> dict[str, Any]:
+        """Convert tag to dictionary.
+
+        Args:
+            iso_dates: Render datetimes as ISO 8601 strings. Pass False to keep
+                datetime objects for a serializer that handles them itself.
+        """
+        created_at = self.created_at
         return {
             "id": self.id,
             "name": self.name,
             "color": self.color,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": created_at.isoformat() if created_at and iso_dates else created_at,
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Issue:
     """Represents an issue in the tracking system."""
 
@@ -178,24 +202,47 @@ class Issue:
     due_date: Optional[datetime] = field(default=None)
     tags: list[Tag] = field(default_factory=list)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert issue to dictionary for JSON serialization."""
+    def to_dict(self, iso_dates: bool = True) -> dict[str, Any]:
+        """Convert issue to dictionary for JSON serialization.
+
+        Args:
+            iso_dates: Render datetimes as ISO 8601 strings. Pass False to keep
+                datetime objects for a serializer that handles them itself,
+                such as orjson, which writes the same text without a Python
+                call per timestamp.
+        """
+        created_at: Any = self.created_at
+        updated_at: Any = self.updated_at
+        if iso_dates:
+            created_at = created_at.isoformat() if created_at else None
+            updated_at = updated_at.isoformat() if updated_at else None
+        # Enum members keep their value in the _value_ attribute; reading it
+        # skips the .value property, which shows up when serializing long lists.
         result: dict[str, Any] = {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "priority": self.priority.value,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "tags": [tag.to_dict() for tag in self.tags],
+            "priority": self.priority._value_,
+            "status": self.status._value_,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "tags": [tag.to_dict(iso_dates) for tag in self.tags],
         }
         if self.estimated_hours is not None:
             result["estimated_hours"] = self.estimated_hours
         if self.due_date:
-            result["due_date"] = self.due_date.isoformat()
+            result["due_date"] = self.due_date.isoformat() if iso_dates else self.due_date
         return result
 
+    def to_brief_dict(self) -> dict[str, Any]:
+        """Convert issue to the short form used when listing related issues."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status._value_,
+            "priority": self.priority._value_,
+        }
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Issue":
         """Create Issue from dictionary."""
@@ -18,6 +18,7 @@ class OllamaClient:
         host: Optional[str] = None,
         port: Optional[int] = None,
         model: Optional[str] = None,
+        keep_alive: Optional[str] = None,
     ) -> None:
         """Initialize Ollama client.
 
@@ -25,10 +26,13 @@ class OllamaClient:
             host: Ollama server host (default: from OLLAMA_HOST env or 'localhost')
             port: Ollama server port (default: from OLLAMA_PORT env or 11434)
             model: Model to use (default: from OLLAMA_MODEL env or 'llama3')
+            keep_alive: How long the server keeps the model loaded after a
+                request (default: from OLLAMA_KEEP_ALIVE env or '30m')
         """
         self.host = host or os.getenv("OLLAMA_HOST", "localhost")
         self.port = port or int(os.getenv("OLLAMA_PORT", "11434"))
         self.model = model or os.getenv("OLLAMA_MODEL", "llama3")
+        self.keep_alive = keep_alive or os.getenv("OLLAMA_KEEP_ALIVE", "30m")
         self.base_url = f"http://{self.host}:{self.port}"
 
     def check_server(self) -> Tuple[bool, Optional[str]]:
@@ -72,11 +76,14 @@ User request: {user_request}
 
 Generate the issuedb-cli command:"""
 
-            # Prepare request body
+            # Prepare request body. keep_alive holds the model in the server's
+            # memory between invocations, so back-to-back commands skip the
+            # model load.
             payload = {
                 "model": self.model,
                 "prompt": full_prompt,
                 "stream": False,
+                "keep_alive": self.keep_alive,
                 "options": {
                     "temperature": 0.1,  # Low temperature for consistent output
                     "top_p": 0.9,
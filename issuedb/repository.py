@@ -2,12 +2,15 @@
 
 import contextlib
 import fnmatch
+import functools
 import json
 import os
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from issuedb.database import MAX_SQL_VARIABLES as _MAX_SQL_VARIABLES
 from issuedb.database import get_database
 from issuedb.date_utils import parse_date, validate_date_range
 from issuedb.models import (
@@ -25,6 +28,30 @@ from issuedb.models import (
 )
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_matcher(
+    pattern: str, use_regex: bool, case_sensitive: bool
+) -> Callable[[str], Optional["re.Match[str]"]]:
+    """Compile a user-supplied pattern once, however many issues it is tested against.
+
+    Glob patterns are translated to an anchored regex with fnmatch.translate(),
+    so both kinds run as a single compiled regex per issue.
+
+    Args:
+        pattern: Glob or regular expression.
+        use_regex: If True, pattern is a regex searched anywhere in the text;
+            if False, a glob that must match the whole text.
+        case_sensitive: If False, compile with re.IGNORECASE.
+
+    Returns:
+        Function returning a match object, or None if the text does not match.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if use_regex:
+        return re.compile(pattern, flags).search
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+
 class IssueRepository:
     """Handles all issue-related database operations."""
 
@@ -518,6 +545,20 @@ class IssueRepository:
 
             return [self._row_to_issue(row) for row in rows]
 
+    def get_issue_texts(self) -> List[Tuple[int, str, Optional[str]]]:
+        """Get the ID, title and description of every issue.
+
+        A lightweight alternative to get_all_issues for text comparisons,
+        which need neither the remaining columns nor Issue objects.
+
+        Returns:
+            List of (id, title, description) tuples.
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, title, description FROM issues ORDER BY created_at DESC")
+            return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+
     def get_next_issue(
         self, status: Optional[str] = None, log_fetch: bool = True
     ) -> Optional[Issue]:
@@ -836,8 +877,8 @@ class IssueRepository:
                 "closed": [],
             }
             for issue in issues:
-                key = "in_progress" if issue.status.value == "in-progress" else issue.status.value
-                grouped[key].append(issue)
+                key = issue.status._value_
+                grouped["in_progress" if key == "in-progress" else key].append(issue)
         else:  # group by priority
             grouped = {
                 "critical": [],
@@ -846,7 +887,7 @@ class IssueRepository:
                 "low": [],
             }
             for issue in issues:
-                grouped[issue.priority.value].append(issue)
+                grouped[issue.priority._value_].append(issue)
 
         # Convert to dict format
         result: Dict[str, Any] = {
@@ -1092,40 +1133,23 @@ class IssueRepository:
         Returns:
             List of matching issues.
         """
-        all_issues = self.get_all_issues()
-        matching_issues = []
-
-        for issue in all_issues:
-            title_match = True
-            desc_match = True
-
-            # Match title if pattern provided
-            if title_pattern:
-                title_text = issue.title if case_sensitive else issue.title.lower()
-                pattern = title_pattern if case_sensitive else title_pattern.lower()
-
-                if use_regex:
-                    flags = 0 if case_sensitive else re.IGNORECASE
-                    title_match = bool(re.search(pattern, issue.title, flags=flags))
-                else:
-                    title_match = fnmatch.fnmatch(title_text, pattern)
-
-            # Match description if pattern provided
-            if desc_pattern and issue.description:
-                desc_text = issue.description if case_sensitive else issue.description.lower()
-                pattern = desc_pattern if case_sensitive else desc_pattern.lower()
-
-                if use_regex:
-                    flags = 0 if case_sensitive else re.IGNORECASE
-                    desc_match = bool(re.search(pattern, issue.description, flags=flags))
-                else:
-                    desc_match = fnmatch.fnmatch(desc_text, pattern)
-            elif desc_pattern and not issue.description:
-                desc_match = False
+        title_matches = (
+            _compile_matcher(title_pattern, use_regex, case_sensitive) if title_pattern else None
+        )
+        desc_matches = (
+            _compile_matcher(desc_pattern, use_regex, case_sensitive) if desc_pattern else None
+        )
 
+        matching_issues = []
+        for issue in self.get_all_issues():
             # Include issue if both patterns match (or pattern not provided)
-            if title_match and desc_match:
-                matching_issues.append(issue)
+            if title_matches is not None and title_matches(issue.title) is None:
+                continue
+            if desc_matches is not None and (
+                not issue.description or desc_matches(issue.description) is None
+            ):
+                continue
+            matching_issues.append(issue)
 
         return matching_issues
 
@@ -1497,6 +1521,48 @@ class IssueRepository:
 
             return references
 
+    def get_code_references_for_issues(
+        self, issue_ids: List[int]
+    ) -> Dict[int, List[CodeReference]]:
+        """Get code references for multiple issues in one query per batch of IDs.
+
+        Args:
+            issue_ids: List of issue IDs.
+
+        Returns:
+            Dictionary mapping issue_id to list of CodeReference objects.
+        """
+        if not issue_ids:
+            return {}
+
+        result: Dict[int, List[CodeReference]] = {issue_id: [] for issue_id in issue_ids}
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(issue_ids), _MAX_SQL_VARIABLES):
+                batch = issue_ids[start : start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"""
+                    SELECT * FROM code_references
+                    WHERE issue_id IN ({placeholders})
+                    ORDER BY issue_id, created_at ASC
+                    """,
+                    batch,
+                )
+                for row in cursor.fetchall():
+                    ref = CodeReference(
+                        id=row["id"],
+                        issue_id=row["issue_id"],
+                        file_path=row["file_path"],
+                        start_line=row["start_line"],
+                        end_line=row["end_line"],
+                        note=row["note"],
+                        created_at=datetime.fromisoformat(row["created_at"]),
+                    )
+                    result[row["issue_id"]].append(ref)
+
+        return result
+
     def get_issues_by_file(self, file_path: str) -> List[Issue]:
         """Get all issues that reference a specific file.
 
@@ -1641,6 +1707,47 @@ class IssueRepository:
             rows = cursor.fetchall()
             return [self._row_to_issue(row) for row in rows]
 
+    def get_blockers_for_issues(self, issue_ids: List[int]) -> Dict[int, List[Issue]]:
+        """Get the blockers of multiple issues in one query per batch of IDs.
+
+        Args:
+            issue_ids: List of issue IDs.
+
+        Returns:
+            Dictionary mapping issue_id to the list of issues blocking it, in
+            the same order as get_blockers().
+        """
+        if not issue_ids:
+            return {}
+
+        result: Dict[int, List[Issue]] = {issue_id: [] for issue_id in issue_ids}
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(issue_ids), _MAX_SQL_VARIABLES):
+                batch = issue_ids[start : start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"""
+                    SELECT d.blocked_id, i.* FROM issues i
+                    INNER JOIN issue_dependencies d ON i.id = d.blocker_id
+                    WHERE d.blocked_id IN ({placeholders})
+                    ORDER BY
+                        d.blocked_id,
+                        CASE i.priority
+                            WHEN 'critical' THEN 1
+                            WHEN 'high' THEN 2
+                            WHEN 'medium' THEN 3
+                            WHEN 'low' THEN 4
+                        END,
+                        i.created_at ASC
+                """,
+                    batch,
+                )
+                for row in cursor.fetchall():
+                    result[row["blocked_id"]].append(self._row_to_issue(row))
+
+        return result
+
     def get_blocking(self, issue_id: int) -> List[Issue]:
         """Get all issues that this issue is blocking.
 
@@ -1684,6 +1791,49 @@ class IssueRepository:
         # Issue is blocked if it has any blocker that is not closed
         return any(blocker.status != Status.CLOSED for blocker in blockers)
 
+    def get_dependency_graph(self, issue_id: int) -> Tuple[List[Issue], List[Issue], bool]:
+        """Get both sides of an issue's dependencies with a single query.
+
+        Args:
+            issue_id: ID of the issue.
+
+        Returns:
+            Tuple of (blockers, blocking, is_blocked), where the lists are
+            ordered as by get_blockers and get_blocking and is_blocked matches
+            is_blocked().
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                WITH deps (id, direction) AS (
+                    SELECT blocker_id, 'blocker' FROM issue_dependencies WHERE blocked_id = ?
+                    UNION ALL
+                    SELECT blocked_id, 'blocking' FROM issue_dependencies WHERE blocker_id = ?
+                )
+                SELECT i.*, deps.direction FROM deps
+                INNER JOIN issues i ON i.id = deps.id
+                ORDER BY
+                    CASE i.priority
+                        WHEN 'critical' THEN 1
+                        WHEN 'high' THEN 2
+                        WHEN 'medium' THEN 3
+                        WHEN 'low' THEN 4
+                    END,
+                    i.created_at ASC
+            """,
+                (issue_id, issue_id),
+            )
+
+            blockers: List[Issue] = []
+            blocking: List[Issue] = []
+            for row in cursor.fetchall():
+                side = blockers if row["direction"] == "blocker" else blocking
+                side.append(self._row_to_issue(row))
+
+        is_blocked = any(blocker.status != Status.CLOSED for blocker in blockers)
+        return blockers, blocking, is_blocked
+
     def get_all_blocked_issues(self, status: Optional[str] = None) -> List[Issue]:
         """Get all issues that are currently blocked.
 
@@ -1696,12 +1846,16 @@ class IssueRepository:
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Get all issues with dependencies
+            # EXISTS instead of a join plus DISTINCT: each issue is emitted at
+            # most once without de-duplicating whole rows, and a status filter
+            # can drive the scan from idx_issues_status.
             query = """
-                SELECT DISTINCT i.* FROM issues i
-                INNER JOIN issue_dependencies d ON i.id = d.blocked_id
-                INNER JOIN issues blocker ON blocker.id = d.blocker_id
-                WHERE blocker.status != 'closed'
+                SELECT i.* FROM issues i
+                WHERE EXISTS (
+                    SELECT 1 FROM issue_dependencies d
+                    INNER JOIN issues blocker ON blocker.id = d.blocker_id
+                    WHERE d.blocked_id = i.id AND blocker.status != 'closed'
+                )
             """
             params: List[Any] = []
 
@@ -2163,16 +2317,15 @@ class IssueRepository:
         Returns:
             Dictionary with workspace status information.
         """
-        import subprocess
-        from pathlib import Path
-
         status: Dict[str, Any] = {}
+        # One reference time for the active issue and every activity entry
+        now = datetime.now()
 
         # Get active issue
         active = self.get_active_issue()
         if active:
             issue, started_at = active
-            time_spent = datetime.now() - started_at
+            time_spent = now - started_at
             hours = int(time_spent.total_seconds() // 3600)
             minutes = int((time_spent.total_seconds() % 3600) // 60)
 
@@ -2188,45 +2341,34 @@ class IssueRepository:
         else:
             status["active_issue"] = None
 
-        # Get git branch
+        # Get git branch and uncommitted files count. One porcelain v2 status
+        # call reports both and fails outside a repository.
+        status["git_branch"] = None
+        status["uncommitted_files"] = None
+        # Imported here: only the workspace status runs git.
+        import subprocess
+
         try:
             result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
+                ["git", "status", "--porcelain=v2", "--branch"],
                 capture_output=True,
                 text=True,
                 timeout=2,
                 cwd=Path.cwd(),
             )
             if result.returncode == 0:
-                branch_result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                    cwd=Path.cwd(),
-                )
-                if branch_result.returncode == 0:
-                    status["git_branch"] = branch_result.stdout.strip()
-
-                # Get uncommitted files count
-                status_result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                    cwd=Path.cwd(),
-                )
-                if status_result.returncode == 0:
-                    uncommitted = [
-                        line for line in status_result.stdout.split("\n") if line.strip()
-                    ]
-                    status["uncommitted_files"] = len(uncommitted)
-            else:
-                status["git_branch"] = None
-                status["uncommitted_files"] = None
+                uncommitted = 0
+                branch = ""
+                for line in result.stdout.splitlines():
+                    if line.startswith("# branch.head "):
+                        branch = line[len("# branch.head ") :]
+                    elif line and not line.startswith("#"):
+                        uncommitted += 1
+                # Detached HEAD has no current branch
+                status["git_branch"] = "" if branch == "(detached)" else branch
+                status["uncommitted_files"] = uncommitted
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-            status["git_branch"] = None
-            status["uncommitted_files"] = None
+            pass
 
         # Get recent workspace activity (last 5 start/stop events)
         with self.db.get_connection() as conn:
@@ -2255,7 +2397,7 @@ class IssueRepository:
 
                 # Calculate time ago
                 timestamp = datetime.fromisoformat(row["timestamp"])
-                time_diff = datetime.now() - timestamp
+                time_diff = now - timestamp
                 if time_diff.days > 0:
                     activity["time_ago"] = f"{time_diff.days}d ago"
                 elif time_diff.seconds >= 3600:
@@ -2437,30 +2579,60 @@ class IssueRepository:
             List of time entry dictionaries.
         """
         with self.db.get_connection() as conn:
+            return self._get_time_entries_with_conn(conn, issue_id)
+
+    def get_time_entries_with_total(self, issue_id: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Get all time entries for an issue along with their total duration.
+
+        Args:
+            issue_id: ID of the issue.
+
+        Returns:
+            Tuple of (time entry dictionaries, total seconds). Running entries
+            count as zero towards the total.
+        """
+        with self.db.get_connection() as conn:
+            entries = self._get_time_entries_with_conn(conn, issue_id)
+            if not entries:
+                return entries, 0
+
             cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT * FROM time_entries
-                WHERE issue_id = ?
-                ORDER BY started_at DESC
-            """,
+                "SELECT COALESCE(SUM(duration_seconds), 0) FROM time_entries WHERE issue_id = ?",
                 (issue_id,),
             )
-            rows = cursor.fetchall()
+            return entries, cursor.fetchone()[0]
 
-            entries = []
-            for row in rows:
-                entry = {
-                    "id": row["id"],
-                    "issue_id": row["issue_id"],
-                    "started_at": row["started_at"],
-                    "ended_at": row["ended_at"],
-                    "duration_seconds": row["duration_seconds"],
-                    "note": row["note"],
-                }
-                entries.append(entry)
+    def _get_time_entries_with_conn(self, conn: Any, issue_id: int) -> List[Dict[str, Any]]:
+        """Get time entries for an issue using an existing connection.
+
+        Args:
+            conn: Database connection to use.
+            issue_id: ID of the issue.
 
-            return entries
+        Returns:
+            List of time entry dictionaries, newest first.
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM time_entries
+            WHERE issue_id = ?
+            ORDER BY started_at DESC
+        """,
+            (issue_id,),
+        )
+        return [
+            {
+                "id": row["id"],
+                "issue_id": row["issue_id"],
+                "started_at": row["started_at"],
+                "ended_at": row["ended_at"],
+                "duration_seconds": row["duration_seconds"],
+                "note": row["note"],
+            }
+            for row in cursor
+        ]
 
     def set_estimate(self, issue_id: int, hours: float) -> Optional[Issue]:
         """Set time estimate for an issue.
@@ -2526,8 +2698,9 @@ class IssueRepository:
         if period not in ["week", "month", "all"]:
             raise ValueError("Period must be 'week', 'month', or 'all'")
 
-        # Calculate date range
+        # Calculate date range; "all" has no lower bound
         now = datetime.now()
+        start_date: Optional[datetime] = None
         if period == "week":
             start_date = now - timedelta(days=7)
             period_label = "This Week"
@@ -2535,13 +2708,13 @@ class IssueRepository:
             start_date = now - timedelta(days=30)
             period_label = "This Month"
         else:
-            start_date = datetime(1970, 1, 1)
             period_label = "All Time"
 
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Build query based on filters
+            # Aggregate from time_entries: without a date bound SQLite walks
+            # idx_time_entries_issue_id and groups without a temporary b-tree.
             query = """
                 SELECT
                     i.id,
@@ -2549,19 +2722,22 @@ class IssueRepository:
                     i.estimated_hours,
                     SUM(te.duration_seconds) as total_seconds,
                     COUNT(te.id) as entry_count
-                FROM issues i
-                LEFT JOIN time_entries te ON i.id = te.issue_id
+                FROM time_entries te
+                INNER JOIN issues i ON i.id = te.issue_id
                 WHERE te.ended_at IS NOT NULL
-                AND te.started_at >= ?
             """
-            params: List[Any] = [start_date.isoformat()]
+            params: List[Any] = []
+
+            if start_date is not None:
+                query += " AND te.started_at >= ?"
+                params.append(start_date.isoformat())
 
             if issue_id:
-                query += " AND i.id = ?"
+                query += " AND te.issue_id = ?"
                 params.append(issue_id)
 
             query += """
-                GROUP BY i.id
+                GROUP BY te.issue_id
                 ORDER BY total_seconds DESC
             """
 
@@ -3217,23 +3393,8 @@ class IssueRepository:
         tag = Tag(name=name, color=color)
 
         with self.db.get_connection() as conn:
-            cursor = conn.cursor()
             try:
-                cursor.execute(
-                    "INSERT INTO tags (name, color, created_at) VALUES (?, ?, ?)",
-                    (tag.name, tag.color, tag.created_at.isoformat()),
-                )
-                tag.id = cursor.lastrowid
-
-                # Log audit (global)
-                self._log_audit(
-                    conn,
-                    0,
-                    "TAG_CREATE",
-                    None,
-                    None,
-                    json.dumps(tag.to_dict()),
-                )
+                self._insert_tag(conn, tag)
             except Exception as e:
                 if "UNIQUE constraint failed" in str(e):
                     raise ValueError(f"Tag '{name}' already exists") from e
@@ -3241,6 +3402,30 @@ class IssueRepository:
 
         return tag
 
+    def _insert_tag(self, conn: Any, tag: Tag) -> None:
+        """Insert a tag, set its ID and record its creation in the audit log.
+
+        Args:
+            conn: Database connection to use.
+            tag: Tag to insert; its id is set from the new row.
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO tags (name, color, created_at) VALUES (?, ?, ?)",
+            (tag.name, tag.color, tag.created_at.isoformat()),
+        )
+        tag.id = cursor.lastrowid
+
+        # Log audit (global)
+        self._log_audit(
+            conn,
+            0,
+            "TAG_CREATE",
+            None,
+            None,
+            json.dumps(tag.to_dict()),
+        )
+
     def list_tags(self) -> List[Tag]:
         """List all tags.
 
@@ -3261,6 +3446,17 @@ class IssueRepository:
                 for row in rows
             ]
 
+    def list_tag_names(self) -> List[str]:
+        """List the names of all tags, without loading full Tag objects.
+
+        Returns:
+            Tag names in alphabetical order.
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM tags ORDER BY name ASC")
+            return [row[0] for row in cursor]
+
     def add_issue_tag(self, issue_id: int, tag_name: str) -> bool:
         """Add a tag to an issue. Creates the tag if it doesn't exist.
 
@@ -3271,39 +3467,67 @@ class IssueRepository:
         Returns:
             True if tag was added, False if already present.
         """
-        # Ensure tag exists
-        with contextlib.suppress(ValueError):
-            self.create_tag(tag_name)
+        return bool(self.add_issue_tags(issue_id, [tag_name]))
+
+    def add_issue_tags(self, issue_id: int, tag_names: Sequence[str]) -> List[str]:
+        """Add several tags to an issue in one transaction.
+
+        Tags that don't exist yet are created, as with add_issue_tag.
+
+        Args:
+            issue_id: Issue ID.
+            tag_names: Tag names, in the order they should be added.
+
+        Returns:
+            Names of the tags that were added, excluding those already present.
+        """
+        names = list(dict.fromkeys(tag_names))
+        if not names:
+            return []
 
-        # Get tag ID
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
-            tag_row = cursor.fetchone()
-            if not tag_row:
-                raise ValueError(f"Tag {tag_name} not found")
-            tag_id = tag_row["id"]
-
-            try:
+            tag_ids: Dict[str, Any] = {}
+            for start in range(0, len(names), _MAX_SQL_VARIABLES):
+                batch = names[start : start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(f"SELECT id, name FROM tags WHERE name IN ({placeholders})", batch)
+                tag_ids.update((row["name"], row["id"]) for row in cursor.fetchall())
+
+            # Ensure tags exist
+            for name in names:
+                if name in tag_ids:
+                    continue
+                tag = Tag(name=name)
+                self._insert_tag(conn, tag)
+                tag_ids[name] = tag.id
+
+            # issue_id takes one of the query's variables
+            batch_size = _MAX_SQL_VARIABLES - 1
+            present: set[int] = set()
+            ids = [tag_ids[name] for name in names]
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start : start + batch_size]
+                placeholders = ",".join("?" * len(batch))
                 cursor.execute(
-                    "INSERT INTO issue_tags (issue_id, tag_id, created_at) VALUES (?, ?, ?)",
-                    (issue_id, tag_id, datetime.now().isoformat()),
+                    "SELECT tag_id FROM issue_tags "
+                    f"WHERE issue_id = ? AND tag_id IN ({placeholders})",
+                    [issue_id, *batch],
                 )
+                present.update(row["tag_id"] for row in cursor.fetchall())
+            added = [name for name in names if tag_ids[name] not in present]
+            if not added:
+                return []
+
+            created_at = datetime.now().isoformat()
+            cursor.executemany(
+                "INSERT INTO issue_tags (issue_id, tag_id, created_at) VALUES (?, ?, ?)",
+                [(issue_id, tag_ids[name], created_at) for name in added],
+            )
+            for name in added:
+                self._log_audit(conn, issue_id, "TAG_ADD", "tag", None, name)
 
-                # Log audit
-                self._log_audit(
-                    conn,
-                    issue_id,
-                    "TAG_ADD",
-                    "tag",
-                    None,
-                    tag_name,
-                )
-                return True
-            except Exception as e:
-                if "UNIQUE constraint failed" in str(e):
-                    return False
-                raise
+            return added
 
     def remove_issue_tag(self, issue_id: int, tag_name: str) -> bool:
         """Remove a tag from an issue.
@@ -3315,28 +3539,55 @@ class IssueRepository:
         Returns:
             True if removed.
         """
+        return bool(self.remove_issue_tags(issue_id, [tag_name]))
+
+    def remove_issue_tags(self, issue_id: int, tag_names: Sequence[str]) -> List[str]:
+        """Remove several tags from an issue in one transaction.
+
+        Args:
+            issue_id: Issue ID.
+            tag_names: Tag names to remove.
+
+        Returns:
+            Names of the tags that were removed, in the order given.
+        """
+        names = list(dict.fromkeys(tag_names))
+        if not names:
+            return []
+
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                DELETE FROM issue_tags
-                WHERE issue_id = ? AND tag_id IN (SELECT id FROM tags WHERE name = ?)
-            """,
-                (issue_id, tag_name),
-            )
-
-            if cursor.rowcount > 0:
-                # Log audit
-                self._log_audit(
-                    conn,
-                    issue_id,
-                    "TAG_REMOVE",
-                    "tag",
-                    tag_name,
-                    None,
+            # issue_id takes one of each query's variables
+            batch_size = _MAX_SQL_VARIABLES - 1
+            tag_ids: Dict[str, Any] = {}
+            for start in range(0, len(names), batch_size):
+                batch = names[start : start + batch_size]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"""
+                    SELECT t.id, t.name FROM tags t
+                    JOIN issue_tags it ON t.id = it.tag_id
+                    WHERE it.issue_id = ? AND t.name IN ({placeholders})
+                """,
+                    [issue_id, *batch],
                 )
-                return True
-            return False
+                tag_ids.update((row["name"], row["id"]) for row in cursor.fetchall())
+            removed = [name for name in names if name in tag_ids]
+            if not removed:
+                return []
+
+            ids = [tag_ids[name] for name in removed]
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start : start + batch_size]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"DELETE FROM issue_tags WHERE issue_id = ? AND tag_id IN ({placeholders})",
+                    [issue_id, *batch],
+                )
+            for name in removed:
+                self._log_audit(conn, issue_id, "TAG_REMOVE", "tag", name, None)
+
+            return removed
 
     def _get_issue_tags_with_conn(self, conn: Any, issue_id: int) -> List[Tag]:
         """Get tags for an issue using an existing connection.
@@ -2,13 +2,64 @@
 
 This module provides simple text similarity calculation using only the standard library.
 It combines Levenshtein distance for short texts and Jaccard similarity for longer texts.
+If rapidfuzz is installed, its C++ edit-distance kernel computes the Levenshtein
+distances; the scores are the same either way.
 """
 
+import bisect
+import functools
+import os
 import string
-from typing import List, Tuple
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from issuedb.models import Issue
 
+try:
+    from rapidfuzz.distance.Levenshtein import distance as _rapidfuzz_distance
+except ImportError:  # pragma: no cover - rapidfuzz is an optional speedup
+    _rapidfuzz_distance = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# Normalized text plus its word-token set, computed once per document.
+_Prepared = Tuple[str, FrozenSet[str]]
+
+# Translation table that deletes ASCII punctuation, built once at import.
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+# Below this many issues, duplicate detection runs in-process; starting
+# worker processes would cost more than it saves.
+_PARALLEL_MIN_ISSUES = 500
+
+# Upper bound on worker processes for duplicate detection. The pool scores
+# every pair up front, so past a few workers the extra work outweighs the
+# speedup.
+_MAX_WORKERS = 8
+
+# Slack for float rounding when comparing an upper bound against a threshold.
+_BOUND_EPSILON = 1e-9
+
+# Texts this long or longer are scored mostly on shared words; shorter ones
+# on edit distance alone.
+_SHORT_TEXT_LENGTH = 20
+
+# Highest score two long texts without a single shared word can get: the
+# Levenshtein part of the 0.7 * Jaccard + 0.3 * Levenshtein combination.
+_NO_SHARED_WORD_MAX_SCORE = 0.3
+
+# Word -> rows of long texts containing it, plus the sorted rows of short texts.
+_CandidateIndex = Tuple[Dict[str, List[int]], List[int]]
+
 
 def _normalize_text(text: str) -> str:
     """Normalize text by converting to lowercase and removing punctuation.
@@ -26,7 +77,7 @@ def _normalize_text(text: str) -> str:
     text = text.lower()
 
     # Remove punctuation
-    text = text.translate(str.maketrans("", "", string.punctuation))
+    text = text.translate(_PUNCTUATION_TABLE)
 
     # Normalize whitespace
     text = " ".join(text.split())
@@ -44,21 +95,46 @@ def _levenshtein_distance(s1: str, s2: str) -> int:
     Returns:
         Levenshtein distance (number of edits needed).
     """
+    if _rapidfuzz_distance is not None:
+        return _rapidfuzz_distance(s1, s2)
+
     if len(s1) < len(s2):
-        return _levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+
+    # A common prefix or suffix never needs edits, so only the differing
+    # middle parts go through the quadratic loop below
+    start = 0
+    shorter = len(s2)
+    while start < shorter and s1[start] == s2[start]:
+        start += 1
+    end1, end2 = len(s1), shorter
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1 = s1[start:end1]
+    s2 = s2[start:end2]
 
     if len(s2) == 0:
         return len(s1)
 
     previous_row: list[int] = list(range(len(s2) + 1))
     for i, c1 in enumerate(s1):
-        current_row = [i + 1]
+        # `left` is the cell just computed in this row; comparisons instead
+        # of min() keep the inner loop free of function calls
+        left = i + 1
+        current_row = [left]
+        append = current_row.append
         for j, c2 in enumerate(s2):
-            # Cost of insertions, deletions, or substitutions
+            # Cost of substitutions, insertions, or deletions
+            cost = previous_row[j] + (c1 != c2)
             insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
+            if insertions < cost:
+                cost = insertions
+            deletions = left + 1
+            if deletions < cost:
+                cost = deletions
+            append(cost)
+            left = cost
         previous_row = current_row
 
     return previous_row[-1]
@@ -97,10 +173,8 @@ def _tokenize(text: str) -> set[str]:
     if not text:
         return set()
 
-    # Split on whitespace and filter out empty strings
-    tokens = {token for token in text.split() if token}
-
-    return tokens
+    # str.split() with no separator never yields empty strings
+    return set(text.split())
 
 
 def _jaccard_similarity(s1: str, s2: str) -> float:
@@ -113,9 +187,19 @@ def _jaccard_similarity(s1: str, s2: str) -> float:
     Returns:
         Jaccard similarity score from 0.0 to 1.0.
     """
-    tokens1 = _tokenize(s1)
-    tokens2 = _tokenize(s2)
+    return _jaccard_tokens(_tokenize(s1), _tokenize(s2))
+
+
+def _jaccard_tokens(tokens1: AbstractSet[str], tokens2: AbstractSet[str]) -> float:
+    """Calculate Jaccard similarity between two pre-tokenized word sets.
+
+    Args:
+        tokens1: First token set.
+        tokens2: Second token set.
 
+    Returns:
+        Jaccard similarity score from 0.0 to 1.0.
+    """
     if not tokens1 and not tokens2:
         return 1.0
     if not tokens1 or not tokens2:
@@ -143,9 +227,43 @@ def calculate_similarity(text1: str, text2: str) -> float:
     Returns:
         Similarity score from 0.0 (completely different) to 1.0 (identical).
     """
-    # Normalize both texts
-    norm1 = _normalize_text(text1)
-    norm2 = _normalize_text(text2)
+    return _prepared_similarity(_prepare_text(text1), _prepare_text(text2))
+
+
+@functools.lru_cache(maxsize=4096)
+def _prepare_text(text: str) -> _Prepared:
+    """Normalize and tokenize a text once so it can be compared many times.
+
+    Results are cached by text, so issues that have not changed are not
+    re-processed by later searches in the same process.
+
+    Args:
+        text: Raw text.
+
+    Returns:
+        Tuple of (normalized text, word token set).
+    """
+    if not text:
+        return "", frozenset()
+
+    # Same steps as _normalize_text followed by _tokenize, but the word list
+    # from the single split feeds both the normalized text and the token set.
+    words = text.lower().translate(_PUNCTUATION_TABLE).split()
+    return " ".join(words), frozenset(words)
+
+
+def _prepared_similarity(prep1: _Prepared, prep2: _Prepared) -> float:
+    """Calculate similarity between two texts already passed through _prepare_text.
+
+    Args:
+        prep1: First prepared text.
+        prep2: Second prepared text.
+
+    Returns:
+        Similarity score from 0.0 (completely different) to 1.0 (identical).
+    """
+    norm1, tokens1 = prep1
+    norm2, tokens2 = prep2
 
     if not norm1 and not norm2:
         return 1.0
@@ -153,11 +271,11 @@ def calculate_similarity(text1: str, text2: str) -> float:
         return 0.0
 
     # For very short texts (< 20 chars), use Levenshtein
-    if len(norm1) < 20 or len(norm2) < 20:
+    if len(norm1) < _SHORT_TEXT_LENGTH or len(norm2) < _SHORT_TEXT_LENGTH:
         return _normalized_levenshtein_similarity(norm1, norm2)
 
     # For longer texts, use Jaccard similarity with word tokens
-    jaccard = _jaccard_similarity(norm1, norm2)
+    jaccard = _jaccard_tokens(tokens1, tokens2)
 
     # Also calculate character-level similarity for short phrases
     # and combine with Jaccard for better accuracy
@@ -168,6 +286,71 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return 0.7 * jaccard + 0.3 * lev
 
 
+def _similarity_upper_bound(prep1: _Prepared, prep2: _Prepared) -> float:
+    """Cheap upper bound on _prepared_similarity, computed from lengths only.
+
+    The Levenshtein similarity of two strings can never exceed the ratio of
+    their lengths, and the Jaccard similarity of two sets can never exceed
+    the ratio of their sizes. Pairs whose bound is below the threshold can
+    be skipped without running the quadratic edit-distance computation.
+
+    Args:
+        prep1: First prepared text.
+        prep2: Second prepared text.
+
+    Returns:
+        Value that is greater than or equal to the real similarity score.
+    """
+    norm1, tokens1 = prep1
+    norm2, tokens2 = prep2
+
+    if not norm1 or not norm2:
+        return 1.0
+
+    len1, len2 = len(norm1), len(norm2)
+    length_ratio = min(len1, len2) / max(len1, len2)
+    if len1 < _SHORT_TEXT_LENGTH or len2 < _SHORT_TEXT_LENGTH:
+        return length_ratio
+
+    size1, size2 = len(tokens1), len(tokens2)
+    token_ratio = min(size1, size2) / max(size1, size2)
+    return 0.7 * token_ratio + 0.3 * length_ratio
+
+
+def _similarity_at_least(prep1: _Prepared, prep2: _Prepared, threshold: float) -> Optional[float]:
+    """Score two prepared texts, giving up early if they cannot reach threshold.
+
+    Checks run cheapest first: the length bound, then (for longer texts) the
+    exact token overlap combined with the length bound, and only then the
+    Levenshtein distance. The result is the same as _prepared_similarity for
+    every pair that reaches the threshold.
+
+    Args:
+        prep1: First prepared text.
+        prep2: Second prepared text.
+        threshold: Minimum similarity of interest.
+
+    Returns:
+        Similarity score if it is at least threshold, None otherwise.
+    """
+    cutoff = threshold - _BOUND_EPSILON
+    if _similarity_upper_bound(prep1, prep2) < cutoff:
+        return None
+
+    norm1, tokens1 = prep1
+    norm2, tokens2 = prep2
+    if len(norm1) >= _SHORT_TEXT_LENGTH and len(norm2) >= _SHORT_TEXT_LENGTH:
+        jaccard = _jaccard_tokens(tokens1, tokens2)
+        length_ratio = min(len(norm1), len(norm2)) / max(len(norm1), len(norm2))
+        if 0.7 * jaccard + 0.3 * length_ratio < cutoff:
+            return None
+        similarity = 0.7 * jaccard + 0.3 * _normalized_levenshtein_similarity(norm1, norm2)
+    else:
+        similarity = _prepared_similarity(prep1, prep2)
+
+    return similarity if similarity >= threshold else None
+
+
 def _combine_issue_text(issue: Issue) -> str:
     """Combine issue title and description for comparison.
 
@@ -198,18 +381,41 @@ def find_similar_issues(
         List of (issue, similarity_score) tuples for issues above threshold,
         sorted by similarity score in descending order.
     """
+    return find_similar_texts(
+        query, ((issue, issue.title, issue.description) for issue in issues), threshold
+    )
+
+
+def find_similar_texts(
+    query: str,
+    entries: Iterable[Tuple[T, str, Optional[str]]],
+    threshold: float = 0.6,
+) -> List[Tuple[T, float]]:
+    """Find entries whose title and description are similar to a query text.
+
+    Works on plain (key, title, description) tuples so callers that only
+    need IDs and titles don't have to build full Issue objects.
+
+    Args:
+        query: Query text to compare against.
+        entries: (key, title, description) tuples to search through.
+        threshold: Minimum similarity threshold (0.0 to 1.0).
+
+    Returns:
+        List of (key, similarity_score) tuples for entries above threshold,
+        sorted by similarity score in descending order.
+    """
     results = []
+    query_prep = _prepare_text(query)
 
-    for issue in issues:
+    for key, title, description in entries:
         # Combine title and description for comparison
-        issue_text = _combine_issue_text(issue)
-
-        # Calculate similarity
-        similarity = calculate_similarity(query, issue_text)
+        text = f"{title} {description}" if description else title
+        similarity = _similarity_at_least(query_prep, _prepare_text(text), threshold)
 
         # Only include if above threshold
-        if similarity >= threshold:
-            results.append((issue, similarity))
+        if similarity is not None:
+            results.append((key, similarity))
 
     # Sort by similarity score (highest first)
     results.sort(key=lambda x: x[1], reverse=True)
@@ -217,14 +423,167 @@ def find_similar_issues(
     return results
 
 
+def _build_candidate_index(
+    prepared: List[_Prepared], threshold: float
+) -> Optional[_CandidateIndex]:
+    """Build an inverted word index for finding the pairs worth scoring.
+
+    Two long texts that share no word score at most
+    _NO_SHARED_WORD_MAX_SCORE, so above that threshold a long text only
+    needs to be compared with long texts sharing a word with it, and with
+    every short text (scored on edit distance alone).
+
+    Args:
+        prepared: Prepared texts of all issues, in grouping order.
+        threshold: Minimum similarity threshold.
+
+    Returns:
+        The index, or None if the threshold is too low for shared words to
+        be required.
+    """
+    if threshold <= _NO_SHARED_WORD_MAX_SCORE:
+        return None
+
+    postings: Dict[str, List[int]] = {}
+    short_rows = []
+    for row, (norm, tokens) in enumerate(prepared):
+        if len(norm) < _SHORT_TEXT_LENGTH:
+            short_rows.append(row)
+        else:
+            for token in tokens:
+                postings.setdefault(token, []).append(row)
+    return postings, short_rows
+
+
+def _later_candidates(
+    prepared: List[_Prepared], index: Optional[_CandidateIndex], i: int
+) -> Sequence[int]:
+    """List the rows after i that could reach the threshold against row i.
+
+    Args:
+        prepared: Prepared texts of all issues, in grouping order.
+        index: Result of _build_candidate_index.
+        i: Row to find candidates for.
+
+    Returns:
+        Ascending row indexes greater than i.
+    """
+    norm, tokens = prepared[i]
+    if index is None or len(norm) < _SHORT_TEXT_LENGTH:
+        return range(i + 1, len(prepared))
+
+    postings, short_rows = index
+    candidates = {j for token in tokens for j in postings[token] if j > i}
+    candidates.update(short_rows[bisect.bisect_right(short_rows, i) :])
+    return sorted(candidates)
+
+
+def _match_rows(
+    prepared: List[_Prepared], rows: Iterable[int], threshold: float
+) -> List[Tuple[int, List[Tuple[int, float]]]]:
+    """Score each given row against every later row.
+
+    Args:
+        prepared: Prepared texts of all issues, in grouping order.
+        rows: Indexes of the rows to score.
+        threshold: Minimum similarity threshold.
+
+    Returns:
+        List of (row, matches) pairs, where matches holds (index, score) for
+        every later index whose similarity reaches the threshold, in order.
+    """
+    index = _build_candidate_index(prepared, threshold)
+    results = []
+    for i in rows:
+        primary_prep = prepared[i]
+        matches = []
+        for j in _later_candidates(prepared, index, i):
+            similarity = _similarity_at_least(primary_prep, prepared[j], threshold)
+            if similarity is not None:
+                matches.append((j, similarity))
+        results.append((i, matches))
+    return results
+
+
+# Prepared texts shared with pool workers, set once per worker process.
+_worker_prepared: List[_Prepared] = []
+
+
+def _init_match_worker(prepared: List[_Prepared]) -> None:
+    """Store the prepared texts in a pool worker so tasks only carry row indexes."""
+    global _worker_prepared
+    _worker_prepared = prepared
+
+
+def _match_rows_in_worker(
+    rows: List[int], threshold: float
+) -> List[Tuple[int, List[Tuple[int, float]]]]:
+    """Run _match_rows in a pool worker against its stored prepared texts."""
+    return _match_rows(_worker_prepared, rows, threshold)
+
+
+def _parallel_matches(
+    prepared: List[_Prepared], threshold: float, workers: int
+) -> Optional[Dict[int, List[Tuple[int, float]]]]:
+    """Score all pairs across a process pool.
+
+    Rows are dealt out round-robin, so each worker gets a similar share of
+    the triangular pair matrix.
+
+    Args:
+        prepared: Prepared texts of all issues, in grouping order.
+        threshold: Minimum similarity threshold.
+        workers: Number of worker processes.
+
+    Returns:
+        Mapping of row index to its matches, or None if no process pool
+        could be started on this platform.
+    """
+    # multiprocessing is only loaded for the rare run big enough to need it;
+    # importing it up front would slow down every CLI invocation.
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    chunks = [list(range(k, len(prepared), workers)) for k in range(workers)]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_match_worker, initargs=(prepared,)
+        ) as pool:
+            futures = [pool.submit(_match_rows_in_worker, rows, threshold) for rows in chunks]
+            return {i: matches for future in futures for i, matches in future.result()}
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return None
+
+
+def _usable_cpu_count() -> int:
+    """Return how many CPUs this process may run on.
+
+    Honors CPU affinity, and with it most container CPU limits, where the
+    platform exposes it; otherwise falls back to the host CPU count.
+
+    Returns:
+        Number of usable CPUs, at least 1.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
 def find_duplicate_groups(
-    issues: List[Issue], threshold: float = 0.7
+    issues: List[Issue], threshold: float = 0.7, workers: Optional[int] = None
 ) -> List[List[Tuple[Issue, float]]]:
     """Find groups of potentially duplicate issues.
 
+    Pairwise scoring is spread over a process pool for large issue sets; the
+    grouping itself is then replayed in order, so the result is the same as
+    a sequential run.
+
     Args:
         issues: List of all issues to analyze.
         threshold: Minimum similarity threshold for duplicates.
+        workers: Number of processes for pairwise scoring. Defaults to the
+            number of usable CPUs, and is capped by it; 1 disables the pool.
 
     Returns:
         List of duplicate groups. Each group is a list of (issue, similarity_score)
@@ -241,29 +600,47 @@ def find_duplicate_groups(
     # Sort issues by ID to ensure consistent ordering
     sorted_issues = sorted(issues, key=lambda x: x.id if x.id else 0)
 
+    # Normalize and tokenize every issue once instead of once per pair
+    prepared = [_prepare_text(_combine_issue_text(issue)) for issue in sorted_issues]
+
+    # Score every pair up front in parallel when the set is large enough to
+    # pay for the worker processes
+    usable_cpus = _usable_cpu_count()
+    workers = min(usable_cpus if workers is None else workers, usable_cpus, _MAX_WORKERS)
+    all_matches = None
+    if workers > 1 and len(sorted_issues) >= _PARALLEL_MIN_ISSUES:
+        all_matches = _parallel_matches(prepared, threshold, workers)
+    index = _build_candidate_index(prepared, threshold) if all_matches is None else None
+
     for i, primary_issue in enumerate(sorted_issues):
         # Skip if this issue is already in a group
         if primary_issue.id in grouped_ids:
             continue
 
         # Find all similar issues to this one
-        primary_text = _combine_issue_text(primary_issue)
+        primary_prep = prepared[i]
         group = [(primary_issue, 1.0)]  # Primary has 100% similarity to itself
 
-        # Compare with remaining issues
-        for other_issue in sorted_issues[i + 1 :]:
-            # Skip if already grouped
-            if other_issue.id in grouped_ids:
+        # Compare with remaining issues (lazily, so issues grouped meanwhile
+        # are never scored), or replay the matches scored by the pool
+        matches: Iterable[Tuple[int, Optional[float]]]
+        if all_matches is None:
+            matches = (
+                (j, _similarity_at_least(primary_prep, prepared[j], threshold))
+                for j in _later_candidates(prepared, index, i)
+                if sorted_issues[j].id not in grouped_ids
+            )
+        else:
+            matches = all_matches[i]
+
+        for j, similarity in matches:
+            other_issue = sorted_issues[j]
+            # Skip if already grouped or below threshold
+            if similarity is None or other_issue.id in grouped_ids:
                 continue
 
-            # Calculate similarity
-            other_text = _combine_issue_text(other_issue)
-            similarity = calculate_similarity(primary_text, other_text)
-
-            # If above threshold, add to group
-            if similarity >= threshold:
-                group.append((other_issue, similarity))
-                grouped_ids.add(other_issue.id)
+            group.append((other_issue, similarity))
+            grouped_ids.add(other_issue.id)
 
         # Only add groups with duplicates (more than just the primary)
         if len(group) > 1:
@@ -2502,9 +2502,7 @@ def create_issue() -> Union[str, Response]:
         assert created.id is not None  # ID is always assigned after creation
 
         if tags_str:
-            for tag in tags_str.split(","):
-                if tag_name := tag.strip():
-                    repo.add_issue_tag(created.id, tag_name)
+            repo.add_issue_tags(created.id, [t.strip() for t in tags_str.split(",") if t.strip()])
 
         return redirect(url_for("issue_detail", issue_id=created.id))
 
@@ -2570,11 +2568,8 @@ def edit_issue(issue_id: int) -> Union[str, Response]:
         if tags_str:
             new_tags = {t.strip() for t in tags_str.split(",") if t.strip()}
 
-        for tag in new_tags - current_tags:
-            repo.add_issue_tag(issue_id, tag)
-
-        for tag in current_tags - new_tags:
-            repo.remove_issue_tag(issue_id, tag)
+        repo.add_issue_tags(issue_id, sorted(new_tags - current_tags))
+        repo.remove_issue_tags(issue_id, sorted(current_tags - new_tags))
 
         return redirect(url_for("issue_detail", issue_id=issue_id))
 
@@ -2752,9 +2747,7 @@ def api_create_issue() -> Any:
 
     if "tags" in data:
         tags_str = data["tags"]
-        for tag in tags_str.split(","):
-            if tag_name := tag.strip():
-                repo.add_issue_tag(issue_id, tag_name)
+        repo.add_issue_tags(issue_id, [t.strip() for t in tags_str.split(",") if t.strip()])
 
     if request.is_json:
         # Refetch to include tags
@@ -2821,11 +2814,8 @@ def api_update_issue(issue_id: int) -> Any:
         current_tags = {t.name for t in repo.get_issue_tags(issue_id)}
         new_tags = {t.strip() for t in tags_str.split(",") if t.strip()}
 
-        for tag in new_tags - current_tags:
-            repo.add_issue_tag(issue_id, tag)
-
-        for tag in current_tags - new_tags:
-            repo.remove_issue_tag(issue_id, tag)
+        repo.add_issue_tags(issue_id, sorted(new_tags - current_tags))
+        repo.remove_issue_tags(issue_id, sorted(current_tags - new_tags))
 
     if request.is_json:
         updated = repo.get_issue(issue_id)
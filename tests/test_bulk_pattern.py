@@ -113,6 +113,23 @@ class TestBulkPatternOperations:
         )
         assert len(matches) == 2
 
+    def test_find_by_pattern_regex_keeps_escape_case(self, repo, sample_issues):
+        """Test that case-insensitive regexes are not lower-cased before compiling."""
+        # Lower-casing \S would turn it into \s and match nothing here.
+        matches = repo.find_by_pattern(title_pattern=r"^\S+ in auth", use_regex=True)
+        assert sorted(issue.title for issue in matches) == [
+            "Bug in authentication",
+            "Bug in authorization",
+        ]
+
+    def test_find_by_pattern_glob_spans_lines_and_is_anchored(self, repo):
+        """Test that globs match whole multi-line text, not substrings."""
+        repo.create_issue(Issue(title="Crash report", description="Steps:\nApp CRASHES on start"))
+        repo.create_issue(Issue(title="Another crash report", description="No newline"))
+
+        matches = repo.find_by_pattern(title_pattern="crash*", desc_pattern="*crashes*")
+        assert [issue.title for issue in matches] == ["Crash report"]
+
     def test_find_by_pattern_description_glob(self, repo, sample_issues):
         """Test finding issues by glob pattern in description."""
         # Match descriptions containing "SonarQube"
@@ -540,3 +557,31 @@ class TestBulkPatternCLI:
         data = json.loads(result)
         assert data["count"] == 2
         assert "Would delete" in data["message"]
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    @pytest.mark.parametrize("pattern", ["sonarqube*", "nothing*"])
+    def test_cli_bulk_pattern_streamed_json(self, cli, sample_issues, monkeypatch, pretty, pattern):
+        """Test that streamed JSON output matches the returned document."""
+        import io
+
+        from issuedb import cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+        expected = cli.bulk_close_pattern(title_pattern=pattern, dry_run=True, as_json=True)
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-8")
+        result = cli.bulk_close_pattern(title_pattern=pattern, dry_run=True, as_json=True, out=out)
+        out.flush()
+
+        assert result == ""
+        assert raw.getvalue().decode() == expected + "\n"
+
+    def test_cli_bulk_pattern_streamed_text(self, cli, sample_issues):
+        """Test that text output can be streamed as well."""
+        import io
+
+        expected = cli.bulk_close_pattern(title_pattern="sonarqube*", dry_run=True)
+        out = io.StringIO()
+        assert cli.bulk_close_pattern(title_pattern="sonarqube*", dry_run=True, out=out) == ""
+        assert out.getvalue() == expected + "\n"
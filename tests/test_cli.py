@@ -1,12 +1,17 @@
 """Tests for CLI module."""
 
+import io
 import json
+import subprocess
+import sys
 import tempfile
+from datetime import datetime
 
 import pytest
 
+from issuedb import cli as cli_module
 from issuedb.cli import CLI
-from issuedb.models import Issue
+from issuedb.models import Issue, Priority, Tag
 
 
 class TestCLI:
@@ -180,6 +185,18 @@ class TestCLI:
         assert "CREATE" in output
         assert "UPDATE" in output
 
+        # Each entry starts with the separator, followed by one field per line
+        entries = output.split("-" * 50 + "\n")[1:]
+        assert len(entries) == 2
+        update = next(e for e in entries if "Action: UPDATE" in e).splitlines()
+        assert update[1:] == [
+            f"Issue ID: {issue_id}",
+            "Action: UPDATE",
+            "Field: status",
+            "Old Value: open",
+            "New Value: closed",
+        ]
+
         # Test JSON output
         json_output = cli.get_audit_logs(issue_id=issue_id, as_json=True)
         data = json.loads(json_output)
@@ -224,6 +241,103 @@ class TestCLI:
         data = json.loads(json_output)
         assert data["total_issues"] == 2
 
+    def test_format_output_issue_list_layout(self, cli):
+        """Test that listed issues are separated by one blank line."""
+        created = datetime(2024, 5, 1, 9, 30, 15, 123456)
+        issues = [
+            Issue(id=1, title="First", created_at=created, updated_at=created),
+            Issue(id=2, title="Second", created_at=created, updated_at=created),
+        ]
+
+        output = cli.format_output(issues)
+
+        assert output == "\n\n".join(cli._format_issue(i) for i in issues)
+        assert "Created: 2024-05-01 09:30:15\n" in output
+
+    @pytest.mark.parametrize("as_json,pretty", [(False, True), (True, True), (True, False)])
+    def test_format_output_stream_matches_format_output(self, cli, monkeypatch, as_json, pretty):
+        """Test that streamed listings are byte-for-byte the returned text plus a newline."""
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+        cli.create_issue("First", description="Line one\nline two")
+        cli.create_issue("Second", priority="high")
+        issues = cli.repo.list_issues()
+
+        out = io.StringIO()
+        cli.format_output_stream(issues, out, as_json=as_json)
+
+        assert out.getvalue() == cli.format_output(issues, as_json=as_json) + "\n"
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_json_stream_to_binary_buffer(self, cli, monkeypatch, pretty, encoding):
+        """Test that JSON written through a stream's byte buffer matches the text output."""
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+        cli.create_issue("Café crash", description="Line one\nline two")
+        cli.create_issue("Second", priority="high")
+        issues = cli.repo.list_issues()
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding=encoding)
+        out.write("before\n")
+        cli.format_output_stream(issues, out, as_json=True)
+        out.flush()
+
+        expected = "before\n" + cli.format_output(issues, as_json=True) + "\n"
+        assert raw.getvalue() == expected.encode(encoding)
+
+    def test_list_issues_to_stream(self, cli):
+        """Test that list_issues writes to the given stream and returns nothing."""
+        cli.create_issue("Streamed")
+        out = io.StringIO()
+
+        assert cli.list_issues(out=out) == ""
+        assert out.getvalue() == cli.list_issues() + "\n"
+
+        out = io.StringIO()
+        cli.search_issues("Nothing matches", out=out)
+        assert out.getvalue() == "No issues found.\n"
+
+    @pytest.mark.parametrize("as_json", [False, True])
+    def test_audit_logs_and_comments_to_stream(self, cli, as_json):
+        """Test that audit logs and comments stream the same output they return."""
+        cli.create_issue("Streamed")
+        cli.update_issue(1, status="closed")
+        cli.add_comment(1, "First")
+        cli.add_comment(1, "Second")
+
+        out = io.StringIO()
+        assert cli.get_audit_logs(issue_id=1, as_json=as_json, out=out) == ""
+        assert out.getvalue() == cli.get_audit_logs(issue_id=1, as_json=as_json) + "\n"
+
+        out = io.StringIO()
+        assert cli.list_comments(1, as_json=as_json, out=out) == ""
+        assert out.getvalue() == cli.list_comments(1, as_json=as_json) + "\n"
+        assert out.getvalue().count("First") == 1
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_json_object_stream_to_binary_buffer(self, cli, monkeypatch, pretty):
+        """Test that single issues and dicts are streamed as JSON bytes too."""
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+        cli.create_issue("Café crash")
+        issue = cli.repo.get_issue(1)
+        summary = cli.repo.get_summary()
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-8")
+        out.write("before\n")
+        cli.format_output_stream(issue, out, as_json=True)
+        cli.format_output_stream(summary, out, as_json=True)
+        out.flush()
+
+        expected = (
+            "before\n"
+            + cli.format_output(issue, as_json=True)
+            + "\n"
+            + cli.format_output(summary, as_json=True)
+            + "\n"
+        )
+        assert raw.getvalue() == expected.encode()
+
     def test_format_output_various_types(self, cli):
         """Test formatting various data types."""
         # Test Issue
@@ -237,6 +351,11 @@ class TestCLI:
         assert "ID: 1" in output
         assert "ID: 2" in output
 
+        # Test lists that are not issue lists
+        assert cli.format_output([]) == "No issues found."
+        assert cli.format_output([1, 2]) == "[1, 2]"
+        assert json.loads(cli.format_output([{"a": 1}], as_json=True)) == [{"a": 1}]
+
         # Test dict
         data = {"key": "value", "another_key": 123}
         output = cli.format_output(data)
@@ -276,6 +395,82 @@ class TestCLI:
         assert result["count"] == 1
         assert len(result["issues"]) == 1
 
+    @pytest.mark.parametrize("pretty", [True, False])
+    @pytest.mark.parametrize("count", [0, 2])
+    def test_bulk_json_output_streamed(self, cli, monkeypatch, pretty, count):
+        """Test that streamed bulk JSON output matches the returned document."""
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+        issues = [Issue(id=i, title=f"Issue {i}") for i in range(1, count + 1)]
+        expected = cli._format_bulk_json_output("Created 2 issue(s)", issues, True, None)
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-8")
+        assert cli._format_bulk_json_output("Created 2 issue(s)", issues, True, out) == ""
+        out.flush()
+
+        assert raw.getvalue().decode() == expected + "\n"
+
+    def test_bulk_create_streams_to_out(self, cli):
+        """Test that bulk create writes its text output to the given stream."""
+        out = io.StringIO()
+
+        assert cli.bulk_create('[{"title": "Streamed"}]', out=out) == ""
+        assert out.getvalue().startswith("Message: Created 1 issue(s)\n")
+        assert out.getvalue().endswith("\n")
+
+    def test_bulk_create_from_bytes(self, cli):
+        """Test bulk creating issues from raw UTF-8 bytes, as read from a file."""
+        output = cli.bulk_create('[{"title": "Café"}]'.encode(), as_json=True)
+
+        assert json.loads(output)["issues"][0]["title"] == "Café"
+
+    def test_bulk_create_from_stream(self, cli):
+        """Test bulk creating issues from a binary stream, as JSON or NDJSON."""
+        array = io.BytesIO(b'\n  [{"title": "One"},\n {"title": "Two"}]\n')
+        ndjson = io.BytesIO(b'{"title": "Three"}\n\n{"title": "Four", "priority": "high"}\n')
+
+        assert json.loads(cli.bulk_create(array, as_json=True))["count"] == 2
+        created = json.loads(cli.bulk_create(ndjson, as_json=True))["issues"]
+        assert [(i["title"], i["priority"]) for i in created] == [
+            ("Three", "medium"),
+            ("Four", "high"),
+        ]
+
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            cli.bulk_create(io.BytesIO(b'{"title": "Five"}\nnot json\n'))
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize(
+        "data",
+        [b'{"title": "One"}\n', b'\n{\n  "title": "One",\n  "priority": "high"\n}\n'],
+        ids=["single-line", "pretty-printed"],
+    )
+    def test_bulk_create_rejects_object_stream(self, cli, monkeypatch, data, use_orjson):
+        """Test that a stream holding one object is rejected rather than read as NDJSON."""
+        if not use_orjson:
+            monkeypatch.setattr(cli_module, "_orjson", lambda: None)
+
+        with pytest.raises(ValueError, match="must be a list"):
+            cli.bulk_create(io.BytesIO(data))
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_bulk_create_from_file(self, cli, monkeypatch, tmp_path, use_orjson):
+        """Test that a JSON array file parses from wherever the stream is positioned."""
+        if not use_orjson:
+            monkeypatch.setattr(cli_module, "_orjson", lambda: None)
+        path = tmp_path / "issues.json"
+        path.write_bytes('skipped\n\n[{"title": "Café"}, {"title": "Two"}]\n'.encode())
+        bad = tmp_path / "bad.json"
+        bad.write_bytes(b'[{"title": "Broken"\n')
+
+        with open(path, "rb") as f:
+            f.readline()
+            created = json.loads(cli.bulk_create(f, as_json=True))["issues"]
+        assert [issue["title"] for issue in created] == ["Café", "Two"]
+
+        with open(bad, "rb") as f, pytest.raises(ValueError, match="Invalid JSON"):
+            cli.bulk_create(f)
+
     def test_bulk_create_invalid_json(self, cli):
         """Test bulk create with invalid JSON."""
         with pytest.raises(ValueError, match="Invalid JSON"):
@@ -326,6 +521,15 @@ class TestCLI:
         result = json.loads(json_output)
         assert result["count"] == 3
 
+    def test_bulk_update_issues_requires_an_update(self, cli):
+        """Test that bulk update rejects filters without a new status or priority."""
+        cli.create_issue("Untouched")
+
+        with pytest.raises(ValueError, match="No updates specified"):
+            cli.bulk_update_issues(filter_status="open")
+
+        assert "Updated 1 issue(s)" in cli.bulk_update_issues(new_priority="high")
+
     def test_bulk_update_json_invalid_json(self, cli):
         """Test bulk update with invalid JSON."""
         with pytest.raises(ValueError, match="Invalid JSON"):
@@ -451,6 +655,20 @@ class TestCLI:
         assert data[0]["status"] == "wont-do"
         assert data[0]["title"] == "Won't do issue"
 
+    def test_list_blocked_issues_text(self, cli):
+        """Test the text listing of blocked issues and their blockers."""
+        blocked = cli.repo.create_issue(Issue(title="Blocked", priority=Priority.HIGH))
+        first = cli.repo.create_issue(Issue(title="First blocker"))
+        second = cli.repo.create_issue(Issue(title="Second blocker"))
+        cli.repo.add_dependency(blocked.id, first.id)
+        cli.repo.add_dependency(blocked.id, second.id)
+
+        assert cli.list_blocked_issues() == (
+            "Found 1 blocked issue(s):\n\n"
+            f"Issue #{blocked.id}: Blocked [open, high]\n"
+            f"  Blocked by: #{first.id}, #{second.id}\n"
+        )
+
     def test_summary_includes_wont_do(self, cli):
         """Test that summary includes wont-do status."""
         cli.create_issue("Open issue", status="open")
@@ -462,3 +680,289 @@ class TestCLI:
         assert data["total_issues"] == 3
         # Check that wont-do is included in status breakdown
         assert "wont-do" in data["by_status"] or "wont_do" in data["by_status"]
+
+
+class TestJSONHelpers:
+    """Test the JSON serialization helpers used by the CLI."""
+
+    DATA = {"title": "Café crash", "count": 3, "ratio": 0.5, "tags": ["a", "b"], "x": None}
+
+    def test_dumps_matches_stdlib(self):
+        """Test that _dumps produces the same text as indented stdlib JSON."""
+        assert cli_module._dumps(self.DATA) == json.dumps(self.DATA, indent=2, ensure_ascii=False)
+
+    def test_dumps_compact(self, monkeypatch):
+        """Test that compact mode drops all optional whitespace."""
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", False)
+        expected = json.dumps(self.DATA, separators=(",", ":"), ensure_ascii=False)
+
+        assert cli_module._dumps(self.DATA) == expected
+        monkeypatch.setattr(cli_module, "_orjson", lambda: None)
+        assert cli_module._dumps(self.DATA) == expected
+
+    def test_dumps_without_orjson(self, monkeypatch):
+        """Test the standard library fallback."""
+        monkeypatch.setattr(cli_module, "_orjson", lambda: None)
+        assert json.loads(cli_module._dumps(self.DATA)) == self.DATA
+
+    def test_dumps_bytes_matches_dumps(self, monkeypatch):
+        """Test that _dumps_bytes is the UTF-8 encoding of _dumps, with or without orjson."""
+        for pretty in (True, False):
+            monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+            assert cli_module._dumps_bytes(self.DATA) == cli_module._dumps(self.DATA).encode()
+        monkeypatch.setattr(cli_module, "_orjson", lambda: None)
+        assert cli_module._dumps_bytes(self.DATA) == cli_module._dumps(self.DATA).encode()
+
+    def test_dumps_non_string_keys(self, monkeypatch):
+        """Test that non-string keys are stringified as the standard library does."""
+        data = {1: "one", "nested": {2.5: None, True: [1]}}
+        for pretty in (True, False):
+            monkeypatch.setattr(cli_module, "_PRETTY_JSON", pretty)
+            expected = cli_module._stdlib_dumps(data)
+            assert cli_module._dumps(data) == expected
+            assert cli_module._dumps_bytes(data) == expected.encode()
+
+    def test_dumps_falls_back_for_big_integers(self):
+        """Test that integers orjson cannot encode go through the standard library."""
+        assert cli_module._dumps({"n": 2**70}) == json.dumps({"n": 2**70}, indent=2)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_native_datetimes(self, monkeypatch, use_orjson):
+        """Test that issues keeping datetime objects serialize like their ISO dicts."""
+        if not use_orjson:
+            monkeypatch.setattr(cli_module, "_orjson", lambda: None)
+        issue = Issue(
+            id=1,
+            title="Dated",
+            created_at=datetime(2024, 5, 1, 9, 30, 15, 120),
+            updated_at=datetime(2024, 5, 2),
+            due_date=datetime(2024, 6, 1),
+            tags=[Tag(id=1, name="ui", created_at=datetime(2024, 1, 1, 8))],
+        )
+
+        assert cli_module._dumps(issue.to_dict(iso_dates=False)) == json.dumps(
+            issue.to_dict(), indent=2, ensure_ascii=False
+        )
+
+    def test_loads_invalid_json_raises_decode_error(self):
+        """Test that invalid input raises json.JSONDecodeError with or without orjson."""
+        with pytest.raises(json.JSONDecodeError):
+            cli_module._loads("[1, 2")
+
+    def test_message_payloads_follow_json_mode(self, monkeypatch):
+        """Test that memory and link messages are serialized like other JSON output."""
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", False)
+        with tempfile.NamedTemporaryFile(suffix=".db") as f:
+            cli = CLI(f.name)
+            assert cli.memory_delete("missing", as_json=True) == (
+                '{"error":"Memory \'missing\' not found"}'
+            )
+            assert cli.unlink_issues(1, 2, as_json=True) == '{"error":"Link not found"}'
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_emit_keeps_order_with_text_writes(self, monkeypatch, encoding):
+        """Test that _emit output follows earlier text writes in either encoding."""
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding=encoding)
+        monkeypatch.setattr(cli_module.sys, "stdout", out)
+
+        out.write("before\n")
+        cli_module._emit("Café #1")
+        out.flush()
+
+        assert raw.getvalue() == "before\nCafé #1\n".encode(encoding)
+
+    def test_emit_to_text_only_stream(self, monkeypatch):
+        """Test that _emit falls back to text writes without a binary buffer."""
+        out = io.StringIO()
+        monkeypatch.setattr(cli_module.sys, "stdout", out)
+
+        cli_module._emit("done")
+
+        assert out.getvalue() == "done\n"
+
+
+class TestDurationHelpers:
+    """Test the duration formatting helpers used by the time commands."""
+
+    @pytest.mark.parametrize("seconds", [0, 59, 60, 3599, 3600, 3661, 90061, 5400.9, -30])
+    def test_hms_matches_floor_division(self, seconds):
+        """Test that _hms agrees with the floor-division arithmetic it replaced."""
+        expected = (
+            int(seconds // 3600),
+            int((seconds % 3600) // 60),
+            int(seconds) % 60,
+        )
+        assert cli_module._hms(seconds) == expected
+
+    def test_format_hm(self):
+        """Test the hours-and-minutes form."""
+        assert cli_module._format_hm(5400) == "1h 30m"
+        assert cli_module._format_hm(59.9) == "0h 0m"
+
+
+class TestArgumentParsing:
+    """Test the split between the global-option parser and the full parser."""
+
+    def test_global_parser_spots_fast_path_flags(self):
+        """Test that --prompt and --ollama parse without the subcommands."""
+        parser = cli_module._build_global_parser()
+
+        args, extras = parser.parse_known_args(["--prompt"])
+        assert args.prompt and extras == []
+
+        argv = ["--ollama-port", "1234", "--ollama", "list", "bugs"]
+        args, extras = parser.parse_known_args(argv)
+        assert args.ollama == ["list", "bugs"]
+        assert args.ollama_port == 1234
+        assert extras == []
+
+    def test_global_parser_leaves_subcommands_unparsed(self):
+        """Test that anything beyond the global options is left for the full parser."""
+        args, extras = cli_module._build_global_parser().parse_known_args(["--json", "list"])
+        assert args.json and not args.prompt
+        assert extras == ["list"]
+
+    def test_full_parser_accepts_similarity_commands(self):
+        """Test that find-similar and dedupe are registered before parsing."""
+        parser = cli_module._build_parser()
+
+        args = parser.parse_args(["find-similar", "login bug", "--limit", "3"])
+        assert (args.command, args.query, args.limit, args.threshold) == (
+            "find-similar",
+            "login bug",
+            3,
+            0.6,
+        )
+        assert parser.parse_args(["dedupe"]).threshold == 0.7
+
+    @pytest.mark.parametrize(
+        "argv,handler",
+        [
+            (["list"], "_cmd_list"),
+            (["dedupe"], "_cmd_dedupe"),
+            (["memory", "add", "key", "value"], "_cmd_memory_add"),
+            (["tag", "list"], "_cmd_tag_list"),
+            (["link", "remove", "1", "2"], "_cmd_link_remove"),
+        ],
+    )
+    def test_parsers_carry_their_handlers(self, argv, handler):
+        """Test that parsing a command yields its handler via set_defaults."""
+        args = cli_module._build_parser().parse_args(argv)
+        assert args.handler is getattr(cli_module, handler)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--db", "links", "git-status"],
+            ["--db=links", "git-status"],
+        ],
+    )
+    def test_option_values_are_not_taken_for_commands(self, argv):
+        """Test that a global option value named like a git command is not the command."""
+        args = cli_module._build_parser(argv).parse_args(argv)
+        assert (args.db, args.git_command) == ("links", "git-status")
+
+    def test_parser_is_reused_per_git_command(self, monkeypatch):
+        """Test that repeated invocations share the parser built for their git command."""
+        monkeypatch.setattr(sys, "argv", ["issuedb-cli", "list"])
+        parser = cli_module._build_parser()
+        assert cli_module._build_parser() is parser
+
+        monkeypatch.setattr(sys, "argv", ["issuedb-cli", "git-status"])
+        git_parser = cli_module._build_parser()
+        assert git_parser is not parser
+        assert git_parser.parse_args(["git-status"]).git_command == "git-status"
+
+    @pytest.mark.parametrize("argv", [[], ["memory"], ["lesson"], ["tag"], ["link"]])
+    def test_missing_command_is_a_usage_error(self, argv, capsys):
+        """Test that argparse itself rejects a missing command or subcommand."""
+        with pytest.raises(SystemExit) as excinfo:
+            cli_module._build_parser().parse_args(argv)
+
+        assert excinfo.value.code == 2
+        assert "required" in capsys.readouterr().err
+
+
+class TestImports:
+    """Test what importing the CLI module pulls in."""
+
+    def test_cli_import_skips_command_only_modules(self):
+        """Test that the database, similarity, process and orjson modules load only when needed."""
+        modules = (
+            "subprocess",
+            "multiprocessing",
+            "sqlite3",
+            "orjson",
+            "issuedb.repository",
+            "issuedb.similarity",
+        )
+        code = f"import sys, issuedb.cli; print([m for m in {modules!r} if m in sys.modules])"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.parametrize("arg", ["--help", "no-such-command"])
+    def test_help_and_unknown_commands_skip_the_backend(self, arg):
+        """Test that --help and typos exit before the repository is imported."""
+        code = (
+            "import sys, issuedb.cli\n"
+            f"sys.argv = ['issuedb-cli', {arg!r}]\n"
+            "try:\n"
+            "    issuedb.cli.main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('sqlite3' in sys.modules, 'issuedb.repository' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.splitlines()[-1] == "False False"
+
+
+class TestMain:
+    """Test the issuedb-cli entry point."""
+
+    @pytest.mark.parametrize("command", [["list"], ["--prompt"]])
+    def test_closed_stdout_exits_quietly(self, tmp_path, command):
+        """Test that a reader closing the pipe early gets no traceback or error line."""
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "issuedb.cli", "--db", str(tmp_path / "t.db"), *command],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert proc.stdout is not None
+        proc.stdout.close()
+        _, stderr = proc.communicate(timeout=60)
+
+        assert proc.returncode == 1
+        assert stderr == b""
+
+
+class TestPromptText:
+    """Test loading of the LLM agent prompt."""
+
+    def test_prompt_text_is_read_once(self, monkeypatch, tmp_path):
+        """Test that PROMPT.txt is read on first use and then served from cache."""
+        prompt_file = tmp_path / "PROMPT.txt"
+        prompt_file.write_text("guide v1")
+        monkeypatch.setattr(cli_module, "_PROMPT_FILE", prompt_file)
+        cli_module._prompt_text.cache_clear()
+        try:
+            assert cli_module._prompt_text() == "guide v1"
+            prompt_file.write_text("guide v2")
+            assert cli_module._prompt_text() == "guide v1"
+        finally:
+            cli_module._prompt_text.cache_clear()
+
+    def test_missing_prompt_file(self, monkeypatch, tmp_path):
+        """Test that a missing PROMPT.txt yields None instead of raising."""
+        monkeypatch.setattr(cli_module, "_PROMPT_FILE", tmp_path / "missing.txt")
+        cli_module._prompt_text.cache_clear()
+        try:
+            assert cli_module._prompt_text() is None
+        finally:
+            cli_module._prompt_text.cache_clear()
+
+    def test_packaged_prompt_exists(self):
+        """Test that the bundled prompt file can be read."""
+        assert "issuedb-cli" in (cli_module._prompt_text() or "")
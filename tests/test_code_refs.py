@@ -247,6 +247,36 @@ class TestGetCodeReferences:
         assert refs[0].note == "First reference"
         assert refs[1].note == "Second reference"
 
+    def test_get_references_for_issues(self, repo, sample_issue, temp_file):
+        """Test fetching references for several issues at once."""
+        other = repo.create_issue(Issue(title="Other Issue"))
+        repo.add_code_reference(issue_id=sample_issue.id, file_path=temp_file, start_line=1)
+        repo.add_code_reference(issue_id=sample_issue.id, file_path=temp_file, start_line=2)
+
+        refs_map = repo.get_code_references_for_issues([sample_issue.id, other.id])
+
+        assert [ref.start_line for ref in refs_map[sample_issue.id]] == [1, 2]
+        assert refs_map[other.id] == []
+        assert repo.get_code_references_for_issues([]) == {}
+
+    def test_get_references_for_issues_batches_ids(self, repo, sample_issue, temp_file):
+        """Test that more IDs than SQLite allows per statement are looked up in batches."""
+        import sqlite3
+
+        from issuedb.repository import _MAX_SQL_VARIABLES
+
+        repo.add_code_reference(issue_id=sample_issue.id, file_path=temp_file, start_line=1)
+        with repo.db.get_connection() as conn:
+            if not hasattr(conn, "setlimit"):
+                pytest.skip("Connection.setlimit needs Python 3.11")
+            conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, _MAX_SQL_VARIABLES)
+
+        ids = [sample_issue.id, *range(10_000, 10_000 + 2 * _MAX_SQL_VARIABLES)]
+        refs_map = repo.get_code_references_for_issues(ids)
+
+        assert len(refs_map) == len(ids)
+        assert [ref.start_line for ref in refs_map[sample_issue.id]] == [1]
+
 
 class TestRemoveCodeReference:
     """Test removing code references."""
@@ -529,6 +559,9 @@ class TestIntegration:
         result = cli.get_issue(issue.id)
         assert "Code References:" in result
 
+        # Listings fetch references in bulk and render them the same way
+        assert cli.list_issues() == cli.get_issue(issue.id)
+
         # Detach reference
         result = cli.detach_code_reference(issue_id=issue.id, file_path=temp_file)
         assert "Removed 1 code reference" in result
@@ -2,11 +2,13 @@
 
 import json
 import tempfile
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from issuedb.cli import CLI
+from issuedb.models import AuditLog, Comment, Issue, Priority, Status
 from issuedb.repository import IssueRepository
 
 
@@ -147,6 +149,69 @@ class TestAgentContext:
         # (no "##" sections beyond basic info)
         assert "## Suggested Actions" not in result
 
+    def test_context_text_layout(self, cli):
+        """Test the exact section layout of the text context."""
+        when = datetime(2024, 5, 1, 9, 30, 15)
+        issue = Issue(
+            id=7,
+            title="Layout",
+            description="Body",
+            priority=Priority.HIGH,
+            status=Status.OPEN,
+            created_at=when,
+            updated_at=when,
+        )
+        comments = [Comment(issue_id=7, text="First", created_at=when)]
+
+        result = cli._format_issue_context(
+            issue=issue,
+            comments=comments,
+            audit_logs=[AuditLog(issue_id=7, action="CREATE", timestamp=when)],
+            related_issues=[],
+            git_info={"current_branch": "main", "related_commits": []},
+            suggested_actions=["Do it"],
+        )
+
+        rule = "=" * 60
+        assert result == (
+            f"{rule}\nISSUE CONTEXT\n{rule}\n\n"
+            "## Issue #7\nTitle: Layout\nStatus: open\nPriority: high\n"
+            "Created: 2024-05-01 09:30:15\nUpdated: 2024-05-01 09:30:15\n\n"
+            "## Description\nBody\n\n"
+            "## Comments (1)\n[2024-05-01 09:30] First\n\n"
+            "## Recent Activity (Last 1 changes)\n- 2024-05-01 09:30: Issue created\n\n"
+            "## Git Information\nCurrent branch: main\n"
+            "No commits found mentioning this issue\n\n"
+            "## Suggested Actions\n- Do it\n"
+        )
+
+    def test_context_activity_descriptions(self, cli):
+        """Test the recent-activity wording for each audit action."""
+        when = datetime(2024, 5, 1, 9, 30)
+        issue = Issue(id=7, title="Activity", created_at=when, updated_at=when)
+        logs = [
+            AuditLog(issue_id=7, action="BULK_UPDATE", field_name="status", timestamp=when),
+            AuditLog(issue_id=7, action="UPDATE", timestamp=when),
+            AuditLog(issue_id=7, action="TAG_ADD", timestamp=when),
+            AuditLog(issue_id=7, action="FETCH", timestamp=when),
+        ]
+
+        result = cli._format_issue_context(
+            issue=issue,
+            comments=[],
+            audit_logs=logs,
+            related_issues=[],
+            git_info=None,
+            suggested_actions=[],
+        )
+
+        assert (
+            "## Recent Activity (Last 4 changes)\n"
+            "- 2024-05-01 09:30: status changed from 'None' to 'None'\n"
+            "- 2024-05-01 09:30: Issue updated\n"
+            "- 2024-05-01 09:30: Issue fetched via get-next\n"
+        ) in result
+
     def test_context_comments_included(self, cli, issue_with_history):
         """Test that comments are included in context."""
         result = cli.get_issue_context(issue_with_history, as_json=True)
@@ -251,6 +316,15 @@ class TestAgentContext:
         # Should mention issue is closed
         assert "closed" in action_text or "reopen" in action_text
 
+    def test_context_fetches_comments_once(self, cli, issue_with_history):
+        """Test that suggested actions reuse the comments already loaded."""
+        with patch.object(cli.repo, "get_comments", wraps=cli.repo.get_comments) as spy:
+            context = cli.get_issue_context(issue_with_history, as_json=True, compact=False)
+
+        assert spy.call_count == 1
+        action_text = " ".join(json.loads(context)["suggested_actions"])
+        assert "No comments yet" not in action_text
+
     def test_context_audit_history(self, cli, issue_with_history):
         """Test that audit history is included in full context."""
         result = cli.get_issue_context(
@@ -303,30 +377,19 @@ class TestAgentContext:
     def test_context_with_git_info_mocked(self, cli, issue_with_history):
         """Test context includes git info when available."""
         # Mock subprocess to simulate git repository
-        mock_git_result = MagicMock()
-        mock_git_result.returncode = 0
-        mock_git_result.stdout = "true"
-
         mock_branch_result = MagicMock()
         mock_branch_result.returncode = 0
-        mock_branch_result.stdout = "main"
+        mock_branch_result.stdout = "main\n"
 
-        # Mock for git log calls (3 patterns searched)
+        # Mock for the single git log call covering every pattern
         mock_log_result = MagicMock()
         mock_log_result.returncode = 0
-        mock_log_result.stdout = ""
+        mock_log_result.stdout = f"abc1234 Fix #{issue_with_history}\n"
 
         with patch("subprocess.run") as mock_run:
-            # First call checks if git repo
-            # Second call gets current branch
-            # Next 3 calls are for git log with different patterns
-            mock_run.side_effect = [
-                mock_git_result,
-                mock_branch_result,
-                mock_log_result,
-                mock_log_result,
-                mock_log_result,
-            ]
+            # First call gets the current branch (and detects the repo)
+            # Second call searches the log for all issue patterns at once
+            mock_run.side_effect = [mock_branch_result, mock_log_result]
 
             result = cli.get_issue_context(
                 issue_with_history,
@@ -336,9 +399,46 @@ class TestAgentContext:
 
             data = json.loads(result)
 
-            # Git info might be included
-            if "git_info" in data:
-                assert isinstance(data["git_info"], dict)
+            assert mock_run.call_count == 2
+            assert data["git_info"]["current_branch"] == "main"
+            assert data["git_info"]["related_commits"] == [f"abc1234 Fix #{issue_with_history}"]
+
+    def test_context_without_git_repo(self, cli, issue_with_history):
+        """Test that git info is omitted outside a git repository."""
+        not_a_repo = MagicMock()
+        not_a_repo.returncode = 128
+        not_a_repo.stdout = ""
+
+        with patch("subprocess.run", return_value=not_a_repo) as mock_run:
+            data = json.loads(
+                cli.get_issue_context(issue_with_history, as_json=True, compact=False)
+            )
+
+        assert mock_run.call_count == 1
+        assert "git_info" not in data
+
+    def test_git_info_cached_per_issue(self, cli, issue_with_history):
+        """Test that repeated context lookups reuse the git info."""
+        branch = MagicMock(returncode=0, stdout="main\n")
+        log = MagicMock(returncode=0, stdout="")
+
+        with patch("subprocess.run", side_effect=[branch, log]) as mock_run:
+            first = cli.get_issue_context(issue_with_history, as_json=True, compact=False)
+            second = cli.get_issue_context(issue_with_history, as_json=True, compact=False)
+
+        assert mock_run.call_count == 2
+        assert json.loads(first)["git_info"] == json.loads(second)["git_info"]
+
+    def test_not_git_repo_checked_once(self, cli, issue_with_history):
+        """Test that a failed repository check is not repeated for other issues."""
+        other_id = cli.repo.create_issue(Issue(title="Another issue")).id
+        not_a_repo = MagicMock(returncode=128, stdout="")
+
+        with patch("subprocess.run", return_value=not_a_repo) as mock_run:
+            cli.get_issue_context(issue_with_history, as_json=True, compact=False)
+            cli.get_issue_context(other_id, as_json=True, compact=False)
+
+        assert mock_run.call_count == 1
 
     def test_context_json_serializable(self, cli, issue_with_history):
         """Test that all context data is JSON serializable."""
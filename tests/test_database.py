@@ -2,6 +2,7 @@
 
 import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -57,6 +58,24 @@ class TestDatabase:
             Database._instance = old_instance  # type: ignore[attr-defined]
             Path(".issue.db").unlink(missing_ok=True)
 
+    def test_same_file_under_another_name_reuses_instance(self, temp_db_path, monkeypatch):
+        """Test that another spelling of the open path does not re-create the database."""
+        path = Path(temp_db_path)
+        db = Database(temp_db_path)
+
+        monkeypatch.chdir(path.parent)
+        assert Database(path.name) is db
+        assert Database(f"./{path.name}") is db
+        assert Database(temp_db_path) is db
+
+    def test_different_file_creates_new_instance(self, temp_db_path, tmp_path):
+        """Test that a different path still gets its own database."""
+        db = Database(temp_db_path)
+        other = Database(str(tmp_path / "other.db"))
+
+        assert other is not db
+        assert other.db_path == tmp_path / "other.db"
+
     def test_indexes_created(self, temp_db_path):
         """Test that all required indexes are created."""
         db = Database(temp_db_path)
@@ -90,6 +109,23 @@ class TestDatabase:
             cursor.execute("SELECT 1")
             assert cursor.fetchone()[0] == 1
 
+    def test_every_thread_connection_uses_normal_sync(self, temp_db_path):
+        """Test that synchronous=NORMAL is applied to each thread's connection."""
+        db = Database(temp_db_path)
+        results = []
+
+        def read_sync_mode():
+            with db.get_connection() as conn:
+                results.append(conn.execute("PRAGMA synchronous").fetchone()[0])
+            db.close_connection()
+
+        read_sync_mode()
+        worker = threading.Thread(target=read_sync_mode)
+        worker.start()
+        worker.join()
+
+        assert results == [1, 1]  # 1 == NORMAL
+
     def test_transaction_rollback_on_error(self, temp_db_path):
         """Test that transactions are rolled back on error."""
         db = Database(temp_db_path)
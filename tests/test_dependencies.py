@@ -173,6 +173,25 @@ class TestIssueDependencies:
 
         assert repo.is_blocked(issue2.id) is False
 
+    def test_get_dependency_graph(self, repo, sample_issues):
+        """Test that the combined query matches the separate lookups."""
+        issue1, issue2, issue3 = sample_issues
+
+        # issue2 is blocked by issue1 and blocks issue3
+        repo.add_dependency(issue2.id, issue1.id)
+        repo.add_dependency(issue3.id, issue2.id)
+
+        blockers, blocking, is_blocked = repo.get_dependency_graph(issue2.id)
+        assert [b.id for b in blockers] == [b.id for b in repo.get_blockers(issue2.id)]
+        assert [b.id for b in blocking] == [b.id for b in repo.get_blocking(issue2.id)]
+        assert [b.id for b in blockers] == [issue1.id]
+        assert [b.id for b in blocking] == [issue3.id]
+        assert is_blocked is True
+
+        repo.update_issue(issue1.id, status="closed")
+        assert repo.get_dependency_graph(issue2.id)[2] is False
+        assert repo.get_dependency_graph(issue1.id)[2] is False
+
     def test_get_all_blocked_issues(self, repo, sample_issues):
         """Test getting all issues that are currently blocked."""
         issue1, issue2, issue3 = sample_issues
@@ -186,6 +205,38 @@ class TestIssueDependencies:
         blocked_ids = {i.id for i in blocked_issues}
         assert blocked_ids == {issue2.id, issue3.id}
 
+    def test_get_all_blocked_issues_lists_each_issue_once(self, repo, sample_issues):
+        """Test that an issue with several open blockers is listed once."""
+        issue1, issue2, issue3 = sample_issues
+
+        repo.add_dependency(issue3.id, issue1.id)
+        repo.add_dependency(issue3.id, issue2.id)
+
+        blocked = repo.get_all_blocked_issues()
+        assert [i.id for i in blocked] == [issue3.id]
+        assert repo.get_all_blocked_issues(status="closed") == []
+
+    @pytest.mark.parametrize("batch_size", [999, 1])
+    def test_get_blockers_for_issues(self, repo, sample_issues, monkeypatch, batch_size):
+        """Test batched blocker lookup matches get_blockers for every issue."""
+        import issuedb.repository
+
+        monkeypatch.setattr(issuedb.repository, "_MAX_SQL_VARIABLES", batch_size)
+        issue1, issue2, issue3 = sample_issues
+
+        repo.add_dependency(issue3.id, issue2.id)
+        repo.add_dependency(issue3.id, issue1.id)
+        repo.add_dependency(issue2.id, issue1.id)
+
+        ids = [issue1.id, issue2.id, issue3.id]
+        blockers_map = repo.get_blockers_for_issues(ids)
+        assert set(blockers_map) == set(ids)
+        for issue_id in ids:
+            expected = [b.id for b in repo.get_blockers(issue_id)]
+            assert [b.id for b in blockers_map[issue_id]] == expected
+        assert [b.id for b in blockers_map[issue3.id]] == [issue1.id, issue2.id]
+        assert repo.get_blockers_for_issues([]) == {}
+
     def test_get_all_blocked_issues_excludes_closed_blockers(self, repo, sample_issues):
         """Test that issues with only closed blockers are not included."""
         issue1, issue2, issue3 = sample_issues
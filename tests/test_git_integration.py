@@ -1,10 +1,20 @@
 """Tests for git integration features."""
 
+import argparse
+import os
+import sys
 import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from issuedb import cli as cli_module
+from issuedb.git_cli import _head_mtime_ns
+from issuedb.git_cli_integration import (
+    _resolve_ref,
+    dispatch_git_command,
+    register_git_parsers,
+)
 from issuedb.git_repository import GitLinkRepository
 from issuedb.git_utils import (
     get_commit_message,
@@ -538,3 +548,198 @@ class TestGitLinkRepository:
         # Check details indicate link exists
         assert result2["details"][0]["action"] == "skipped"
         assert "already exists" in result2["details"][0]["reason"]
+
+    def test_scan_commits_same_issue_closed_once(self, git_repo, repo):
+        """Test an issue referenced by several commits is linked to each but closed once."""
+        issue = repo.create_issue(Issue(title="Issue", priority=Priority.HIGH, status=Status.OPEN))
+
+        commits = [
+            {"hash": "abc123", "message": f"Fixes #{issue.id}"},
+            {"hash": "def456", "message": f"Closes #{issue.id} for real"},
+            {"hash": "abc123", "message": f"Fixes #{issue.id}"},
+        ]
+
+        result = git_repo.scan_commits_and_close_issues(commits, auto_close=True)
+
+        assert result["scanned"] == 3
+        assert result["links_created"] == 2
+        assert result["issues_closed"] == 1
+        assert [d["action"] for d in result["details"]] == ["linked", "closed", "linked", "skipped"]
+        assert len(git_repo.get_links(issue.id)) == 2
+        assert repo.get_issue(issue.id).status == Status.CLOSED
+
+    def test_scan_commits_batches_issue_lookups(self, git_repo, repo, monkeypatch):
+        """Test that referenced issues are looked up in batches of bound variables."""
+        import issuedb.git_repository
+
+        monkeypatch.setattr(issuedb.git_repository, "MAX_SQL_VARIABLES", 2)
+        issues = [repo.create_issue(Issue(title=f"Issue {n}")) for n in range(5)]
+        git_repo.add_link(issues[4].id, "commit", "abc123")
+        refs = ", ".join(f"fixes #{issue.id}" for issue in issues)
+
+        result = git_repo.scan_commits_and_close_issues(
+            [{"hash": "abc123", "message": f"{refs}, see #999"}]
+        )
+
+        assert result["links_created"] == 4
+        assert result["issues_closed"] == 5
+        actions = {(d["issue_id"], d["action"]) for d in result["details"]}
+        assert (issues[4].id, "skipped") in actions
+        assert (999, "skipped") in actions
+        assert all(repo.get_issue(issue.id).status == Status.CLOSED for issue in issues)
+
+    def test_add_link_and_scan_write_the_same_audit_entry(self, git_repo, repo):
+        """Test that both ways of linking a commit record a LINK_ADD audit entry."""
+        first = repo.create_issue(Issue(title="Linked by hand"))
+        second = repo.create_issue(Issue(title="Linked by scan"))
+
+        git_repo.add_link(first.id, "commit", "abc123")
+        git_repo.scan_commits_and_close_issues(
+            [{"hash": "def456", "message": f"Refs #{second.id}"}], auto_close=False
+        )
+
+        for issue_id, reference in ((first.id, "abc123"), (second.id, "def456")):
+            logs = [log for log in repo.get_audit_logs(issue_id) if log.action == "LINK_ADD"]
+            assert [(log.field_name, log.new_value) for log in logs] == [("commit", reference)]
+
+
+class TestGitCommandIntegration:
+    """Test git subcommand registration and dispatch."""
+
+    def test_head_mtime_follows_gitdir_file(self, tmp_path):
+        """Test a worktree's .git file is followed to the HEAD it points at."""
+        git_dir = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/feature\n")
+        worktree = tmp_path / "wt"
+        (worktree / "src").mkdir(parents=True)
+        (worktree / ".git").write_text("gitdir: ../main/.git/worktrees/wt\n")
+
+        os.utime(git_dir / "HEAD", ns=(1_000_000_000, 1_000_000_000))
+        assert _head_mtime_ns(str(worktree / "src")) == 1_000_000_000
+
+        os.utime(git_dir / "HEAD", ns=(2_000_000_000, 2_000_000_000))
+        assert _head_mtime_ns(str(worktree / "src")) == 2_000_000_000
+
+    def test_head_mtime_skips_unreadable_git_file(self, tmp_path):
+        """Test a .git file without a gitdir line is skipped for the enclosing repository."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        os.utime(tmp_path / ".git" / "HEAD", ns=(3_000_000_000, 3_000_000_000))
+        (tmp_path / "inner").mkdir()
+        (tmp_path / "inner" / ".git").write_text("not a gitdir line\n")
+
+        assert _head_mtime_ns(str(tmp_path / "inner")) == 3_000_000_000
+
+    @staticmethod
+    def _parse(argv):
+        # Like issuedb-cli, pick the git command once the global options are removed.
+        global_parser = argparse.ArgumentParser(add_help=False)
+        global_parser.add_argument("--db")
+        global_parser.add_argument("--json", action="store_true")
+        _, extras = global_parser.parse_known_args(argv)
+
+        parser = argparse.ArgumentParser(parents=[global_parser])
+        subparsers = parser.add_subparsers(dest="command")
+        register_git_parsers(subparsers, extras)
+        return subparsers, parser.parse_args(argv)
+
+    def test_registers_only_invoked_command(self):
+        """Test only the git subparser named on the command line is built."""
+        subparsers, args = self._parse(["git-scan", "-n", "3"])
+
+        assert list(subparsers.choices) == ["git-scan"]
+        assert args.num_commits == 3
+        assert args.git_command == "git-scan"
+
+    def test_help_registers_all_commands(self):
+        """Test top-level help still lists every git command."""
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="command")
+        register_git_parsers(subparsers, ["--help"])
+
+        assert set(subparsers.choices) == {
+            "git-link",
+            "unlink",
+            "links",
+            "linked",
+            "git-scan",
+            "git-status",
+        }
+
+    def test_existing_command_not_overridden(self):
+        """Test a command name already owned by the main parser is left alone."""
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="command")
+        link_parser = subparsers.add_parser("link")
+        register_git_parsers(subparsers, ["link", "add", "1", "2", "related"])
+
+        assert subparsers.choices["link"] is link_parser
+        assert dispatch_git_command(argparse.Namespace(command="link")) is False
+
+    @pytest.mark.parametrize(
+        "ref_args,expected",
+        [
+            (["abc1234"], ("commit", "abc1234")),
+            (["feature/login"], ("branch", "feature/login")),
+            (["-b", "cafe123"], ("branch", "cafe123")),
+            (["-c", "HEAD"], ("commit", "HEAD")),
+        ],
+    )
+    def test_git_link_through_main(self, tmp_path, monkeypatch, capsys, ref_args, expected):
+        """Test that git-link accepts REF, --commit and --branch from the command line."""
+        db_path = str(tmp_path / "git.db")
+        issue = IssueRepository(db_path).create_issue(Issue(title="Linked"))
+        argv = ["issuedb-cli", "--db", db_path, "git-link", str(issue.id), *ref_args]
+        monkeypatch.setattr(sys, "argv", argv)
+        # main() picks the JSON layout from stdout; restore it after the test.
+        monkeypatch.setattr(cli_module, "_PRETTY_JSON", cli_module._PRETTY_JSON)
+
+        cli_module.main()
+
+        link_type, reference = expected
+        assert f"Linked issue {issue.id} to {link_type} {reference}" in capsys.readouterr().out
+        links = GitLinkRepository(db_path).get_links(issue.id)
+        assert [(link.link_type, link.reference) for link in links] == [expected]
+
+    def test_invalid_issue_id_rejected(self):
+        """Test a non-numeric issue ID is rejected by the parser."""
+        with pytest.raises(SystemExit):
+            self._parse(["links", "abc"])
+
+    @pytest.mark.parametrize(
+        "argv,expected",
+        [
+            (["git-link", "1", "abc1234"], ("abc1234", None)),
+            (["git-link", "1", "feature/login"], (None, "feature/login")),
+            (["git-link", "1", "-b", "cafe123"], (None, "cafe123")),
+            (["git-link", "1", "-c", "HEAD"], ("HEAD", None)),
+            (["linked", "main"], (None, "main")),
+        ],
+    )
+    def test_resolve_ref(self, argv, expected):
+        """Test REF detection and the explicit --commit/--branch overrides."""
+        _, args = self._parse(argv)
+        assert _resolve_ref(args) == expected
+
+    def test_resolve_ref_requires_exactly_one(self):
+        """Test REF, --commit and --branch cannot be combined or all omitted."""
+        _, args = self._parse(["unlink", "1"])
+        with pytest.raises(ValueError, match="exactly one"):
+            _resolve_ref(args)
+
+        _, args = self._parse(["unlink", "1", "main", "-c", "abc1234"])
+        with pytest.raises(ValueError, match="exactly one"):
+            _resolve_ref(args)
+
+    def test_dispatch_links(self, capsys):
+        """Test dispatching a git command prints the handler output."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            db_path = f.name
+        issue = IssueRepository(db_path).create_issue(Issue(title="Issue"))
+        GitLinkRepository(db_path).add_link(issue.id, "branch", "main")
+
+        _, args = self._parse(["--db", db_path, "links", str(issue.id)])
+
+        assert dispatch_git_command(args) is True
+        assert "Reference: main" in capsys.readouterr().out
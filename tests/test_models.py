@@ -1,11 +1,13 @@
 """Tests for data models."""
 
 import json
+import pickle
+import sys
 from datetime import datetime
 
 import pytest
 
-from issuedb.models import AuditLog, Issue, Priority, Status
+from issuedb.models import AuditLog, Issue, Priority, Status, Tag
 
 
 class TestPriority:
@@ -98,6 +100,36 @@ class TestIssue:
         assert result["created_at"] == now.isoformat()
         assert result["updated_at"] == now.isoformat()
 
+    def test_to_dict_native_datetimes(self):
+        """Test that to_dict can leave datetimes to the serializer."""
+        now = datetime.now()
+        issue = Issue(
+            id=1,
+            created_at=now,
+            updated_at=now,
+            due_date=now,
+            tags=[Tag(name="ui", created_at=now)],
+        )
+
+        result = issue.to_dict(iso_dates=False)
+
+        assert result["created_at"] is now
+        assert result["updated_at"] is now
+        assert result["due_date"] is now
+        assert result["tags"][0]["created_at"] is now
+        assert result["priority"] == "medium"
+
+    def test_to_brief_dict(self):
+        """Test the short dictionary form of an Issue."""
+        issue = Issue(id=1, title="Test Issue", priority=Priority.HIGH, status=Status.CLOSED)
+
+        assert issue.to_brief_dict() == {
+            "id": 1,
+            "title": "Test Issue",
+            "status": "closed",
+            "priority": "high",
+        }
+
     def test_from_dict(self):
         """Test creating Issue from dictionary."""
         now = datetime.now()
@@ -128,6 +160,15 @@ class TestIssue:
         assert issue.priority == Priority.MEDIUM
         assert issue.status == Status.OPEN
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10")
+    def test_issue_is_slotted(self):
+        """Test that issues carry no per-instance __dict__."""
+        issue = Issue(id=1, title="Test", tags=[Tag(name="bug")])
+
+        assert not hasattr(issue, "__dict__")
+        assert not hasattr(issue.tags[0], "__dict__")
+        assert pickle.loads(pickle.dumps(issue)) == issue
+
     def test_json_serialization(self):
         """Test that Issue can be serialized to JSON."""
         issue = Issue(
@@ -1,7 +1,10 @@
 """Tests for Ollama client."""
 
 import argparse
+import io
+import json
 
+from issuedb import ollama_client
 from issuedb.ollama_client import OllamaClient
 
 
@@ -24,6 +27,33 @@ class TestOllamaClient:
         assert client.model == "mistral"
         assert client.base_url == "http://192.168.1.1:8080"
 
+    def test_keep_alive_default_and_env(self, monkeypatch):
+        """Test that keep_alive comes from the argument, OLLAMA_KEEP_ALIVE or '30m'."""
+        monkeypatch.delenv("OLLAMA_KEEP_ALIVE", raising=False)
+        assert OllamaClient().keep_alive == "30m"
+        assert OllamaClient(keep_alive="-1").keep_alive == "-1"
+
+        monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "1h")
+        assert OllamaClient().keep_alive == "1h"
+
+    def test_generate_command_sends_keep_alive(self, monkeypatch):
+        """Test that the generate request asks the server to keep the model loaded."""
+        sent = {}
+
+        class FakeResponse(io.BytesIO):
+            status = 200
+
+        def fake_urlopen(req, timeout):
+            sent.update(json.loads(req.data))
+            return FakeResponse(json.dumps({"response": "issuedb-cli list"}).encode())
+
+        monkeypatch.setattr(ollama_client.request, "urlopen", fake_urlopen)
+        client = OllamaClient(keep_alive="10m")
+
+        assert client.generate_command("list issues", "prompt") == ("issuedb-cli list", None)
+        assert sent["keep_alive"] == "10m"
+        assert sent["model"] == client.model
+
     def test_extract_command_simple(self):
         """Test extracting simple command."""
         client = OllamaClient()
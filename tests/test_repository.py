@@ -59,6 +59,92 @@ class TestIssueRepository:
         assert retrieved.id == created.id
         assert retrieved.title == created.title
 
+    def test_get_issue_texts(self, repo, sample_issue):
+        """Test fetching only IDs, titles and descriptions."""
+        created = repo.create_issue(sample_issue)
+        other = repo.create_issue(Issue(title="No description"))
+
+        texts = repo.get_issue_texts()
+
+        assert sorted(texts) == [
+            (created.id, "Test Issue", "Test description"),
+            (other.id, "No description", None),
+        ]
+
+    def test_add_and_remove_issue_tags(self, repo, sample_issue):
+        """Test tagging an issue with several tags at once."""
+        created = repo.create_issue(sample_issue)
+        repo.create_tag("existing")
+        assert repo.add_issue_tag(created.id, "bug")
+
+        added = repo.add_issue_tags(created.id, ["ui", "bug", "existing", "ui"])
+
+        assert added == ["ui", "existing"]
+        assert [t.name for t in repo.get_issue_tags(created.id)] == ["bug", "existing", "ui"]
+        assert [t.name for t in repo.list_tags()] == ["bug", "existing", "ui"]
+
+        removed = repo.remove_issue_tags(created.id, ["ui", "missing", "bug"])
+
+        assert removed == ["ui", "bug"]
+        assert [t.name for t in repo.get_issue_tags(created.id)] == ["existing"]
+        assert not repo.remove_issue_tag(created.id, "ui")
+
+        actions = [
+            (log.action, log.old_value, log.new_value) for log in repo.get_audit_logs(created.id)
+        ]
+        assert ("TAG_ADD", None, "existing") in actions
+        assert ("TAG_REMOVE", "bug", None) in actions
+
+    def test_add_and_remove_issue_tags_batch_names(self, repo, sample_issue, monkeypatch):
+        """Test that more tag names than SQLite allows per statement are handled in batches."""
+        import sqlite3
+
+        from issuedb import repository as repository_module
+
+        monkeypatch.setattr(repository_module, "_MAX_SQL_VARIABLES", 3)
+        created = repo.create_issue(sample_issue)
+        with repo.db.get_connection() as conn:
+            if not hasattr(conn, "setlimit"):
+                pytest.skip("Connection.setlimit needs Python 3.11")
+            conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 3)
+        repo.create_tag("t01")
+        names = [f"t{n:02d}" for n in range(10)]
+
+        assert repo.add_issue_tags(created.id, names[:4]) == names[:4]
+        assert repo.add_issue_tags(created.id, names) == names[4:]
+        assert [t.name for t in repo.get_issue_tags(created.id)] == names
+
+        assert repo.remove_issue_tags(created.id, [*names[1:], "missing"]) == names[1:]
+        assert [t.name for t in repo.get_issue_tags(created.id)] == names[:1]
+
+    def test_add_issue_tags_audits_created_tags_like_create_tag(self, repo, sample_issue):
+        """Test tags created while tagging get the same audit entry as create_tag."""
+        created = repo.create_issue(sample_issue)
+        repo.create_tag("bug")
+        repo.add_issue_tags(created.id, ["ui"])
+
+        entries = {
+            json.loads(log.new_value)["name"]: json.loads(log.new_value)
+            for log in repo.get_audit_logs(0)
+            if log.action == "TAG_CREATE"
+        }
+
+        tags = {tag.name: tag for tag in repo.list_tags()}
+        assert set(entries) == {"bug", "ui"}
+        for name, entry in entries.items():
+            assert entry["id"] == tags[name].id
+            assert set(entry) == set(tags[name].to_dict())
+
+    def test_list_tag_names(self, repo):
+        """Test listing only tag names, alphabetically."""
+        assert repo.list_tag_names() == []
+
+        for name in ("ui", "bug", "docs"):
+            repo.create_tag(name)
+
+        assert repo.list_tag_names() == ["bug", "docs", "ui"]
+        assert repo.list_tag_names() == [t.name for t in repo.list_tags()]
+
     def test_get_issue_not_found(self, repo):
         """Test getting non-existent issue returns None."""
         result = repo.get_issue(999)
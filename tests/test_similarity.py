@@ -2,17 +2,25 @@
 
 import pytest
 
+from issuedb import similarity as similarity_module
 from issuedb.models import Issue, Priority, Status
 from issuedb.similarity import (
+    _build_candidate_index,
     _combine_issue_text,
     _jaccard_similarity,
+    _later_candidates,
     _levenshtein_distance,
     _normalize_text,
     _normalized_levenshtein_similarity,
+    _prepare_text,
+    _prepared_similarity,
+    _similarity_at_least,
+    _similarity_upper_bound,
     _tokenize,
     calculate_similarity,
     find_duplicate_groups,
     find_similar_issues,
+    find_similar_texts,
 )
 
 
@@ -91,6 +99,38 @@ class TestLevenshteinDistance:
         distance = _levenshtein_distance("kitten", "sitten")
         assert distance == 1
 
+    @pytest.mark.parametrize(
+        "s1,s2,expected",
+        [
+            ("kitten", "sitting", 3),
+            ("prefix shared tail", "prefix other tail", 5),
+            ("same", "same", 0),
+            ("abcabc", "abc", 3),
+            ("abc", "cabc", 1),
+            ("flaw", "lawn", 2),
+        ],
+    )
+    def test_levenshtein_with_common_prefix_and_suffix(self, s1, s2, expected):
+        """Test distances where shared prefixes and suffixes are trimmed first."""
+        assert _levenshtein_distance(s1, s2) == expected
+        assert _levenshtein_distance(s2, s1) == expected
+
+    @pytest.mark.parametrize(
+        "s1,s2",
+        [
+            ("", ""),
+            ("kitten", "sitting"),
+            ("flaw", "lawn"),
+            ("login page crash", "logout page crashes"),
+            ("same", "same"),
+        ],
+    )
+    def test_levenshtein_pure_python_fallback(self, s1, s2, monkeypatch):
+        """Test that the pure Python path agrees with the default one."""
+        expected = _levenshtein_distance(s1, s2)
+        monkeypatch.setattr(similarity_module, "_rapidfuzz_distance", None)
+        assert _levenshtein_distance(s1, s2) == expected
+
 
 class TestNormalizedLevenshteinSimilarity:
     """Test normalized Levenshtein similarity."""
@@ -263,6 +303,70 @@ class TestCalculateSimilarity:
 
         assert similarity1 == similarity2
 
+    def test_prepared_similarity_matches_calculate_similarity(self):
+        """Test that comparing prepared texts gives the same score."""
+        text1 = "Login fails when password contains special characters"
+        text2 = "Login is broken for passwords with special characters!"
+
+        prepared = _prepared_similarity(_prepare_text(text1), _prepare_text(text2))
+
+        assert prepared == calculate_similarity(text1, text2)
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.7, 0.9, 1.0])
+    def test_similarity_at_least_agrees_with_full_score(self, threshold):
+        """Test that early exits never change which pairs pass or their scores."""
+        texts = [
+            "Login fails",
+            "Login failed",
+            "Login fails when password contains special characters",
+            "Login is broken for passwords with special characters",
+            "Database connection timeout error in production",
+            "Database connection timeout in production environment",
+            "Memory leak in background worker pool",
+            "",
+        ]
+        for text1 in texts:
+            for text2 in texts:
+                prep1, prep2 = _prepare_text(text1), _prepare_text(text2)
+                full = _prepared_similarity(prep1, prep2)
+                expected = full if full >= threshold else None
+
+                assert _similarity_at_least(prep1, prep2, threshold) == expected
+
+    @pytest.mark.parametrize(
+        "text", ["", "   ", "Hello, World!", "tabs\tand\nnewlines  here", "a - b -- c", "ÄÖÜ ok"]
+    )
+    def test_prepare_text_matches_normalize_and_tokenize(self, text):
+        """Test that the single-split preparation equals normalizing then tokenizing."""
+        norm = _normalize_text(text)
+
+        assert _prepare_text(text) == (norm, frozenset(_tokenize(norm)))
+
+    def test_prepare_text_is_cached(self):
+        """Test that repeated texts reuse the prepared result."""
+        text = "Cached similarity preparation, checked twice"
+
+        assert _prepare_text(text) is _prepare_text(text)
+        assert _prepare_text(text)[1] == frozenset(
+            {"cached", "similarity", "preparation", "checked", "twice"}
+        )
+
+    @pytest.mark.parametrize(
+        "text1,text2",
+        [
+            ("bug", "a much longer bug report title"),
+            ("short", "shirt"),
+            ("Login fails with special characters", "Login fails with special characters"),
+            ("Database connection timeout error", "Memory leak in background worker pool"),
+            ("", "anything"),
+        ],
+    )
+    def test_upper_bound_never_below_similarity(self, text1, text2):
+        """Test that the length-based bound never rejects a real match."""
+        prep1, prep2 = _prepare_text(text1), _prepare_text(text2)
+
+        assert _similarity_upper_bound(prep1, prep2) >= _prepared_similarity(prep1, prep2) - 1e-9
+
 
 class TestCombineIssueText:
     """Test combining issue title and description."""
@@ -387,6 +491,16 @@ class TestFindSimilarIssues:
         results = find_similar_issues("test query", [], threshold=0.5)
         assert len(results) == 0
 
+    def test_find_similar_texts_matches_issues(self, sample_issues):
+        """Test that plain (key, title, description) entries score like issues."""
+        query = "Login bug with authentication"
+        entries = [(issue.id, issue.title, issue.description) for issue in sample_issues]
+
+        by_issue = find_similar_issues(query, sample_issues, threshold=0.2)
+        by_text = find_similar_texts(query, entries, threshold=0.2)
+
+        assert by_text == [(issue.id, score) for issue, score in by_issue]
+
 
 class TestFindDuplicateGroups:
     """Test finding duplicate groups."""
@@ -509,6 +623,91 @@ class TestFindDuplicateGroups:
                 assert issue.id not in seen_ids
                 seen_ids.add(issue.id)
 
+    def test_find_duplicate_groups_parallel_matches_sequential(self, duplicate_issues, monkeypatch):
+        """Test that scoring pairs in a process pool yields the same groups."""
+        monkeypatch.setattr(similarity_module, "_PARALLEL_MIN_ISSUES", 2)
+        monkeypatch.setattr(similarity_module, "_usable_cpu_count", lambda: 2)
+
+        sequential = find_duplicate_groups(duplicate_issues, threshold=0.5, workers=1)
+        parallel = find_duplicate_groups(duplicate_issues, threshold=0.5, workers=2)
+
+        assert [[(i.id, score) for i, score in group] for group in parallel] == [
+            [(i.id, score) for i, score in group] for group in sequential
+        ]
+
+    @pytest.mark.parametrize(
+        ("affinity", "workers", "expected"),
+        [
+            ({0}, None, None),
+            ({0}, 4, None),
+            ({0, 1, 2}, None, 3),
+            ({0, 1, 2}, 16, 3),
+            (set(range(64)), None, similarity_module._MAX_WORKERS),
+        ],
+    )
+    def test_find_duplicate_groups_workers_follow_affinity(
+        self, duplicate_issues, monkeypatch, affinity, workers, expected
+    ):
+        """Test the pool is sized by the CPUs this process may use, not the host's."""
+        monkeypatch.setattr(similarity_module, "_PARALLEL_MIN_ISSUES", 2)
+        monkeypatch.setattr(
+            similarity_module.os, "sched_getaffinity", lambda pid: affinity, raising=False
+        )
+        monkeypatch.setattr(similarity_module.os, "cpu_count", lambda: 64)
+        pool_sizes = []
+
+        def fake_parallel_matches(prepared, threshold, workers):
+            pool_sizes.append(workers)
+            return None
+
+        monkeypatch.setattr(similarity_module, "_parallel_matches", fake_parallel_matches)
+
+        find_duplicate_groups(duplicate_issues, threshold=0.5, workers=workers)
+
+        assert pool_sizes == ([] if expected is None else [expected])
+
+    def test_usable_cpu_count_without_affinity(self, monkeypatch):
+        """Test the CPU count is used where affinity is not available."""
+        monkeypatch.delattr(similarity_module.os, "sched_getaffinity", raising=False)
+        monkeypatch.setattr(similarity_module.os, "cpu_count", lambda: 6)
+
+        assert similarity_module._usable_cpu_count() == 6
+
+    @pytest.mark.parametrize("threshold", [0.2, 0.3, 0.31, 0.5, 0.7])
+    def test_candidate_index_keeps_every_match(self, threshold):
+        """Test that the inverted index only drops pairs below the threshold."""
+        texts = [
+            "login bug",
+            "loginbug",
+            "Login page crashes on submit",
+            "crash when submitting the login page",
+            "database connection pool exhausted",
+            "pool of database connections runs out",
+            "",
+            "",
+            "abcdefghijklmnopqrstuvwxyz",
+            "zyxwvutsrqponmlkjihgfedcba",
+        ]
+        prepared = [_prepare_text(text) for text in texts]
+        index = _build_candidate_index(prepared, threshold)
+
+        for i in range(len(prepared)):
+            candidates = set(_later_candidates(prepared, index, i))
+            for j in range(i + 1, len(prepared)):
+                if _similarity_at_least(prepared[i], prepared[j], threshold) is not None:
+                    assert j in candidates
+
+    def test_candidate_index_skips_long_texts_without_shared_words(self):
+        """Test that long texts sharing no word are not compared."""
+        prepared = [
+            _prepare_text("database connection pool exhausted"),
+            _prepare_text("user interface rendering glitch"),
+            _prepare_text("connection pool leak in database layer"),
+        ]
+
+        assert list(_later_candidates(prepared, _build_candidate_index(prepared, 0.7), 0)) == [2]
+        assert _build_candidate_index(prepared, 0.3) is None
+
     def test_find_duplicate_groups_consistent_ordering(self, duplicate_issues):
         """Test that groups are consistently ordered."""
         # Run multiple times
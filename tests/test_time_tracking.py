@@ -1,5 +1,6 @@
 """Tests for time tracking functionality."""
 
+import io
 import json
 import time
 
@@ -31,6 +32,22 @@ def sample_issue(repo):
     return repo.create_issue(issue)
 
 
+def _insert_time_entries(repo, issue_id):
+    """Insert two finished time entries and one running entry."""
+    with repo.db.get_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO time_entries (issue_id, started_at, ended_at, duration_seconds, note)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            [
+                (issue_id, "2024-05-01T09:00:00", "2024-05-01T09:10:00", 600, None),
+                (issue_id, "2024-05-01T10:00:00", "2024-05-01T11:30:00", 5400, "Review"),
+                (issue_id, "2024-05-01T12:00:00", None, None, None),
+            ],
+        )
+
+
 class TestTimerOperations:
     """Tests for timer start/stop operations."""
 
@@ -178,6 +195,16 @@ class TestTimeEntries:
         assert entries[0]["duration_seconds"] is None
         assert entries[0]["note"] == "Running work"
 
+    def test_get_time_entries_with_total(self, repo, sample_issue):
+        """Test that the total sums finished entries and ignores running ones."""
+        assert repo.get_time_entries_with_total(sample_issue.id) == ([], 0)
+
+        _insert_time_entries(repo, sample_issue.id)
+
+        entries, total = repo.get_time_entries_with_total(sample_issue.id)
+        assert entries == repo.get_time_entries(sample_issue.id)
+        assert total == 5400 + 600
+
 
 class TestEstimates:
     """Tests for time estimates."""
@@ -314,6 +341,20 @@ class TestTimeReports:
         assert report["period_label"] == "This Month"
         assert len(report["issues"]) == 1
 
+    def test_time_report_period_bounds(self, repo, sample_issue):
+        """Test that only finished entries inside the period are counted."""
+        other = repo.create_issue(Issue(title="Untracked"))
+        _insert_time_entries(repo, sample_issue.id)
+
+        report = repo.get_time_report(period="all")
+        assert [i["issue_id"] for i in report["issues"]] == [sample_issue.id]
+        assert report["issues"][0]["entry_count"] == 2
+        assert report["total_seconds"] == 6000
+        assert repo.get_time_report(period="all", issue_id=other.id)["issues"] == []
+
+        # The inserted entries are from 2024, long outside the last week
+        assert repo.get_time_report(period="week")["issues"] == []
+
     def test_time_report_invalid_period(self, repo):
         """Test time report with invalid period raises error."""
         with pytest.raises(ValueError, match="Period must be"):
@@ -450,6 +491,26 @@ class TestCLITimeLogCommand:
         assert "entries" in data
         assert len(data["entries"]) == 1
 
+    def test_cli_time_log_layout(self, cli):
+        """Test the exact text layout, returned and streamed."""
+        cli.create_issue(title="Test Issue")
+        _insert_time_entries(cli.repo, 1)
+        expected = (
+            "Time Log for Issue #1:\n"
+            "\n"
+            "  2024-05-01T12:00:00: 0h 0m [RUNNING]\n"
+            "  2024-05-01T10:00:00: 1h 30m - Review \n"
+            "  2024-05-01T09:00:00: 0h 10m \n"
+            "\n"
+            "Total: 1h 40m"
+        )
+
+        assert cli.time_log(issue_id=1) == expected
+
+        out = io.StringIO()
+        assert cli.time_log(issue_id=1, out=out) == ""
+        assert out.getvalue() == expected + "\n"
+
 
 class TestCLITimeReportCommand:
     """Tests for CLI time-report command."""
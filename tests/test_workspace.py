@@ -1,5 +1,7 @@
 """Tests for workspace functionality."""
 
+import shutil
+import subprocess
 import tempfile
 from datetime import datetime
 from time import sleep
@@ -180,6 +182,22 @@ class TestWorkspace:
         assert "recent_activity" in status
         assert isinstance(status["recent_activity"], list)
 
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+    def test_workspace_status_git_info(self, repo, tmp_path, monkeypatch):
+        """Test the branch and uncommitted file count read from git status."""
+        monkeypatch.chdir(tmp_path)
+        status = repo.get_workspace_status()
+        assert status["git_branch"] is None
+        assert status["uncommitted_files"] is None
+
+        subprocess.run(["git", "init", "-q", "-b", "feature"], check=True)
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+
+        status = repo.get_workspace_status()
+        assert status["git_branch"] == "feature"
+        assert status["uncommitted_files"] == 2
+
     def test_workspace_status_with_active_issue(self, repo, sample_issue):
         """Test workspace status with an active issue."""
         # Start issue
@@ -353,6 +371,7 @@ class TestWorkspaceCLI:
         active = cli.repo.get_active_issue()
         assert active is not None
         assert active[0].id == sample_issue.id
+        assert f"Started at: {active[1]:%Y-%m-%d %H:%M:%S}\n" in result + "\n"
 
     def test_start_issue_cli_json(self, cli, sample_issue):
         """Test start issue CLI command with JSON output."""